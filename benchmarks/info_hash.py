@@ -0,0 +1,48 @@
+"""Compare info-hash calculation of large torrent files.
+
+python -m benchmarks.info_hash
+"""
+
+import hashlib
+import os
+import timeit
+
+import pyben
+
+from pickpockett.torrent import info_hash
+
+
+def _torrent(n_files, n_pieces):
+    files = [
+        {"length": 2**30, "path": [f"Series S01E{i:03} 1080p.mkv"]}
+        for i in range(n_files)
+    ]
+    info = {
+        "files": files,
+        "name": "Series S01 1080p",
+        "piece length": 2**22,
+        "pieces": os.urandom(20 * n_pieces),
+    }
+    return pyben.dumps({"announce": "http://tracker/announce", "info": info})
+
+
+def _decode_encode(torrent):
+    info = pyben.loads(torrent)["info"]
+    return hashlib.sha1(pyben.dumps(info)).hexdigest()
+
+
+def main():
+    for n_files, n_pieces in ((10, 2_000), (100, 50_000), (1_000, 100_000)):
+        torrent = _torrent(n_files, n_pieces)
+        assert info_hash(torrent) == _decode_encode(torrent)
+
+        print(f"{len(torrent) / 2**20:.2f} MiB, {n_files} files")
+        for func in (_decode_encode, info_hash):
+            timer = timeit.Timer(lambda: func(torrent))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(3, number)) / number
+            print(f"  {func.__name__:>15}: {best * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
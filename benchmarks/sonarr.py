@@ -0,0 +1,108 @@
+"""Compare decoding of large Sonarr series and episode lists.
+
+python -m benchmarks.sonarr
+"""
+
+import json
+import timeit
+from typing import List
+
+from pydantic import TypeAdapter
+
+from pickpockett.configuration import SonarrConfig
+from pickpockett.sonarr import Episode, Series, Sonarr
+
+
+def _series(n_series):
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "title": f"Series {i}",
+                "sortTitle": f"series {i}",
+                "titleSlug": f"series-{i}",
+                "tvdbId": 100_000 + i,
+                "status": "continuing",
+                "overview": "Overview. " * 40,
+                "images": [
+                    {
+                        "coverType": cover_type,
+                        "url": f"/MediaCover/{i}/{cover_type}.jpg",
+                        "remoteUrl": f"https://artworks/{i}/{cover_type}.jpg",
+                    }
+                    for cover_type in ("banner", "poster", "fanart")
+                ],
+                "seasons": [
+                    {"seasonNumber": season, "monitored": True}
+                    for season in range(6)
+                ],
+                "statistics": {"seasonCount": 5, "episodeCount": 50},
+                "genres": ["Drama"],
+                "tags": [],
+            }
+            for i in range(n_series)
+        ]
+    ).encode()
+
+
+def _episodes(n_episodes):
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "seriesId": 1,
+                "seasonNumber": i // 500,
+                "episodeNumber": i % 500 + 1,
+                "title": f"Episode {i}",
+                "airDate": "2020-01-01",
+                "airDateUtc": "2020-01-01T21:00:00Z",
+                "overview": "Overview. " * 20,
+                "hasFile": i % 3 == 0,
+                "monitored": True,
+            }
+            for i in range(n_episodes)
+        ]
+    ).encode()
+
+
+def _series_python(sonarr, content):
+    series = {}
+    for obj in json.loads(content):
+        s = Series.model_validate(obj)
+        s._sonarr = sonarr
+        series[s.tvdb_id] = s
+    return series
+
+
+def _episodes_python(content):
+    return TypeAdapter(List[Episode]).validate_python(json.loads(content))
+
+
+def _best(func):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(3, number)) / number
+
+
+def main():
+    sonarr = Sonarr(SonarrConfig(url="http://localhost:8989", apikey=""))
+
+    series = _series(2_000)
+    print(f"{len(series) / 2**20:.2f} MiB, 2000 series")
+    for name, func in (
+        ("validate_python", lambda: _series_python(sonarr, series)),
+        ("validate_json", lambda: sonarr._series_map(series)),
+    ):
+        print(f"  {name:>15}: {_best(func) * 1000:8.3f} ms")
+
+    episodes = _episodes(50_000)
+    print(f"{len(episodes) / 2**20:.2f} MiB, 50000 episodes")
+    for name, func in (
+        ("validate_python", lambda: _episodes_python(episodes)),
+        ("validate_json", lambda: sonarr._episode_list(episodes)),
+    ):
+        print(f"  {name:>15}: {_best(func) * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,15 @@ from flask_sqlalchemy import SQLAlchemy
 
 from . import filters
 from .configuration import Config, ConfigManager
+from .store import ResponseStore
+from .torrent import TorrentCache
 
 bootstrap = Bootstrap5()
 config = ConfigManager()
 db = SQLAlchemy()
 migrate = Migrate()
+sonarr_store = ResponseStore()
+torrents = TorrentCache()
 
 
 class App(Flask):
@@ -40,6 +44,8 @@ class App(Flask):
 
         data_dir = Path(os.environ.get("DATA_DIR", os.getcwd()))
         config.path = data_dir / "config.json"
+        sonarr_store.path = data_dir / "sonarr"
+        torrents.path = data_dir / "torrents.json"
 
         db_uri = "sqlite:///" + str(data_dir / __name__) + ".db"
         self.config["SQLALCHEMY_DATABASE_URI"] = db_uri
@@ -57,6 +63,7 @@ class App(Flask):
         upgrade_process.join()
 
         scheduler.init_app(self)
+        scheduler.warm_up()
         scheduler.reschedule(config.load())
 
 
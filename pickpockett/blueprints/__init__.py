@@ -18,14 +18,3 @@ def before_request():
         else None
     )
     g.webhook = WebHook(g.config.webhook.url) if g.config.webhook else None
-
-
-@api.bp.after_request
-@ui.bp.after_request
-def after_request(response):
-    try:
-        g.flaresolverr.destroy()
-    except Exception:
-        pass
-
-    return response
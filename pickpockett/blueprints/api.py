@@ -1,6 +1,8 @@
-from flask import Blueprint, Response, request
+from flask import Blueprint, Response, g, request
+from pydantic import ValidationError
 
 from .. import torznab
+from ..sonarr import WebhookEvent
 
 bp = Blueprint("api", __name__, url_prefix="/api")
 
@@ -34,3 +36,15 @@ def api():
         return Response(torznab.error(203, "Function not available"))
     else:
         return Response(torznab.error(202, "No such function"))
+
+
+@bp.post("/sonarr")
+def sonarr():
+    try:
+        event = WebhookEvent.model_validate(request.get_json(force=True))
+    except ValidationError:
+        return Response(status=400)
+
+    if g.sonarr:
+        g.sonarr.handle_event(event)
+    return Response(status=204)
@@ -41,7 +41,7 @@ def add_source(tvdb_id):
         if err and not form.announcement.data:
             form.url.errors = [err]
         else:
-            Source.create(
+            source = Source.create(
                 tvdb_id=tvdb_id,
                 url=form.url.data,
                 season=form.season.data,
@@ -54,6 +54,8 @@ def add_source(tvdb_id):
                 announcement=form.announcement.data,
                 report_existing=form.report_existing.data,
             )
+            if magnet and magnet.url:
+                source.update_magnet(magnet)
             return redirect(url_for("ui.index.index"))
     elif series.season_count and (
         form.season.data is None or form.season.data > series.season_count
@@ -81,12 +83,11 @@ def add_smart():
             if user_agent := (magnet.user_agent or form.user_agent.data):
                 args["user_agent"] = user_agent
 
-            if (tag := magnet.page.find("title")) and (
-                lookup := sonarr.series_lookup(tag.text)
+            if (title := magnet.page.title) and (
+                lookup := sonarr.series_lookup(title)
             ):
                 if parsed := (
-                    sonarr.parse(tag.text)
-                    or sonarr.parse(tag.text, strip=True)
+                    sonarr.parse(title) or sonarr.parse(title, strip=True)
                 ):
                     if parsed.season_number > 0:
                         args["season"] = parsed.season_number
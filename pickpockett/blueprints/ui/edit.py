@@ -32,6 +32,8 @@ def edit(source_id):
             if form.url.data != source.url:
                 source.hash = ""
                 source.datetime = None
+                source.next_check = None
+                source.misses = 0
             cookies = {
                 key: value
                 for key, value in magnet.cookies.items()
@@ -49,6 +51,8 @@ def edit(source_id):
                 announcement=form.announcement.data,
                 report_existing=form.report_existing.data,
             )
+            if not source.hash and magnet and magnet.url:
+                source.update_magnet(magnet)
             return redirect(url_for("ui.index.index"))
     elif source.error:
         form.url.errors = [source.error]
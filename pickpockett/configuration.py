@@ -6,17 +6,30 @@ from pydantic import AnyHttpUrl, BaseModel
 
 class GeneralConfig(BaseModel):
     check_interval: int = 15
+    max_check_interval: int = 240
+    burst_polling: bool = True
+    burst_interval: int = 2
+    burst_window: int = 120
+    check_workers: int = 8
+    host_workers: int = 2
+    host_rate: int = 30
+    host_burst: int = 5
+    max_page_size: int = 4096
     user_agent: str = ""
 
 
 class FlareSolverrConfig(BaseModel):
     url: Union[AnyHttpUrl, Literal[""]]
     timeout: int = 60000
+    sessions: int = 1
 
 
 class SonarrConfig(BaseModel):
     url: AnyHttpUrl
     apikey: str
+    connect_timeout: int = 5
+    read_timeout: int = 30
+    episode_ttl: int = 60
 
 
 class WebHook(BaseModel):
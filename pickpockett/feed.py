@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import event
+
+from .models import ALL_SEASONS, Source
+
+
+@dataclass(frozen=True)
+class FeedEntry:
+    id: int
+    tvdb_id: int
+    season: int
+    url: str
+    hash: str
+    datetime: datetime
+    version: int
+    extra: str
+    schedule_correction: int
+    report_existing: bool
+
+    @classmethod
+    def from_source(cls, source: Source) -> Optional[FeedEntry]:
+        if not (source.hash and source.datetime):
+            return None
+
+        return cls(
+            id=source.id,
+            tvdb_id=source.tvdb_id,
+            season=source.season,
+            url=source.url,
+            hash=source.hash,
+            datetime=source.datetime,
+            version=source.version,
+            extra=source.extra,
+            schedule_correction=source.schedule_correction,
+            report_existing=source.report_existing,
+        )
+
+
+class Feed:
+    """Snapshot of checked sources served to Sonarr by the Torznab API.
+
+    The snapshot follows every insert, update and delete of a source,
+    so reading it never touches a tracker. It's also reloaded by the
+    scheduler every ``resync_interval`` to catch up with changes made
+    without the ORM.
+    """
+
+    resync_interval = timedelta(minutes=15)
+
+    def __init__(self):
+        self._entries: Optional[Dict[int, FeedEntry]] = None
+        self._loaded = datetime.min
+        self._lock = Lock()
+
+    def load(self, sources: Iterable[Source]):
+        entries = {}
+        for source in sources:
+            if entry := FeedEntry.from_source(source):
+                entries[entry.id] = entry
+        with self._lock:
+            self._entries = entries
+            self._loaded = datetime.utcnow()
+
+    def resync(self):
+        if datetime.utcnow() - self._loaded >= self.resync_interval:
+            self.load(Source.query)
+
+    def update(self, source: Source):
+        entry = FeedEntry.from_source(source)
+        with self._lock:
+            if self._entries is None:
+                return
+            if entry is None:
+                self._entries.pop(source.id, None)
+            else:
+                self._entries[entry.id] = entry
+
+    def discard(self, source_id: int):
+        with self._lock:
+            if self._entries is not None:
+                self._entries.pop(source_id, None)
+
+    def entries(
+        self, tvdb_id: Optional[int] = None, season: Optional[int] = None
+    ) -> List[FeedEntry]:
+        if self._entries is None:
+            self.load(Source.query)
+
+        with self._lock:
+            entries = list(self._entries.values())
+
+        if tvdb_id:
+            entries = [e for e in entries if e.tvdb_id == tvdb_id]
+            # season 0 holds the specials
+            if season is not None:
+                entries = [
+                    e for e in entries if e.season in (ALL_SEASONS, season)
+                ]
+
+        return entries
+
+
+feed = Feed()
+
+
+@event.listens_for(Source, "after_insert")
+@event.listens_for(Source, "after_update")
+def _update_feed(_mapper, _connection, source: Source):
+    feed.update(source)
+
+
+@event.listens_for(Source, "after_delete")
+def _discard_feed(_mapper, _connection, source: Source):
+    feed.discard(source.id)
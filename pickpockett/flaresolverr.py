@@ -1,31 +1,127 @@
-from datetime import datetime
-from typing import Any, Dict, List
-from urllib.parse import urljoin
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+from uuid import uuid4
 
 import requests
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+
+class FlareSolverrCookie(BaseModel):
+    name: str
+    value: str
+    expires: float = -1
 
 
 class FlareSolverrSolution(BaseModel):
-    cookies: Dict[str, Any]
+    cookie_list: List[FlareSolverrCookie] = Field(alias="cookies")
     response: str
     user_agent: str = Field(alias="userAgent")
 
-    @field_validator("cookies", mode="before")
-    @classmethod
-    def cookies_to_dict(cls, cookies: List[Dict[str, Any]]):
-        return {cookie["name"]: cookie["value"] for cookie in cookies}
+    @property
+    def cookies(self) -> Dict[str, str]:
+        return {cookie.name: cookie.value for cookie in self.cookie_list}
+
+    @property
+    def expires(self) -> Optional[datetime]:
+        expires = [c.expires for c in self.cookie_list if c.expires > 0]
+        if expires:
+            return datetime.utcfromtimestamp(min(expires))
 
 
 class FlareSolverrResponse(BaseModel):
     solution: FlareSolverrSolution
 
 
+@dataclass
+class Clearance:
+    cookies: Dict[str, str]
+    user_agent: str
+    expires: datetime
+
+
+class ClearanceCache:
+    """Cookies and user agent of the last solved challenge by domain."""
+
+    max_age = timedelta(minutes=30)
+
+    def __init__(self):
+        self._clearances: Dict[str, Clearance] = {}
+        self._lock = Lock()
+
+    def get(self, url) -> Optional[Clearance]:
+        domain = urlparse(url).netloc
+        with self._lock:
+            clearance = self._clearances.get(domain)
+            if clearance and clearance.expires <= datetime.utcnow():
+                del self._clearances[domain]
+                return None
+            return clearance
+
+    def put(self, url, solution: FlareSolverrSolution):
+        expires = datetime.utcnow() + self.max_age
+        if solution.expires:
+            expires = min(expires, solution.expires)
+        clearance = Clearance(solution.cookies, solution.user_agent, expires)
+        with self._lock:
+            self._clearances[urlparse(url).netloc] = clearance
+
+    def discard(self, url):
+        with self._lock:
+            self._clearances.pop(urlparse(url).netloc, None)
+
+
+@dataclass
+class _Session:
+    name: str
+    created: datetime
+
+
 class FlareSolverr:
+    max_session_age = timedelta(hours=1)
+    timeout_margin = 10
+
+    # browser sessions are kept between requests, idle ones by server url
+    idle_sessions: Dict[str, List[_Session]] = {}
+    sessions_lock = Lock()
+    clearances = ClearanceCache()
+
+    # solves are queued, in-flight ones by url and by domain
+    executor: Optional[ThreadPoolExecutor] = None
+    executor_sessions = 0
+    jobs: Dict[str, Future] = {}
+    domain_jobs: Dict[str, Future] = {}
+    jobs_lock = Lock()
+
     def __init__(self, flaresolverr_config):
         self.url = str(flaresolverr_config.url)
         self.timeout = flaresolverr_config.timeout
-        self._session = None
+
+        sessions = flaresolverr_config.sessions
+        with FlareSolverr.jobs_lock:
+            if FlareSolverr.executor_sessions != sessions:
+                if FlareSolverr.executor is not None:
+                    FlareSolverr.executor.shutdown(wait=False)
+                FlareSolverr.executor = ThreadPoolExecutor(
+                    sessions, thread_name_prefix="flaresolverr"
+                )
+                FlareSolverr.executor_sessions = sessions
+
+    @property
+    def request_timeout(self) -> float:
+        """Seconds to wait for FlareSolverr, which answers within its
+        own timeout in ms.
+        """
+        return self.timeout / 1000 + self.timeout_margin
+
+    @property
+    def solve_timeout(self) -> float:
+        # a solve may have to create a session first
+        return 2 * self.request_timeout
 
     def _post(self, data):
         headers = {"User-Agent": "PickPockett"}
@@ -33,38 +129,103 @@ class FlareSolverr:
             urljoin(self.url, "v1"),
             headers=headers,
             json=data,
+            timeout=self.request_timeout,
         )
         response.raise_for_status()
         return response.json()
 
-    @property
-    def session(self):
-        if self._session is None:
-            self._session = str(datetime.utcnow())
-            data = {
-                "cmd": "sessions.create",
-                "maxTimeout": self.timeout,
-                "session": self._session,
-            }
+    def _expired(self, session: _Session):
+        return datetime.utcnow() - session.created > self.max_session_age
+
+    def _create(self) -> _Session:
+        session = _Session(str(uuid4()), datetime.utcnow())
+        data = {
+            "cmd": "sessions.create",
+            "maxTimeout": self.timeout,
+            "session": session.name,
+        }
+        self._post(data)
+        return session
+
+    def _destroy(self, session: _Session):
+        data = {"cmd": "sessions.destroy", "session": session.name}
+        try:
             self._post(data)
-        return self._session
+        except Exception:
+            pass
+
+    def _acquire(self) -> _Session:
+        while True:
+            with self.sessions_lock:
+                idle = self.idle_sessions.setdefault(self.url, [])
+                session = idle.pop() if idle else None
+            if session is None:
+                return self._create()
+            if not self._expired(session):
+                return session
+            self._destroy(session)
+
+    def _release(self, session: _Session):
+        if self._expired(session):
+            self._destroy(session)
+        else:
+            with self.sessions_lock:
+                self.idle_sessions.setdefault(self.url, []).append(session)
+
+    @contextmanager
+    def session(self):
+        """Lends an idle browser session, a failed one is destroyed."""
+        session = self._acquire()
+        try:
+            yield session.name
+        except Exception:
+            self._destroy(session)
+            raise
+        self._release(session)
 
     def solve(self, url, cookies=None) -> FlareSolverrResponse:
         cookies = cookies or {}
         req_cookies = [
             {"name": key, "value": value} for key, value in cookies.items()
         ]
-        data = {
-            "cmd": "request.get",
-            "cookies": req_cookies,
-            "session": self.session,
-            "url": url,
-        }
+        with self.session() as session:
+            data = {
+                "cmd": "request.get",
+                "cookies": req_cookies,
+                "session": session,
+                "url": url,
+            }
+            response = FlareSolverrResponse.model_validate(self._post(data))
 
-        response = self._post(data)
-        return FlareSolverrResponse.model_validate(response)
+        self.clearances.put(url, response.solution)
+        return response
 
-    def destroy(self):
-        if self._session is not None:
-            data = {"cmd": "sessions.destroy", "session": self._session}
-            self._post(data)
+    def submit(self, url, cookies=None, wait=True) -> Future:
+        """Queues a solve of the url.
+
+        A solve already queued for the url is shared. With ``wait``,
+        a url of a domain being solved waits for that solve instead and
+        gets None, its challenge is then expected to be cleared.
+        """
+        domain = urlparse(url).netloc
+        with self.jobs_lock:
+            if (future := self.jobs.get(url)) is not None:
+                return future
+
+            if wait and (solving := self.domain_jobs.get(domain)):
+                cleared = Future()
+                solving.add_done_callback(lambda _: cleared.set_result(None))
+                return cleared
+
+            future = self.executor.submit(self.solve, url, cookies)
+            self.jobs[url] = self.domain_jobs[domain] = future
+
+        future.add_done_callback(lambda _: self._done(url, domain, future))
+        return future
+
+    def _done(self, url, domain, future: Future):
+        with self.jobs_lock:
+            if self.jobs.get(url) is future:
+                del self.jobs[url]
+            if self.domain_jobs.get(domain) is future:
+                del self.domain_jobs[domain]
@@ -1,6 +1,12 @@
 from flask_wtf import FlaskForm
 from markupsafe import escape
-from wtforms import FormField, IntegerField, SubmitField, validators
+from wtforms import (
+    BooleanField,
+    FormField,
+    IntegerField,
+    SubmitField,
+    validators,
+)
 from wtforms.widgets import NumberInput
 
 from .fields import StringField, URLField
@@ -11,6 +17,62 @@ class GeneralConfigForm(FlaskForm):
     check_interval = IntegerField(
         "Check interval (min)", [validators.number_range(min=1)]
     )
+    max_check_interval = IntegerField(
+        "Max check interval (min)",
+        [validators.number_range(min=1)],
+        default=240,
+        description="Unchanged and completed sources are checked less often,"
+        " down to this interval",
+    )
+    burst_polling = BooleanField(
+        "Burst polling",
+        default=True,
+        description="Check a source often right after an episode is expected"
+        " to appear on it",
+    )
+    burst_interval = IntegerField(
+        "Burst check interval (min)",
+        [validators.number_range(min=1)],
+        default=2,
+    )
+    burst_window = IntegerField(
+        "Burst window (min)",
+        [validators.number_range(min=1)],
+        default=120,
+        description="How long a source is checked often after an episode"
+        " is expected",
+    )
+    check_workers = IntegerField(
+        "Parallel checks",
+        [validators.number_range(min=1)],
+        default=8,
+        description="How many sources are checked at the same time",
+    )
+    host_workers = IntegerField(
+        "Parallel checks per host",
+        [validators.number_range(min=1)],
+        default=2,
+        description="How many pages are fetched from one tracker at a time",
+    )
+    host_rate = IntegerField(
+        "Requests per host (per min)",
+        [validators.number_range(min=1)],
+        default=30,
+        description="How many requests are sent to one tracker per minute"
+        " on average",
+    )
+    host_burst = IntegerField(
+        "Request burst per host",
+        [validators.number_range(min=1)],
+        default=5,
+        description="How many requests can be sent to one tracker at once",
+    )
+    max_page_size = IntegerField(
+        "Max page size (KiB)",
+        [validators.number_range(min=1)],
+        default=4096,
+        description="Reading a page stops at this size",
+    )
     user_agent = StringField(
         "Default User Agent", required=True, widget=UserAgentInput()
     )
@@ -23,11 +85,29 @@ class FlareSolverrForm(FlaskForm):
         [validators.number_range(min=0)],
         widget=NumberInput(step=1000),
     )
+    sessions = IntegerField(
+        "Sessions",
+        [validators.number_range(min=1)],
+        default=1,
+        description="How many challenges are solved at the same time",
+    )
 
 
 class SonarrConfigForm(FlaskForm):
     url = URLField("URL", required=True)
     apikey = StringField("API Key", required=True)
+    connect_timeout = IntegerField(
+        "Connect timeout (s)", [validators.number_range(min=1)], default=5
+    )
+    read_timeout = IntegerField(
+        "Read timeout (s)", [validators.number_range(min=1)], default=30
+    )
+    episode_ttl = IntegerField(
+        "Episode cache (min)",
+        [validators.number_range(min=1)],
+        default=60,
+        description="How long episode lists are kept before a refetch",
+    )
 
 
 class WebhookConfigForm(FlaskForm):
@@ -1,12 +1,11 @@
-import hashlib
 import logging
 import re
 from typing import Dict, List, Optional, TYPE_CHECKING, Tuple, cast
 from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
 
-import pyben
-
-from .page import ParseError, get_torrent, parse
+from . import torrents
+from .page import NotModified, ParseError, Validators, get_torrent, parse
+from .torrent import TorrentMeta
 
 if TYPE_CHECKING:
     from .models import Source
@@ -16,11 +15,21 @@ logger = logging.getLogger(__name__)
 
 
 class Magnet:
-    def __init__(self, url, page=None, cookies=None, user_agent=""):
+    def __init__(
+        self,
+        url,
+        page=None,
+        cookies=None,
+        user_agent="",
+        validators: Optional[Validators] = None,
+        modified=True,
+    ):
         self.url = url
         self.page = page
         self.cookies = cookies or {}
         self.user_agent = user_agent
+        self.validators = validators
+        self.modified = modified
         self._hash = None
 
         _ = self.hash  # Trigger hash calculation on initialization
@@ -46,31 +55,62 @@ def _make_query(params):
     return urlencode(params, doseq=True, safe=":/")
 
 
-def _find_magnet_link(url, cookies, user_agent) -> Optional[Magnet]:
-    page, page_cookies, user_agent = parse(url, cookies, user_agent)
+def _get_torrent_meta(url, cookies, user_agent) -> Optional[TorrentMeta]:
+    cached = torrents.get(url)
+    try:
+        torrent, validators = get_torrent(
+            url, cookies, user_agent, cached and cached.validators
+        )
+    except NotModified:
+        return cached
+
+    if not torrent:
+        return None
+
+    if cached and cached.digest == validators.digest:
+        meta = cached.model_copy(
+            update={
+                "etag": validators.etag,
+                "last_modified": validators.last_modified,
+            }
+        )
+    else:
+        meta = TorrentMeta.from_torrent(torrent, validators)
+    torrents.put(url, meta)
+    return meta
+
+
+def _find_magnet_link(
+    url, cookies, user_agent, validators=None
+) -> Optional[Magnet]:
+    try:
+        page, page_cookies, user_agent, validators = parse(
+            url, cookies, user_agent, validators
+        )
+    except NotModified as e:
+        if (cookies or e.user_agent) and e.cookies:
+            cookies = e.cookies
+        return Magnet(None, None, cookies, e.user_agent, modified=False)
+
     if (cookies or user_agent) and page_cookies:
         cookies = page_cookies
 
-    if tag := page.find("a", href=re.compile("^magnet:")):
-        return Magnet(tag["href"], page, cookies, user_agent)
+    if page.magnet:
+        return Magnet(page.magnet, page, cookies, user_agent, validators)
 
-    elif download_url := page.find(
-        "a", href=re.compile(r"^(?!#).*(download|dl\.php)")
-    ):
-        download_url = urljoin(url, download_url["href"])
+    elif page.download:
+        download_url = urljoin(url, page.download)
         try:
-            torrent = get_torrent(download_url, cookies, user_agent)
+            meta = _get_torrent_meta(download_url, cookies, user_agent)
         except Exception as e:
             logger.error(e)
         else:
-            if torrent:
-                meta = pyben.loads(torrent)
-                info = meta["info"]
-                sha = hashlib.sha1(pyben.dumps(info))
-                magnet_hash = sha.hexdigest()
-                params = {"xt": [f"urn:btih:{magnet_hash}"]}
+            if meta:
+                params = {"xt": [f"urn:btih:{meta.info_hash}"]}
                 query = _make_query(params)
                 magnet_link = urlunparse(["magnet", "", "", "", query, ""])
+                # an unchanged page doesn't mean an unchanged torrent file,
+                # so validators of the page are not kept
                 return Magnet(magnet_link, page, cookies, user_agent)
 
     return Magnet(None, page, cookies, user_agent)
@@ -86,20 +126,32 @@ def _hash_from_magnet(magnet_url):
     return infohash
 
 
-def get_magnet(url, cookies, user_agent) -> Tuple[Optional[Magnet], str]:
+def get_magnet(
+    url, cookies, user_agent, validators=None
+) -> Tuple[Optional[Magnet], str]:
     try:
-        magnet = _find_magnet_link(url, cookies, user_agent)
+        magnet = _find_magnet_link(url, cookies, user_agent, validators)
     except ParseError as e:
         return None, repr(e)
 
+    if not magnet.modified:
+        return magnet, None
+
     error = "No magnet link found" if magnet.url is None else None
 
     return magnet, error
 
 
-def update_magnet(source: "Source", webhook: Optional["WebHook"]):
-    source.refresh()
-    magnet, err = get_magnet(source.url, source.cookies, source.user_agent)
+def save_magnet(
+    source: "Source",
+    magnet: Optional[Magnet],
+    err: Optional[str],
+    webhook: Optional["WebHook"],
+):
+    if magnet and not magnet.modified:
+        # the page hasn't changed since the last successful check
+        source.update_session(magnet)
+        return True
 
     if (magnet is None or magnet.url is None) and source.announcement:
         return False
@@ -16,6 +16,7 @@ from sqlalchemy import (
 
 from . import db
 from .magnet import Magnet
+from .page import Validators
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,11 @@ class Source(db.Model):
     version = Column(Integer, nullable=False, server_default="0")
     announcement = Column(Boolean, nullable=False, server_default="0")
     report_existing = Column(Boolean, nullable=False, server_default="0")
+    etag = Column(Text, nullable=False, server_default="")
+    last_modified = Column(Text, nullable=False, server_default="")
+    digest = Column(String(40), nullable=False, server_default="")
+    next_check = Column(DateTime)
+    misses = Column(Integer, nullable=False, server_default="0")
 
     @classmethod
     def get(cls, ident) -> Source:
@@ -70,6 +76,11 @@ class Source(db.Model):
     def extra(self):
         return ", ".join(e for e in (self.language, self.quality) if e)
 
+    @property
+    def validators(self):
+        if self.hash:
+            return Validators(self.etag, self.last_modified, self.digest)
+
     def update_cookies(self, new):
         if self.cookies and new:
             db.session.execute(
@@ -81,7 +92,7 @@ class Source(db.Model):
             self.cookies = new
             self.error = ""
 
-    def update_magnet(self, magnet: Magnet):
+    def _update_session(self, magnet: Magnet):
         cookies = {
             key: value
             for key, value in magnet.cookies.items()
@@ -90,6 +101,14 @@ class Source(db.Model):
         self.update_cookies(cookies)
         if magnet.user_agent:
             self.user_agent = magnet.user_agent
+
+    def update_session(self, magnet: Magnet):
+        self._update_session(magnet)
+        self.error = ""
+        db.session.commit()
+
+    def update_magnet(self, magnet: Magnet):
+        self._update_session(magnet)
         if self.hash != magnet.hash:
             logger.info(
                 "[tbdbid:%i]: hash update: %r => %r",
@@ -101,6 +120,10 @@ class Source(db.Model):
             self.datetime = datetime.utcnow()
             self.version += 1
             self.announcement = False
+        validators = magnet.validators or Validators()
+        self.etag = validators.etag
+        self.last_modified = validators.last_modified
+        self.digest = validators.digest
         db.session.commit()
 
     def update_error(self, err):
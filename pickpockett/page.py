@@ -1,8 +1,22 @@
+import codecs
+import hashlib
 import logging
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from html.parser import HTMLParser
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
 from flask import g
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .ratelimit import RateLimited, limiter, retry_after
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +25,36 @@ class ParseError(Exception):
     pass
 
 
+class NotModified(Exception):
+    def __init__(self, cookies=None, user_agent=""):
+        super().__init__()
+        # the session of an unchanged page still has to be kept
+        self.cookies = cookies or {}
+        self.user_agent = user_agent
+
+
+@dataclass
+class Validators:
+    etag: str = ""
+    last_modified: str = ""
+    digest: str = ""
+
+    @classmethod
+    def from_response(cls, response: requests.Response):
+        return cls(
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+        )
+
+    def headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
 HEADERS = {
     "Accept": (
         "text/html,application/xhtml+xml,application/xml;"
@@ -25,6 +69,115 @@ HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+CHUNK_SIZE = 16 * 1024
+POOL_SIZE = 4
+# 429 and 503 with their Retry-After are left to the host rate limiter
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = Lock()
+
+
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie, request):
+        return False
+
+
+def _session(url) -> requests.Session:
+    host = urlparse(url).netloc
+    with _sessions_lock:
+        if (session := _sessions.get(host)) is None:
+            session = _sessions[host] = requests.Session()
+            # cookies belong to a source and are passed with every request
+            session.cookies.set_policy(_NoCookiesPolicy())
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=RETRY
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+    return session
+
+
+MAGNET_HREF = re.compile("^magnet:")
+DOWNLOAD_HREF = re.compile(r"^(?!#).*(download|dl\.php)")
+
+
+class _MagnetFound(Exception):
+    pass
+
+
+class AnchorScanner(HTMLParser):
+    """Finds the first magnet link and the first download link of a page
+    without building a document tree. Scanning stops at the magnet link.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.magnet: Optional[str] = None
+        self.download: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a" or not (href := dict(attrs).get("href")):
+            return
+
+        if MAGNET_HREF.search(href):
+            self.magnet = href
+            raise _MagnetFound
+        if self.download is None and DOWNLOAD_HREF.search(href):
+            self.download = href
+
+    def feed(self, data):
+        if self.magnet is None:
+            try:
+                super().feed(data)
+            except _MagnetFound:
+                pass
+
+
+class Page:
+    def __init__(self, text: str = ""):
+        self._chunks: List[str] = []
+        self._scanner = AnchorScanner()
+        self._sha1 = hashlib.sha1()
+        self.feed(text)
+
+    def feed(self, chunk: str):
+        self._chunks.append(chunk)
+        self._scanner.feed(chunk)
+        self._sha1.update(chunk.encode())
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    @property
+    def magnet(self) -> Optional[str]:
+        return self._scanner.magnet
+
+    @property
+    def download(self) -> Optional[str]:
+        return self._scanner.download
+
+    @property
+    def digest(self) -> str:
+        return self._sha1.hexdigest()
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        return BeautifulSoup(self.text, "html.parser")
+
+    @property
+    def title(self) -> Optional[str]:
+        if tag := self.soup.find("title"):
+            return tag.text
+
 
 def _prep_headers(url, user_agent):
     conf = g.config
@@ -41,31 +194,125 @@ def _prep_headers(url, user_agent):
     return headers
 
 
-def _get_page(url, cookies, user_agent):
+def _with_clearance(url, cookies, user_agent):
+    """Adds the cookies of a challenge solved earlier for the domain,
+    they're only valid with the user agent that solved it.
+    They replace an older clearance stored with the source.
+    """
+    if g.flaresolverr and (clearance := g.flaresolverr.clearances.get(url)):
+        cookies = {**(cookies or {}), **clearance.cookies}
+        return cookies, clearance.user_agent, True
+    return cookies, user_agent, False
+
+
+def _throttle(url):
+    conf = g.config.general
+    limiter.acquire(url, conf.host_rate, conf.host_burst)
+
+
+def _slow_down(url, response: requests.Response):
+    if response.status_code in (429, 503):
+        seconds = retry_after(response.headers.get("Retry-After"))
+        logger.warning("slowing down for %.0f s: %s", seconds, url)
+        limiter.pause(url, seconds)
+
+
+def _decoder(response: requests.Response):
+    try:
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")
+    return decoder(errors="replace")
+
+
+def _read_page(response: requests.Response, max_size: int) -> Page:
+    page = Page()
+    decoder = _decoder(response)
+    size = 0
+    for chunk in response.iter_content(CHUNK_SIZE):
+        page.feed(decoder.decode(chunk))
+        # the rest of the page isn't needed once a magnet link is found
+        if page.magnet:
+            break
+
+        size += len(chunk)
+        if size >= max_size:
+            logger.warning(
+                "page is larger than %i bytes: %s", max_size, response.url
+            )
+            break
+    else:
+        page.feed(decoder.decode(b"", final=True))
+
+    return page
+
+
+def _get_page(url, cookies, user_agent, validators=None, wait=True):
+    conf = g.config
+    request_args = url, cookies, user_agent, validators
+    cookies, user_agent, cleared = _with_clearance(url, cookies, user_agent)
     headers = _prep_headers(url, user_agent)
-    response = requests.get(url, cookies=cookies, headers=headers, timeout=5)
-    cookies = {
-        key: value
-        for key, value in response.cookies.iteritems()
-        if key in cookies or not cookies
-    }
-    if 400 <= response.status_code < 500 and g.flaresolverr:
-        try:
-            solution = g.flaresolverr.solve(url, cookies).solution
-        except Exception as e:
-            logger.error(e)
-        else:
-            logger.info("challenge solved: %s", url)
-            cookies.update(solution.cookies)
-            return solution.response, cookies, solution.user_agent
+    if validators:
+        headers.update(validators.headers())
+    _throttle(url)
+    with _session(url).get(
+        url, cookies=cookies, headers=headers, timeout=5, stream=True
+    ) as response:
+        cookies = {
+            key: value
+            for key, value in response.cookies.iteritems()
+            if key in cookies or not cookies
+        }
+        if response.status_code == 304:
+            raise NotModified(cookies, user_agent if cleared else "")
+        _slow_down(url, response)
+        if (
+            400 <= response.status_code < 500
+            and response.status_code != 429
+            and g.flaresolverr
+        ):
+            if cleared:
+                g.flaresolverr.clearances.discard(url)
+            try:
+                solved = g.flaresolverr.submit(url, cookies, wait).result(
+                    g.flaresolverr.solve_timeout
+                )
+            except TimeoutError:
+                logger.error("challenge not solved in time: %s", url)
+            except Exception as e:
+                logger.error(e)
+            else:
+                if solved is None:
+                    # the challenge of the domain was solved meanwhile
+                    response.close()
+                    return _get_page(*request_args, wait=False)
+
+                logger.info("challenge solved: %s", url)
+                cookies.update(solved.solution.cookies)
+                return (
+                    Page(solved.solution.response),
+                    cookies,
+                    solved.solution.user_agent,
+                    Validators(),
+                )
 
-    response.raise_for_status()
-    return response.text, cookies, ""
+        response.raise_for_status()
+        page = _read_page(response, conf.general.max_page_size * 1024)
+        return (
+            page,
+            cookies,
+            user_agent if cleared else "",
+            Validators.from_response(response),
+        )
 
 
-def parse(url, cookies, user_agent):
+def parse(url, cookies, user_agent, validators=None):
     try:
-        text, cookies, user_agent = _get_page(url, cookies, user_agent)
+        page, cookies, user_agent, page_validators = _get_page(
+            url, cookies, user_agent, validators
+        )
+    except NotModified:
+        raise
     except requests.HTTPError as e:
         logger.error(e)
         if e.response is not None:
@@ -82,6 +329,9 @@ def parse(url, cookies, user_agent):
     except requests.RequestException as e:
         logger.error(e)
         raise ParseError("Request Error")
+    except RateLimited as e:
+        logger.warning(e)
+        raise ParseError("Rate limited")
     except ValueError as e:
         logger.error(e)
         raise ParseError("Cookies parse error")
@@ -89,12 +339,27 @@ def parse(url, cookies, user_agent):
         logger.error(e)
         raise ParseError("Unknown Error")
 
-    bs = BeautifulSoup(text, "html.parser")
-    return bs, cookies, user_agent
+    page_validators.digest = page.digest
+    if validators and validators.digest == page_validators.digest:
+        raise NotModified(cookies, user_agent)
+
+    return page, cookies, user_agent, page_validators
 
 
-def get_torrent(url, cookies, user_agent):
+def get_torrent(url, cookies, user_agent, validators=None):
+    cookies, user_agent, _ = _with_clearance(url, cookies, user_agent)
     headers = _prep_headers(url, user_agent)
-    response = requests.get(url, cookies=cookies, headers=headers, timeout=5)
+    if validators:
+        headers.update(validators.headers())
+    _throttle(url)
+    response = _session(url).get(
+        url, cookies=cookies, headers=headers, timeout=5
+    )
+    if response.status_code == 304:
+        raise NotModified
+    _slow_down(url, response)
     if response.headers.get("content-type") == "application/x-bittorrent":
-        return response.content
+        validators = Validators.from_response(response)
+        validators.digest = hashlib.sha1(response.content).hexdigest()
+        return response.content, validators
+    return None, None
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import heapq
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from .configuration import GeneralConfig
+from .models import Source
+from .sonarr import EpisodeIndex
+
+# the exponent of the backoff, larger ones only overflow the ceiling
+MAX_BACKOFF = 16
+
+
+def check_delay(
+    conf: GeneralConfig, misses: int, completed: bool = False
+) -> timedelta:
+    """Time to the next check of a source after ``misses`` checks in a row
+    didn't find a new magnet link.
+
+    It doubles with every miss from the check interval up to the max check
+    interval, a completed source waits for the max check interval.
+    """
+    floor = timedelta(minutes=conf.check_interval)
+    ceiling = max(floor, timedelta(minutes=conf.max_check_interval))
+    if completed:
+        return ceiling
+    return min(floor * 2 ** min(misses, MAX_BACKOFF), ceiling)
+
+
+def next_release(
+    conf: GeneralConfig,
+    source: Source,
+    episodes: EpisodeIndex,
+    now: datetime,
+) -> Optional[datetime]:
+    """When the next missing episode is expected to appear on the source.
+
+    Episodes whose burst window is over, or that were expected before
+    the last magnet link update, aren't waited for any more.
+    """
+    correction = timedelta(days=source.schedule_correction)
+    after = now - timedelta(minutes=conf.burst_window)
+    if source.datetime:
+        after = max(after, source.datetime)
+    if episode := episodes.next_missing(source.season, after - correction):
+        return episode.air_date_utc + correction
+
+
+def burst_check(
+    conf: GeneralConfig,
+    next_check: datetime,
+    release: Optional[datetime],
+    now: datetime,
+) -> datetime:
+    """Brings the next check forward to the start of a release, and to
+    the burst interval while within its burst window.
+    """
+    if release is None:
+        return next_check
+    if release <= now:
+        return min(next_check, now + timedelta(minutes=conf.burst_interval))
+    return min(next_check, release)
+
+
+class CheckQueue:
+    """Sources ordered by the time of their next check.
+
+    The queue follows every insert, update and delete of a source,
+    a source that has never been checked is due at once.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int]] = []
+        self._scheduled: Optional[Dict[int, datetime]] = None
+        self._lock = Lock()
+
+    def _push(self, source_id: int, next_check: Optional[datetime]):
+        next_check = next_check or datetime.min
+        if self._scheduled.get(source_id) != next_check:
+            self._scheduled[source_id] = next_check
+            heapq.heappush(self._heap, (next_check, source_id))
+
+    def load(self, sources):
+        with self._lock:
+            self._heap = []
+            self._scheduled = {}
+            for source in sources:
+                self._push(source.id, source.next_check)
+
+    def update(self, source: Source):
+        with self._lock:
+            if self._scheduled is not None:
+                self._push(source.id, source.next_check)
+
+    def discard(self, source_id: int):
+        with self._lock:
+            if self._scheduled is not None:
+                self._scheduled.pop(source_id, None)
+
+    def limit(self, latest: datetime):
+        """Moves checks scheduled after ``latest`` to ``latest``."""
+        with self._lock:
+            if self._scheduled is None:
+                return
+            for source_id, next_check in self._scheduled.items():
+                if next_check > latest:
+                    self._scheduled[source_id] = latest
+                    heapq.heappush(self._heap, (latest, source_id))
+
+    def retry(self, source_ids: Iterable[int], when: datetime):
+        """Puts back due sources that weren't rescheduled."""
+        with self._lock:
+            if self._scheduled is None:
+                return
+            for source_id in source_ids:
+                if source_id not in self._scheduled:
+                    self._push(source_id, when)
+
+    def due(self, now: datetime) -> List[int]:
+        """Pops the ids of the sources due to be checked by ``now``."""
+        if self._scheduled is None:
+            self.load(Source.query)
+
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                next_check, source_id = heapq.heappop(self._heap)
+                # outdated entries of rescheduled and deleted sources
+                if self._scheduled.get(source_id) == next_check:
+                    del self._scheduled[source_id]
+                    due.append(source_id)
+        return due
+
+
+check_queue = CheckQueue()
+
+
+@event.listens_for(Source, "after_insert")
+@event.listens_for(Source, "after_update")
+def _update_queue(_mapper, _connection, source: Source):
+    check_queue.update(source)
+
+
+@event.listens_for(Source, "after_delete")
+def _discard_queue(_mapper, _connection, source: Source):
+    check_queue.discard(source.id)
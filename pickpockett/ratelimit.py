@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# a pause for responses that ask to slow down without telling for how long
+DEFAULT_PAUSE = 60
+
+
+class RateLimited(Exception):
+    pass
+
+
+def retry_after(value: Optional[str]) -> float:
+    """Seconds to wait by a Retry-After header value."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        until = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PAUSE
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    return max(0.0, (until - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
+    paused_until: float = 0
+
+
+class HostRateLimiter:
+    """Token bucket per host shared by all requests to trackers.
+
+    A host gets ``rate`` requests per minute on average and up to ``burst``
+    requests at once. A request that would wait longer than ``max_wait``
+    seconds fails with RateLimited instead.
+    """
+
+    max_wait = 60
+
+    def __init__(self):
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = Lock()
+
+    def _bucket(self, host, burst, now) -> _Bucket:
+        if (bucket := self._buckets.get(host)) is None:
+            bucket = self._buckets[host] = _Bucket(burst, now)
+        return bucket
+
+    def _reserve(self, host, rate, burst) -> float:
+        now = monotonic()
+        per_second = rate / 60
+        with self._lock:
+            bucket = self._bucket(host, burst, now)
+            bucket.tokens = min(
+                burst, bucket.tokens + (now - bucket.updated) * per_second
+            )
+            bucket.updated = now
+
+            wait = max(
+                (1 - bucket.tokens) / per_second,
+                bucket.paused_until - now,
+                0,
+            )
+            if wait > self.max_wait:
+                raise RateLimited(f"{host}: rate limited for {wait:.0f} s")
+            bucket.tokens -= 1
+        return wait
+
+    def acquire(self, url, rate, burst):
+        """Waits for a turn of a request to the host of the url."""
+        if wait := self._reserve(urlparse(url).netloc, rate, burst):
+            sleep(wait)
+
+    def pause(self, url, seconds):
+        now = monotonic()
+        with self._lock:
+            bucket = self._bucket(urlparse(url).netloc, 0, now)
+            bucket.paused_until = max(bucket.paused_until, now + seconds)
+
+
+limiter = HostRateLimiter()
@@ -1,34 +1,226 @@
 import logging
-from datetime import datetime
+from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from datetime import datetime, timedelta
+from threading import Thread
+from time import monotonic
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
 
 from flask import Flask, g
 from flask_apscheduler import APScheduler
 
-from . import Config
+from . import Config, db
 from .blueprints import before_request
-from .magnet import update_magnet
+from .feed import feed
+from .magnet import get_magnet, save_magnet
 from .models import Source
+from .polling import burst_check, check_delay, check_queue, next_release
+from .sonarr import EpisodeIndex, Series, Sonarr
 
 logger = logging.getLogger(__name__)
 
 scheduler = APScheduler()
 
 
+def _get_magnet(context, url, cookies, user_agent, validators):
+    with scheduler.app.app_context():
+        vars(g).update(context)
+        return get_magnet(url, cookies, user_agent, validators)
+
+
+def _run_by_host(
+    sources: Iterable[Source],
+    host_workers: int,
+    submit: Callable[[Source], Future],
+) -> Iterator[Tuple[Source, Future]]:
+    """Submits the checks of the sources, at most ``host_workers`` at a time
+    per host, and yields every source with its future once it's done.
+
+    The checks waiting for their host stay here and don't hold a worker.
+    """
+    waiting: Dict[str, deque] = defaultdict(deque)
+    for source in sources:
+        waiting[urlparse(source.url).netloc].append(source)
+
+    running: Dict[Future, Tuple[str, Source]] = {}
+
+    def submit_next(host):
+        source = waiting[host].popleft()
+        running[submit(source)] = host, source
+
+    for host, queue in waiting.items():
+        for _ in range(min(host_workers, len(queue))):
+            submit_next(host)
+
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            host, source = running.pop(future)
+            if waiting[host]:
+                submit_next(host)
+            yield source, future
+
+
+def _episodes(source: Source) -> Optional[Tuple[Series, EpisodeIndex]]:
+    if not g.sonarr:
+        return None
+    try:
+        series = g.sonarr.get_series(source.tvdb_id)
+        return series, g.sonarr.episodes(series.id)
+    except Exception:
+        return None
+
+
+def _reschedule_source(source: Source, changed: bool):
+    conf = g.config.general
+    now = datetime.utcnow()
+    misses = 0 if changed else source.misses + 1
+
+    completed = False
+    release = None
+    if found := _episodes(source):
+        series, episodes = found
+        completed = series.completed(source.season)
+        if conf.burst_polling and not completed:
+            release = next_release(conf, source, episodes, now)
+
+    next_check = now + check_delay(conf, misses, completed)
+    next_check = burst_check(conf, next_check, release, now)
+    source.update(misses=misses, next_check=next_check)
+
+
 def check():
     with scheduler.app.app_context():
         before_request()
 
-        for source in Source.query:
-            update_magnet(source, g.webhook)
+        conf = g.config.general
+        context = vars(g).copy()
+
+        feed.resync()
+        due = check_queue.due(datetime.utcnow())
+        if not due:
+            return
+        sources = Source.query.filter(Source.id.in_(due)).all()
+        pending = {source.id for source in sources}
+
+        try:
+            with ThreadPoolExecutor(
+                conf.check_workers, thread_name_prefix="check"
+            ) as executor:
+
+                def submit(source: Source):
+                    return executor.submit(
+                        _get_magnet,
+                        context,
+                        source.url,
+                        source.cookies,
+                        source.user_agent,
+                        source.validators,
+                    )
+
+                # the database is only written from this thread
+                for source, future in _run_by_host(
+                    sources, conf.host_workers, submit
+                ):
+                    old_hash = source.hash
+                    try:
+                        magnet, err = future.result()
+                        save_magnet(source, magnet, err, g.webhook)
+                    except Exception as e:
+                        db.session.rollback()
+                        logger.error("[tvdbid:%i]: %s", source.tvdb_id, e)
+                    changed = source.hash != old_hash
+                    if changed:
+                        Sonarr.invalidate_episodes(source.tvdb_id)
+                    try:
+                        _reschedule_source(source, changed)
+                    except Exception as e:
+                        db.session.rollback()
+                        logger.error(
+                            "[tvdbid:%i]: reschedule: %s", source.tvdb_id, e
+                        )
+                    else:
+                        pending.discard(source.id)
+        finally:
+            # a source out of the queue would never be checked again
+            check_queue.retry(pending, datetime.utcnow())
+
+        for cache in Sonarr.caches():
+            logger.info(cache.stats())
+
+
+def _warm_up_series(context, tvdb_id):
+    with scheduler.app.app_context():
+        vars(g).update(context)
+        try:
+            series = g.sonarr.get_series(tvdb_id)
+        except KeyError:
+            return
+        g.sonarr.episodes(series.id)
+
+
+def _warm_up():
+    with scheduler.app.app_context():
+        before_request()
+        if not (sonarr := g.sonarr):
+            return
+
+        start = monotonic()
+        context = vars(g).copy()
+        tvdb_ids = {
+            source.tvdb_id
+            for source in Source.query.with_entities(Source.tvdb_id)
+        }
+        with ThreadPoolExecutor(
+            g.config.general.check_workers, thread_name_prefix="warm-up"
+        ) as executor:
+            futures = [
+                executor.submit(sonarr.get_languages),
+                executor.submit(sonarr.get_qualities),
+                executor.submit(sonarr.refresh_history),
+                *(
+                    executor.submit(_warm_up_series, context, tvdb_id)
+                    for tvdb_id in tvdb_ids
+                ),
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("warm-up: %s", e)
+
+        logger.info(
+            "warm-up of %i series finished in %.1f s",
+            len(tvdb_ids),
+            monotonic() - start,
+        )
+
+
+def warm_up():
+    """Fills the Sonarr caches in the background, requests are served
+    from whatever is already cached until then.
+    """
+    Thread(target=_warm_up, name="warm-up", daemon=True).start()
 
 
 def reschedule(conf: Config):
+    # a lowered max check interval applies to the scheduled checks too
+    max_interval = timedelta(minutes=conf.general.max_check_interval)
+    check_queue.limit(datetime.utcnow() + max_interval)
+
     scheduler.remove_all_jobs()
     scheduler.add_job(
         check.__name__,
         check,
         trigger="interval",
-        minutes=conf.general.check_interval,
+        minutes=1,
     ).modify(next_run_time=datetime.now())
 
 
@@ -1,38 +1,48 @@
 from __future__ import annotations
 
+import json
 import logging
 import re
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from itertools import chain
-from typing import Callable, Dict, List, Literal, Optional
+from threading import Lock, RLock, Thread
+from typing import Callable, Dict, Hashable, List, Literal, Optional, Set
 from urllib.parse import urljoin
 
 import requests
-from cachetools import TTLCache
+from cachetools import TLRUCache
 from pydantic import (
     AliasChoices,
     AliasPath,
     BaseModel,
     Field,
+    PrivateAttr,
     TypeAdapter,
     field_validator,
 )
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
+from . import sonarr_store
 from .models import ALL_SEASONS
 
 logger = logging.getLogger(__name__)
 
+POOL_SIZE = 8
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
 
 class Image(BaseModel):
-    cover_type: Literal[
-        "unknown",
-        "poster",
-        "banner",
-        "fanart",
-        "screenshot",
-        "headshot",
-        "clearlogo",
-    ] = Field(alias="coverType")
+    cover_type: str = Field(alias="coverType")
     url: str = ""
 
 
@@ -53,10 +63,11 @@ class Series(BaseModel):
     seasons: List[Season]
     season_count: int = Field(validation_alias=season_count_alias, default=0)
     status: str
-    sonarr: Sonarr
+    _sonarr: Optional[Sonarr] = PrivateAttr(None)
 
-    class Config:
-        arbitrary_types_allowed = True
+    @property
+    def sonarr(self) -> Sonarr:
+        return self._sonarr
 
     def __lt__(self, other: Series):
         return self.sort_title < other.sort_title
@@ -72,37 +83,18 @@ class Series(BaseModel):
         return urljoin(self.sonarr.url, self.image("poster").url)
 
     def completed(self, season):
-        episode = self.sonarr.episode(self.id)
-        exist = [
-            ep.has_file
-            for ep in episode
-            if ep.season_number == season
-            or season == ALL_SEASONS
-            and self.status == "ended"
-            and ep.season_number > 0
-        ]
-        return exist and all(exist)
+        episodes = self.sonarr.episodes(self.id)
+        if season == ALL_SEASONS:
+            if self.status != "ended":
+                return False
+            return episodes.completed(ALL_SEASONS, first_season=1)
+        return episodes.completed(season)
 
     def get_episodes(self, season, dt) -> List[Episode]:
-        episode = self.sonarr.episode(self.id)
-        season_episode_list = [
-            ep
-            for ep in episode
-            if ep.monitored
-            and season in (ALL_SEASONS, ep.season_number)
-            and (ep.air_date_utc or datetime.max) < dt
-        ]
-        return season_episode_list
+        return self.sonarr.episodes(self.id).aired(season, dt)
 
     def n_files(self, season: int) -> int:
-        episode = self.sonarr.episode(self.id)
-        return len(
-            [
-                ep
-                for ep in episode
-                if season in (ALL_SEASONS, ep.season_number) and ep.has_file
-            ]
-        )
+        return self.sonarr.episodes(self.id).n_files(season)
 
     @property
     def url(self):
@@ -128,6 +120,89 @@ class Episode(BaseModel):
         return air_date_utc.replace(tzinfo=None)
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+class EpisodeIndex:
+    """Episodes of a series sorted by season and air date.
+
+    Seasons, air times and running counts of episodes with a file are kept
+    in arrays, so a season or an air date is found with bisect.
+    """
+
+    def __init__(self, episodes: List[Episode]):
+        def air_time(ep: Episode):
+            if ep.air_date_utc is None:
+                return float("inf")
+            return (ep.air_date_utc - _EPOCH).total_seconds()
+
+        self.episodes = sorted(
+            episodes,
+            key=lambda ep: (ep.season_number, air_time(ep), ep.episode_number),
+        )
+        self.seasons = array("l", (ep.season_number for ep in self.episodes))
+        self.air_times = array("d", map(air_time, self.episodes))
+        self.files = array("l", [0])
+        for ep in self.episodes:
+            self.files.append(self.files[-1] + ep.has_file)
+
+    def __len__(self):
+        return len(self.episodes)
+
+    def _range(self, season, first_season=None):
+        if season == ALL_SEASONS:
+            if first_season is None:
+                return 0, len(self.seasons)
+            return bisect_left(self.seasons, first_season), len(self.seasons)
+        return (
+            bisect_left(self.seasons, season),
+            bisect_right(self.seasons, season),
+        )
+
+    def _season_ranges(self, season):
+        lo, hi = self._range(season)
+        while lo < hi:
+            end = bisect_right(self.seasons, self.seasons[lo], lo, hi)
+            yield lo, end
+            lo = end
+
+    def aired(self, season, dt: datetime) -> List[Episode]:
+        """Monitored episodes aired before ``dt``, by season and number."""
+        before = (dt - _EPOCH).total_seconds()
+        aired = []
+        for lo, hi in self._season_ranges(season):
+            end = bisect_left(self.air_times, before, lo, hi)
+            aired.extend(
+                sorted(
+                    (ep for ep in self.episodes[lo:end] if ep.monitored),
+                    key=lambda ep: ep.episode_number,
+                )
+            )
+        return aired
+
+    def next_missing(self, season, after: datetime) -> Optional[Episode]:
+        """The first monitored episode without a file aired after ``after``."""
+        after_time = (after - _EPOCH).total_seconds()
+        missing = []
+        for lo, hi in self._season_ranges(season):
+            start = bisect_right(self.air_times, after_time, lo, hi)
+            for ep in self.episodes[start:hi]:
+                if ep.air_date_utc is None:
+                    break
+                if ep.monitored and not ep.has_file:
+                    missing.append(ep)
+                    break
+        return min(missing, key=lambda ep: ep.air_date_utc, default=None)
+
+    def n_files(self, season) -> int:
+        lo, hi = self._range(season)
+        return self.files[hi] - self.files[lo]
+
+    def completed(self, season, first_season=None) -> bool:
+        lo, hi = self._range(season, first_season)
+        return lo < hi and self.files[hi] - self.files[lo] == hi - lo
+
+
 class Language(BaseModel):
     id: int = Field(validation_alias=AliasChoices("id", "value"))
     name: str
@@ -160,73 +235,409 @@ class ParsedEpisodeInfo(BaseModel):
     quality: QualityItem
 
 
-class SonarrCache(TTLCache):
+class WebhookSeries(BaseModel):
+    id: int
+    tvdb_id: int = Field(alias="tvdbId")
+
+
+class WebhookEvent(BaseModel):
+    event_type: str = Field(alias="eventType")
+    series: Optional[WebhookSeries] = None
+    download_id: Optional[str] = Field(None, alias="downloadId")
+
+
+_series_list = TypeAdapter(List[Series])
+_episode_list = TypeAdapter(List[Episode])
+_series_lookup_list = TypeAdapter(List[SeriesLookup])
+
+
+class SingleFlight:
+    """Runs one call per key at a time, concurrent callers wait for it
+    and share its result.
+    """
+
     def __init__(self):
-        super().__init__(3, ttl=timedelta(days=1).total_seconds())
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+
+    def do(self, key, func):
+        with self._lock:
+            future = self._calls.get(key)
+            if leader := future is None:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
 
-    def get_cached(self, key, getter):
         try:
-            return self[key]
-        except KeyError:
-            pass
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def running(self, key):
+        with self._lock:
+            return key in self._calls
+
+
+class SonarrCache(TLRUCache):
+    """TTL cache of Sonarr data.
+
+    With ``stale`` set, an entry older than ``ttl`` is still returned for
+    up to ``stale`` longer while it's reloaded in the background.
+    On a miss, ``restore`` may return a value saved earlier with its age.
+    """
+
+    def __init__(
+        self, name, maxsize, ttl: timedelta, stale: timedelta = timedelta()
+    ):
+        super().__init__(maxsize, self._expires)
+        self.name = name
+        self.ttl = (ttl + stale).total_seconds()
+        self.fresh = ttl.total_seconds()
+        self.loaded: Dict[Hashable, float] = {}
+        self.lock = RLock()
+        self.flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.revalidations = 0
+
+    def _expires(self, key, value, now):
+        # a restored entry only lives for what's left of its lifetime
+        return self.loaded.get(key, now) + self.ttl
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+    def get_cached(self, key, getter, restore=None):
+        with self.lock:
+            try:
+                cached = self[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if self._stale(key):
+                    self._revalidate(key, getter)
+                return cached
+
+        value = self.flight.do(key, lambda: self._load(key, getter, restore))
+        if self._stale(key):
+            self._revalidate(key, getter)
+        return value
+
+    def _stale(self, key):
+        with self.lock:
+            return self.timer() - self.loaded.get(key, 0) > self.fresh
+
+    def _revalidate(self, key, getter):
+        if self.flight.running(key):
+            return
+
+        def revalidate():
+            try:
+                self.reload(key, getter)
+            except Exception as e:
+                logger.error("%s cache: %r: %s", self.name, key, e)
+
+        self.revalidations += 1
+        Thread(target=revalidate, daemon=True).start()
+
+    def _load(self, key, getter, restore=None):
+        # another caller may have loaded the key right before this flight
+        with self.lock:
+            if key in self:
+                return self[key]
+
+        if restore is not None and (restored := restore()) is not None:
+            value, age = restored
+            if age < self.ttl:
+                with self.lock:
+                    self.loaded[key] = self.timer() - age
+                    self[key] = value
+                return value
+
+        return self.put(key, getter())
+
+    def reload(self, key, getter):
+        return self.flight.do(key, lambda: self.put(key, getter()))
+
+    def contains(self, key):
+        with self.lock:
+            if key in self:
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def put(self, key, value):
+        with self.lock:
+            self.loaded[key] = self.timer()
+            self[key] = value
+        return value
+
+    def invalidate(self, key):
+        with self.lock:
+            self.pop(key, None)
+
+    def stats(self):
+        return (
+            f"{self.name} cache: {self.currsize}/{self.maxsize} entries,"
+            f" {self.hits} hits, {self.misses} misses,"
+            f" {self.evictions} evictions, {self.expirations} expirations,"
+            f" {self.revalidations} revalidations"
+        )
+
+
+_history_date = TypeAdapter(datetime)
+
 
-        cached = self[key] = getter()
-        return cached
+class DownloadHistory:
+    """Download ids of all records of the Sonarr history."""
+
+    page_size = 1000
+    refresh_interval = timedelta(minutes=1)
+
+    def __init__(self):
+        self.ids: Set[str] = set()
+        self.since: Optional[str] = None
+        self.since_date: Optional[datetime] = None
+        self.last_id = 0
+        self.refreshed = datetime.min
+        self.lock = Lock()
+
+    def add_id(self, download_id: str):
+        with self.lock:
+            self.ids.add(download_id.upper())
+
+    def add(self, records) -> Set[int]:
+        """Adds the records not seen yet and returns the series ids of
+        the new ones with a download.
+        """
+        series_ids = set()
+        for record in records:
+            # history/since returns the records of the since date again
+            record_id = record.get("id", 0)
+            if record_id and record_id <= self.last_id:
+                continue
+            self.last_id = max(self.last_id, record_id)
+
+            # an import has the download id of its grab
+            if download_id := record.get("downloadId"):
+                self.ids.add(download_id.upper())
+                series_ids.add(record["seriesId"])
+
+            date = _history_date.validate_python(record["date"])
+            if self.since_date is None or date > self.since_date:
+                self.since = record["date"]
+                self.since_date = date
+        return series_ids
+
+
+EPISODE_STALE = timedelta(days=1)
+
+
+def _session() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = "PickPockett"
+    adapter = HTTPAdapter(pool_maxsize=POOL_SIZE, max_retries=RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class Sonarr:
-    cache = SonarrCache()
+    series_cache = SonarrCache(
+        "series", 1, ttl=timedelta(hours=6), stale=timedelta(days=1)
+    )
+    missing_cache = SonarrCache("missing", 1024, ttl=timedelta(hours=1))
+    profile_cache = SonarrCache(
+        "profile", 2, ttl=timedelta(days=1), stale=timedelta(days=7)
+    )
+    history = DownloadHistory()
+    episode_cache = SonarrCache(
+        "episode", 1024, ttl=timedelta(hours=1), stale=EPISODE_STALE
+    )
+    session = _session()
 
     def __init__(self, sonarr_config):
         self.url = str(sonarr_config.url)
         self.apikey = sonarr_config.apikey
+        self.timeout = (
+            sonarr_config.connect_timeout,
+            sonarr_config.read_timeout,
+        )
+
+        episode_ttl = timedelta(minutes=sonarr_config.episode_ttl)
+        if Sonarr.episode_cache.fresh != episode_ttl.total_seconds():
+            Sonarr.episode_cache = SonarrCache(
+                "episode", 1024, ttl=episode_ttl, stale=EPISODE_STALE
+            )
+
+    @classmethod
+    def caches(cls) -> List[SonarrCache]:
+        return [
+            cls.series_cache,
+            cls.missing_cache,
+            cls.profile_cache,
+            cls.episode_cache,
+        ]
 
     def _url(self, endpoint):
         return urljoin(self.url, f"api/v3/{endpoint}")
 
-    def _get(self, endpoint, default_factory: Callable = list, **kwargs):
+    def _request(self, endpoint, **kwargs) -> requests.Response:
         url = self._url(endpoint)
-        headers = {"User-Agent": "PickPockett"}
         params = {"apikey": self.apikey, **kwargs}
-        r = requests.get(url, headers=headers, params=params)
+        return self.session.get(url, params=params, timeout=self.timeout)
+
+    def _fetch(self, endpoint, **kwargs) -> Optional[bytes]:
+        r = self._request(endpoint, **kwargs)
         if r.ok:
-            return r.json()
-        return default_factory()
+            return r.content
+
+    def _fetch_checked(self, endpoint, **kwargs) -> bytes:
+        """Raises on an error response instead of returning nothing."""
+        r = self._request(endpoint, **kwargs)
+        r.raise_for_status()
+        return r.content
+
+    def _get(self, endpoint, default_factory: Callable = list, **kwargs):
+        content = self._fetch(endpoint, **kwargs)
+        if content is None:
+            return default_factory()
+        return json.loads(content)
+
+    def _get_stored(self, key, endpoint, **kwargs) -> bytes:
+        """Returns the raw response, which is also saved to the store.
+
+        An error response raises, so a cached value is kept.
+        """
+        content = self._fetch_checked(endpoint, **kwargs)
+        sonarr_store.save(key, content)
+        return content
+
+    @staticmethod
+    def _restore(key, decode):
+        def restore():
+            if (stored := sonarr_store.load(key)) is None:
+                return None
+            content, age = stored
+            try:
+                return decode(content), age
+            except ValueError as e:
+                logger.warning("stored %s: %s", key, e)
+                return None
+
+        return restore
 
     @property
     def icon(self):
         return urljoin(self.url, "Content/Images/logo.svg")
 
-    def episode(self, series_id: int) -> List[Episode]:
-        episode = self._get("episode", seriesId=series_id)
-        episode_list = TypeAdapter(List[Episode]).validate_python(episode)
-        return episode_list
+    @staticmethod
+    def _episode_list(content: bytes) -> List[Episode]:
+        return _episode_list.validate_json(content)
 
-    def _series(self) -> Dict[int, Series]:
-        series = {
-            (s := Series.model_validate(dict(obj, sonarr=self))).tvdb_id: s
-            for obj in self._get("series")
+    @classmethod
+    def _episode_index(cls, content: bytes) -> EpisodeIndex:
+        return EpisodeIndex(cls._episode_list(content))
+
+    def _episodes(self, series_id: int) -> EpisodeIndex:
+        episode = self._get_stored(
+            f"episode-{series_id}", "episode", seriesId=series_id
+        )
+        return self._episode_index(episode)
+
+    def episodes(self, series_id: int) -> EpisodeIndex:
+        return self.episode_cache.get_cached(
+            series_id,
+            lambda: self._episodes(series_id),
+            self._restore(f"episode-{series_id}", self._episode_index),
+        )
+
+    @classmethod
+    def _invalidate_episode_list(cls, series_id: int):
+        cls.episode_cache.invalidate(series_id)
+        sonarr_store.discard(f"episode-{series_id}")
+
+    @classmethod
+    def invalidate_episodes(cls, tvdb_id: int):
+        with cls.series_cache.lock:
+            series = cls.series_cache.get("series", {}).get(tvdb_id)
+        if series is not None:
+            cls._invalidate_episode_list(series.id)
+
+    def _series_list(self, content: bytes) -> List[Series]:
+        series_list = _series_list.validate_json(content)
+        for series in series_list:
+            series._sonarr = self
+        return series_list
+
+    def _series_map(self, content: bytes) -> Dict[int, Series]:
+        return {
+            series.tvdb_id: series for series in self._series_list(content)
         }
-        return series
+
+    def _series(self) -> Dict[int, Series]:
+        return self._series_map(self._get_stored("series", "series"))
 
     def series(self) -> List[Series]:
-        series = self.cache["series"] = self._series()
-        return sorted(series.values())
+        series = self.series_cache.reload("series", self._series)
+        with self.series_cache.lock:
+            return sorted(series.values())
+
+    def _single_series(self, tvdb_id: int) -> Optional[Series]:
+        # an error mustn't be taken for an unknown series
+        content = self._fetch_checked("series", tvdbId=tvdb_id) or b"[]"
+        return next(
+            (s for s in self._series_list(content) if s.tvdb_id == tvdb_id),
+            None,
+        )
 
     def get_series(self, tvdb_id: int) -> Series:
-        try:
-            return self.cache.get_cached("series", self._series)[tvdb_id]
-        except KeyError:
-            pass
-        series = self.cache["series"] = self._series()
-        return series[tvdb_id]
+        series = self.series_cache.get_cached(
+            "series", self._series, self._restore("series", self._series_map)
+        )
+        if tvdb_id in series:
+            return series[tvdb_id]
+
+        # the full list is only reloaded when the cache expires,
+        # a missing series is fetched alone and remembered if it's unknown
+        if self.missing_cache.contains(tvdb_id):
+            raise KeyError(tvdb_id)
+        single = self.missing_cache.flight.do(
+            tvdb_id, lambda: self._single_series(tvdb_id)
+        )
+        if single is None:
+            self.missing_cache.put(tvdb_id, True)
+            raise KeyError(tvdb_id)
 
-    def _languages(self):
-        schema = self._get("customformat/schema")
+        with self.series_cache.lock:
+            series[tvdb_id] = single
+        return single
+
+    @staticmethod
+    def _language_list(content: bytes):
         language_profile = LanguageProfile.model_validate(
             next(
                 impl["fields"][0]
-                for impl in schema
+                for impl in json.loads(content)
                 if impl["implementationName"] == "Language"
             )
         )
@@ -238,13 +649,36 @@ class Sonarr:
             )
         )
 
-    def get_languages(self):
-        return self.cache.get_cached("language", self._languages)
+    def add_series(self, tvdb_id: int):
+        self.missing_cache.invalidate(tvdb_id)
+        if (single := self._single_series(tvdb_id)) is None:
+            return
+        with self.series_cache.lock:
+            if (series := self.series_cache.get("series")) is not None:
+                series[tvdb_id] = single
 
-    def _qualities(self):
-        quality_profile = QualityProfile.model_validate(
-            self._get("qualityprofile/schema")
+    @classmethod
+    def remove_series(cls, tvdb_id: int):
+        cls.invalidate_episodes(tvdb_id)
+        with cls.series_cache.lock:
+            if (series := cls.series_cache.get("series")) is not None:
+                series.pop(tvdb_id, None)
+
+    def _languages(self):
+        return self._language_list(
+            self._get_stored("language", "customformat/schema")
         )
+
+    def get_languages(self):
+        return self.profile_cache.get_cached(
+            "language",
+            self._languages,
+            self._restore("language", self._language_list),
+        )
+
+    @staticmethod
+    def _quality_list(content: bytes):
+        quality_profile = QualityProfile.model_validate_json(content)
         qualities = [
             quality
             for quality in chain(
@@ -264,16 +698,23 @@ class Sonarr:
         ]
         return qualities
 
+    def _qualities(self):
+        return self._quality_list(
+            self._get_stored("quality", "qualityprofile/schema")
+        )
+
     def get_qualities(self):
-        return self.cache.get_cached("quality", self._qualities)
+        return self.profile_cache.get_cached(
+            "quality",
+            self._qualities,
+            self._restore("quality", self._quality_list),
+        )
 
     def series_lookup(self, term):
-        lookup = self._get("series/lookup", term=term)
+        lookup = self._fetch("series/lookup", term=term) or b"[]"
         lookup_list = [
             series
-            for series in TypeAdapter(List[SeriesLookup]).validate_python(
-                lookup
-            )
+            for series in _series_lookup_list.validate_json(lookup)
             if series.quality_profile_id > 0
         ]
         return lookup_list
@@ -286,20 +727,55 @@ class Sonarr:
         if parsed_info := parsed.get("parsedEpisodeInfo"):
             return ParsedEpisodeInfo.model_validate(parsed_info)
 
-    def _downloaded(self, download_id: str) -> bool:
-        history = self._get(
-            "history",
-            default_factory=dict,
-            downloadId=download_id,
-        )
-        return history.get("totalRecords", 0) > 0
+    def _history(self):
+        page = 1
+        while True:
+            history = self._get(
+                "history",
+                default_factory=dict,
+                page=page,
+                pageSize=self.history.page_size,
+                sortKey="date",
+                sortDirection="ascending",
+            )
+            yield from history.get("records", [])
+            if page * self.history.page_size >= history.get("totalRecords", 0):
+                break
+            page += 1
+
+    def refresh_history(self):
+        with self.history.lock:
+            now = datetime.utcnow()
+            if now - self.history.refreshed < self.history.refresh_interval:
+                return
+            self.history.refreshed = now
+
+            if self.history.since is None:
+                self.history.add(self._history())
+                logger.info(
+                    "download history: %i ids loaded", len(self.history.ids)
+                )
+            else:
+                records = self._get("history/since", date=self.history.since)
+                # files of the downloaded episodes may have been imported
+                for series_id in self.history.add(records):
+                    self._invalidate_episode_list(series_id)
+
+    def handle_event(self, event: WebhookEvent):
+        """Updates the caches on an event pushed by a Sonarr webhook."""
+        if event.download_id:
+            self.history.add_id(event.download_id)
+        if event.series is None:
+            return
+
+        if event.event_type in ("Download", "EpisodeFileDelete"):
+            self._invalidate_episode_list(event.series.id)
+        elif event.event_type == "SeriesAdd":
+            self.add_series(event.series.tvdb_id)
+        elif event.event_type == "SeriesDelete":
+            self.remove_series(event.series.tvdb_id)
 
     def already_downloaded(self, source_hash: str):
-        download_id = source_hash.upper()
-        return self.cache.get_cached(
-            download_id,
-            lambda: self._downloaded(download_id),
-        )
-
-
-Series.model_rebuild()
+        if self.history.since is None:
+            self.refresh_history()
+        return source_hash.upper() in self.history.ids
@@ -0,0 +1,49 @@
+import logging
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseStore:
+    """Raw responses kept on disk by key, one file each.
+
+    The modification time of a file is the time its response was fetched.
+    """
+
+    def __init__(self, path: Path = None):
+        self.path = path
+        self._lock = Lock()
+
+    def _file(self, key) -> Path:
+        return self.path / f"{key}.json"
+
+    def load(self, key) -> Optional[Tuple[bytes, float]]:
+        """Returns the content stored by the key and its age in seconds."""
+        if self.path is None:
+            return None
+        file = self._file(key)
+        try:
+            return file.read_bytes(), time() - file.stat().st_mtime
+        except OSError:
+            return None
+
+    def save(self, key, content: bytes):
+        if self.path is None:
+            return
+        file = self._file(key)
+        with self._lock:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                tmp = file.with_suffix(".tmp")
+                tmp.write_bytes(content)
+                tmp.replace(file)
+            except OSError as e:
+                logger.warning("%s: %s", file, e)
+
+    def discard(self, key):
+        if self.path is None:
+            return
+        self._file(key).unlink(missing_ok=True)
@@ -0,0 +1,172 @@
+import hashlib
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pyben
+from pydantic import BaseModel, TypeAdapter
+
+from .page import Validators
+
+DICT, LIST, INT, END = b"dlie"
+
+
+def _end(buf: bytes, pos: int) -> int:
+    """Return the offset right after the bencoded value starting at pos."""
+    depth = 0
+    while True:
+        token = buf[pos]
+        if token == DICT or token == LIST:
+            depth += 1
+            pos += 1
+        elif token == END:
+            depth -= 1
+            pos += 1
+        elif token == INT:
+            pos = buf.index(b"e", pos) + 1
+        else:
+            colon = buf.index(b":", pos)
+            pos = colon + 1 + int(buf[pos:colon])
+
+        if depth == 0:
+            return pos
+
+
+def _items(buf: bytes, pos: int = 0) -> Iterator[Tuple[bytes, int, int]]:
+    """Iterate over keys and value spans of the dictionary at pos."""
+    if buf[pos] != DICT:
+        raise ValueError("Not a bencoded dictionary")
+
+    pos += 1
+    while buf[pos] != END:
+        colon = buf.index(b":", pos)
+        start = colon + 1 + int(buf[pos:colon])
+        end = _end(buf, start)
+        yield buf[colon + 1 : start], start, end
+        pos = end
+
+
+def _info_span(torrent: bytes) -> Tuple[int, int]:
+    for key, start, end in _items(torrent):
+        if key == b"info":
+            return start, end
+
+    raise ValueError("No info dictionary in the torrent file")
+
+
+def _info_hash(torrent: bytes, start: int, end: int) -> str:
+    return hashlib.sha1(memoryview(torrent)[start:end]).hexdigest()
+
+
+def info_hash(torrent: bytes) -> str:
+    """SHA-1 of the info dictionary as it's encoded in the torrent file."""
+    return _info_hash(torrent, *_info_span(torrent))
+
+
+def _text(value) -> str:
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    return value
+
+
+class TorrentFile(BaseModel):
+    path: str
+    length: int
+
+
+class TorrentMeta(BaseModel):
+    info_hash: str
+    size: int
+    files: List[TorrentFile]
+    etag: str = ""
+    last_modified: str = ""
+    digest: str = ""
+
+    @classmethod
+    def from_torrent(cls, torrent: bytes, validators: Validators):
+        info_start, info_end = _info_span(torrent)
+
+        # the pieces are skipped, they take most of the file
+        info = {
+            key: pyben.loads(torrent[start:end])
+            for key, start, end in _items(torrent, info_start)
+            if key in (b"name", b"length", b"files")
+        }
+        name = _text(info.get(b"name", ""))
+        if b"files" in info:
+            files = [
+                TorrentFile(
+                    path="/".join([name, *map(_text, file["path"])]),
+                    length=file["length"],
+                )
+                for file in info[b"files"]
+            ]
+        else:
+            files = [TorrentFile(path=name, length=info.get(b"length", 0))]
+
+        return cls(
+            info_hash=_info_hash(torrent, info_start, info_end),
+            size=sum(file.length for file in files),
+            files=files,
+            etag=validators.etag,
+            last_modified=validators.last_modified,
+            digest=validators.digest,
+        )
+
+    @property
+    def validators(self):
+        return Validators(self.etag, self.last_modified, self.digest)
+
+
+class TorrentCache:
+    """Metadata of downloaded torrent files by their download URL."""
+
+    max_size = 1024
+
+    def __init__(self, path: Path = None):
+        self.path = path
+        self._torrents: Optional[Dict[str, TorrentMeta]] = None
+        self._sizes: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def _load(self) -> Dict[str, TorrentMeta]:
+        if self._torrents is None:
+            if self.path and self.path.exists():
+                self._torrents = _torrents_adapter.validate_json(
+                    self.path.read_bytes()
+                )
+            else:
+                self._torrents = {}
+            self._sizes = {
+                meta.info_hash: meta.size for meta in self._torrents.values()
+            }
+        return self._torrents
+
+    def get(self, url) -> Optional[TorrentMeta]:
+        with self._lock:
+            return self._load().get(url)
+
+    def put(self, url, meta: TorrentMeta):
+        with self._lock:
+            torrents = self._load()
+            torrents.pop(url, None)
+            torrents[url] = meta
+            while len(torrents) > self.max_size:
+                del torrents[next(iter(torrents))]
+            self._sizes = {
+                meta.info_hash: meta.size for meta in torrents.values()
+            }
+
+            if self.path is None:
+                return
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_bytes(_torrents_adapter.dump_json(torrents))
+            tmp.replace(self.path)
+
+    def size(self, info_hash) -> int:
+        with self._lock:
+            self._load()
+            return self._sizes.get(info_hash.lower(), 0)
+
+
+_torrents_adapter = TypeAdapter(Dict[str, TorrentMeta])
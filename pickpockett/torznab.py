@@ -5,10 +5,10 @@ from typing import Optional
 from xml.etree import ElementTree as et
 
 from flask import g
-from flask_sqlalchemy.query import Query
 
-from .magnet import Magnet, update_magnet
-from .models import ALL_SEASONS, Source
+from . import torrents
+from .feed import FeedEntry, feed
+from .magnet import Magnet
 
 CAPS = "caps"
 REGISTER = "register"
@@ -63,8 +63,8 @@ def _rss_date(dt):
     return rss_date
 
 
-def _item(name, url, dt, magnet_url, info_hash, tvdb_id):
-    size_value = "0"
+def _item(name, url, dt, magnet_url, info_hash, tvdb_id, size=0):
+    size_value = str(size)
 
     item = et.Element("item")
 
@@ -128,14 +128,11 @@ def _query(q, tvdb_id, season):
         logger.info("'q' search parameter isn't supported")
         return []
 
-    query: Query = Source.query
-
-    if tvdb_id:
-        query = query.filter_by(tvdb_id=tvdb_id)
-        if season:
-            query = query.filter(Source.season.in_([ALL_SEASONS, season]))
-
-    return query.all()
+    if season == "":
+        season = None
+    return feed.entries(
+        _to_optional_int(tvdb_id or None), _to_optional_int(season)
+    )
 
 
 def _to_optional_int(value, *, default=None) -> Optional[int]:
@@ -156,10 +153,7 @@ def _item_name(title, content, version, extra):
     return name
 
 
-def _source_items(sonarr, source, season, episode):
-    if not (source.datetime or update_magnet(source, g.webhook)):
-        return []
-
+def _source_items(sonarr, source: FeedEntry, season, episode):
     if season is None and sonarr.already_downloaded(source.hash):
         return []
 
@@ -194,6 +188,7 @@ def _source_items(sonarr, source, season, episode):
                 magnet.url,
                 magnet.hash,
                 source.tvdb_id,
+                torrents.size(source.hash),
             )
             items.append(item)
             continue
@@ -240,6 +235,7 @@ def _source_items(sonarr, source, season, episode):
                     magnet.url,
                     magnet.hash,
                     source.tvdb_id,
+                    torrents.size(source.hash),
                 )
                 items.append(item)
 
@@ -255,6 +251,9 @@ def _get_items(q, tvdb_id, season, episode):
         return [_stub()]
 
     sources = _query(q, tvdb_id, season)
+    if season is None:
+        sonarr.refresh_history()
+
     items = []
     for source in sources:
         items.extend(_source_items(sonarr, source, season, episode))
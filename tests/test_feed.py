@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from pickpockett import app, db
+from pickpockett.feed import Feed
+from pickpockett.models import ALL_SEASONS, Source
+
+HASH = "647aa53c56d7277eeb00c0c6d26e663181158cac"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    db.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def feed(session):
+    feed = Feed()
+    with (
+        app.app_context(),
+        patch("pickpockett.feed.feed", feed),
+        patch.object(Source, "query", session.query(Source)),
+    ):
+        yield feed
+
+
+def _source(tvdb_id, season, checked=True):
+    return Source(
+        tvdb_id=tvdb_id,
+        season=season,
+        url=f"https://tracker.org/{tvdb_id}/{season}",
+        hash=HASH if checked else "",
+        datetime=datetime(2024, 1, 1) if checked else None,
+    )
+
+
+def _ids(entries):
+    return sorted(entry.id for entry in entries)
+
+
+def test_feed_follows_sources(session, feed):
+    assert feed.entries() == []
+
+    unchecked = _source(1, 1, checked=False)
+    checked = _source(1, 2)
+    session.add_all([unchecked, checked])
+    session.commit()
+    assert _ids(feed.entries()) == [checked.id]
+
+    unchecked.hash = HASH
+    unchecked.datetime = datetime(2024, 1, 2)
+    session.commit()
+    assert _ids(feed.entries()) == [unchecked.id, checked.id]
+
+    session.delete(checked)
+    session.commit()
+    assert _ids(feed.entries()) == [unchecked.id]
+
+
+def test_feed_filters(session, feed):
+    sources = [_source(1, 0), _source(1, 3), _source(1, ALL_SEASONS)]
+    sources.append(_source(2, 0))
+    session.add_all(sources)
+    session.commit()
+    specials, season_3, all_seasons, other = sources
+
+    assert len(feed.entries()) == 4
+    assert _ids(feed.entries(1)) == _ids([specials, season_3, all_seasons])
+    assert _ids(feed.entries(1, 0)) == _ids([specials, all_seasons])
+    assert _ids(feed.entries(1, 3)) == _ids([season_3, all_seasons])
+    assert _ids(feed.entries(2, 3)) == []
+
+
+def test_feed_resync(session, feed):
+    source = _source(1, 1)
+    session.add(source)
+    session.commit()
+    feed.resync()
+
+    # a bulk update doesn't go through the mapper events
+    session.execute(update(Source).values(hash="0" * 40))
+    session.commit()
+    feed.resync()
+    assert feed.entries()[0].hash == HASH
+
+    feed._loaded -= feed.resync_interval + timedelta(seconds=1)
+    feed.resync()
+    assert feed.entries()[0].hash == "0" * 40
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+import requests
+
+from pickpockett.configuration import FlareSolverrConfig
+from pickpockett.flaresolverr import (
+    ClearanceCache,
+    FlareSolverr,
+    FlareSolverrSolution,
+)
+
+
+def _solution(expires):
+    return FlareSolverrSolution.model_validate(
+        {
+            "cookies": [
+                {"name": "cf_clearance", "value": "ok", "expires": expires},
+                {"name": "session", "value": "1", "expires": -1},
+            ],
+            "response": "<html></html>",
+            "userAgent": "Mozilla/5.0",
+        }
+    )
+
+
+def test_clearance_by_domain():
+    clearances = ClearanceCache()
+    clearances.put("https://tracker.org/1", _solution(time.time() + 60))
+
+    clearance = clearances.get("https://tracker.org/2")
+    assert clearance.cookies == {"cf_clearance": "ok", "session": "1"}
+    assert clearance.user_agent == "Mozilla/5.0"
+    assert clearances.get("https://other.org/1") is None
+
+    clearances.discard("https://tracker.org/3")
+    assert clearances.get("https://tracker.org/1") is None
+
+
+def test_expired_clearance():
+    clearances = ClearanceCache()
+    clearances.put("https://tracker.org/1", _solution(time.time() - 1))
+    assert clearances.get("https://tracker.org/1") is None
+
+
+def test_submit_shares_solves(monkeypatch):
+    solves = []
+
+    def solve(self, url, cookies=None):
+        time.sleep(0.1)
+        solves.append(url)
+        return url
+
+    monkeypatch.setattr(FlareSolverr, "solve", solve)
+    flaresolverr = FlareSolverr(
+        FlareSolverrConfig(url="http://flaresolverr:8191", sessions=2)
+    )
+
+    first = flaresolverr.submit("https://tracker.org/1")
+    same = flaresolverr.submit("https://tracker.org/1")
+    domain = flaresolverr.submit("https://tracker.org/2")
+    forced = flaresolverr.submit("https://tracker.org/3", wait=False)
+
+    assert same is first
+    assert first.result() == "https://tracker.org/1"
+    assert domain.result() is None
+    assert forced.result() == "https://tracker.org/3"
+    assert sorted(solves) == ["https://tracker.org/1", "https://tracker.org/3"]
+
+
+def test_post_timeout(monkeypatch):
+    posts = []
+
+    def post(url, **kwargs):
+        posts.append(kwargs["timeout"])
+        raise requests.Timeout
+
+    monkeypatch.setattr(requests, "post", post)
+    flaresolverr = FlareSolverr(
+        FlareSolverrConfig(url="http://flaresolverr:8191", timeout=60000)
+    )
+    with pytest.raises(requests.Timeout):
+        flaresolverr.solve("https://tracker.org/1")
+    assert posts == [70]
+    assert flaresolverr.solve_timeout == 140
@@ -3,6 +3,8 @@ from unittest.mock import patch
 import pytest
 
 from pickpockett.magnet import Magnet, get_magnet
+from pickpockett.page import NotModified, Page, Validators
+from pickpockett.torrent import TorrentCache
 
 torrent = b'd8:announce43:http://bt.toloka.to/announce/?h=1jFRI5Bbyt&13:announce-listll43:http://bt.toloka.to/announce/?h=1jFRI5Bbyt&44:http://bt.hurtom.com/announce/?h=1jFRI5Bbyt&43:http://bt.toloka.tv/announce/?h=1jFRI5Bbyt&ee7:comment26:https://toloka.to/p188252010:created by14:uTorrent/3.5.513:creation datei1663336019e8:encoding5:UTF-84:infod5:filesld6:lengthi530209622e4:pathl68:Solar Opposites S03E03 (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng].mkveed6:lengthi582159284e4:pathl68:Solar Opposites S03E04 (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng].mkveed6:lengthi690640867e4:pathl68:Solar Opposites S03E01 (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng].mkveed6:lengthi693295625e4:pathl68:Solar Opposites S03E05 (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng].mkveed6:lengthi716686651e4:pathl68:Solar Opposites S03E02 (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng].mkveed6:lengthi844247966e4:pathl68:Solar Opposites S03E06 (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng].mkveee4:name75:\xd0\x9d\xd0\xb5\xd1\x82\xd1\x83\xd1\x82\xd0\xb5\xd1\x88\xd0\xbd\xd1\x96 (\xd0\xa1\xd0\xb5\xd0\xb7\xd0\xbe\xd0\xbd 3) (2022) WEBRip 1080p [Ukr.Eng-Sub.Ukr.Eng]12:piece lengthi4194304e6:pieces19360:\x82dlFc\xe8AsyI\xa4X\xab\xaa\x8be&O\x8c\xbc\x14j\xfe]\x96\xe8\xb9\x8b\xda)i\x8f\xd4\x05i\x82\xd8\xf4\xf6};\x11 \xc1\xd0\xb7\xa9u=\x97\xe6\x91\xc1\x1f\x8a"1\x86\x94\x00,\xe2\xd4\xb2j\x11\x90\xb4\x89\xe8\xb05$\xc5\x8a\x8b:\x14\x94-\x08[\xec\x1dp\xf7\x08U\xf5!\'[Za*\'o\x1e\xe3\xaa\xcb\x04\xff\'\x03\x19?\x113-\x90<\x0e\x94\x9f\x91\xa9k\xcf\xa0\x94\xb0F\xdfyq]\x89\x85\nZ\x19\x9e\x97\x88\xb7\n\xbb\xeb\xbeL|9~\x8f7Y\x86~x\x7fZ"<M\x92P\xee\xcczf\x85\x10\x90\xf0\x93x\x9f\xe2\xe0\x9c\x1co5u\x13=i\xe4A@\xefp\x05k\x89#\x98Mn\x10\xc1\xd5_\xbd\xd0&|B\x9aI\x08\xc8\xb2\xc2\xa9\xcez\xd2Jg^l\x04\xf1T^m&\x92{\xd5h\xbf\x04{\tVD\xd4E\xe7\xd7\xb5r\xd9\xee\x84\xf9vf\x9b~\x01\xd8\xd4r\xe3\x0cVk:\x04\xaf\x07h\x9f[_\xe2\x99?\x83\xdc@\xbb\xe6L@iy\xa4\xc2\\\x00\xa2/\xdb\xd7-\x86\xf0\xdco\xddy\xa4qV\x84\xe9\x809j\x1a\x1eE\x85\x05\xe8\xea\xc9[\xb7\xc8/:\x00\xbdN\xc0:xl\xce\x17\x9d\xbd\x117\x0c\xe7X:\x08\x98~\x02\x18r\xc3\xcd\x1c*\x9c\xc9>O>\xb2\x95\x97R\xae\x96Jy\xf4\t\x94?,\x03Q\xdb\x9fT\xe1b\xb36\x9c\xe4C\x04\xb4\n\xd3\x0c\xb7\xaf\xc5\x92\x13R\x83\xfbAym#R\xc4%\xdbcL\xe3\x9ah\xc1\x08}\x8dfb\x15n\r\xba@\x81\xe9\xb4\x9a\x04\x1eeK\xb3M,N\xaf\xa2KX\xcf\x8c-dr/8\xcbz\xf1\xe4\x84\xa7\x80U6UJy\xe3\xaa\x0e\x93\'U":o4f=|O\'\xfd\xbd\x8b4\x89\x8dX\xff\xe9)\xa1\xb2\x11A\xbbt\xe98r\xa5Ww\x9e\x9f\'\x8dp>\x0e\xaaXkE\x96\xda#X\x88\xd7(\x16\xb2\x19_~#8\x19v@@\xba\xd4D\xd0h\x91\x1f\xec\xc8$\xf8\xc9\xb2%\xc6\x1a40\xd2 \x1c8i\xa4\xd1\x0e\x97\x0b\xcc\xd7\xb1I\xc7\xf8\xb7\xa41\xdf\xb3\\\x08\xe4\x1c\x91W\x00\xbf\xee~a\x9413\xee\xea"\x19\xcc\x1d\xf1\x12\xab\xe8\x08\xecC\xa5\xfd\xa1\xa7\x99L\xb8O \xe7\xc4\xfe\x95\x84{C5\x16\x84Nd\x98\xbdJ\x88\xc8\xd5\x14c\xe8\xca\xe1\xc1%"\x9f\x92\x9dkp\xbe\xc2{O\xdd\xd1\x11c\xba2\x96<AX\xd4\xea2\xa0\x14+\xb3\x08\xde1\xc1}\xec\xd9\xd8e\x0ft\x85\xee\x8c\xb8\xb3\x7f\x98\xdd\xc5tJv\xc8\xea\xf9\x82\xe5\x98\x80qb;G\xd5\xf5\xf2/\xd8\xaezR\x08\xd1\xf0}\xf9\\u\xf9\x026\xedc m\xe3\xb1oL\xdb\xcfp\x93p\xc2C>MS\xe7\xaf\xf6\xd2+\x08O>\xcc\xa1\xee\xb1\x9e<\xd8\x8d\xac\xcd2qv\x00\xe8\x05\xdb\xf6xT)\xe5j\x8fZ\xa0\xa4g"\xed\xa9\xbb\x19\xfa\xa0\xc9\x00+[\x99s\x1a\x9e\xe6A\xba\x7f\xb4\x1c\xe5%:\xf7\xf0J\xd4.f\xd2\xe6ym\x14Yv!\xcc|\x8e;\x1e?.\x0e\x10\x80\x1d\xb1+b\x00\xa6M\x86\xd8\xd6I\xf4K\xc1\xb0\x98 \xe2\xb2F\x89:dL\xe1Q\xf4\xad\xd3S\x11\xf9\xfd"\xfa\xae\x8c\xa0\x01b\x0c\x84\xed\xb2\x95o`\x8d\xe6\x12\x1ee}\x0e\xf4b\xab\x92R\xeb\x9b\xc5\xc1\xaaF\xaf`\x94\xe5\x08\x83\xc4(#p1\xa1\x14T\xc5(a$\x08\xc1\xf6\xe9(\x83h|\xe6M\x88\xd6\x85\xd3\x7f\x86\xb8\x00\xdc\x1f\xe8\xf0\x9aP\x8f\xe3\x83\xb2\xc5\xf2o\x82\xcaFyQ\xfcK\xaeN&\xd1|z@M\xafM\xb1t\x15\xc9\xd0\x8dD<\xda\xce\'D\x04<:)]\xa6\x84\xa2\x87P&\xb7\x95\x86\xa8\xe0/\x98\x81\xa1!"\x10\'\xd1\xcb~\xcf\xefn0_-\xa9\r\xa3\x16{\xa1\xb0\xff\xe2g0\\<}\xe3<\x10\xcafY\xd6H[\x14\tS\xc6\xc8@\xd4\x9c\x87=\xee\xd4\x0b\r\xe2\x85q\x83!\x0c\x17\x1f\x92v\xf4\xe8\xda\x119R3mn\x0b\x11l}o\xd1\xcf\tVj\x96\x857\x02\xb9M.h$\xee2s\xfaq\xd89j\x1d\xcd9\x0c\xb8\xe8\x92\xdf<\xa9\xa6\xea\xd1ZYg\xe1E\xaf\x99]\xfa\xf8c\xa3\xd3:\x8e\x16\x82\x9ex\xf4%\x92\xc19\x05SF\x13\xcbwS\xda\xb4\x83\xbd\xea\x9c\x8c\xda\x94\xb8\xe4\xab\x8d\xe7UI!(\xf9\xa9\xd5Ps\xaf\xd4\xa8\xda_qAq\x1d>\x9f\xc1/~@\xf3\xb7*7]=\x1c\xf4\x12\xe3Wh|\xd8\xa2\xbbi\x97\xed\xec\xb1\xd3\xd0\x96\xe7j\xbf\xa9]\xe4\x84*\x8db\xfd\xa9\x04\xf5\xb5\xd7Aq\xc6F\x8b\x8aS\xf6\x0f{~\xf8\x9al\xfa\x90!\xaf\xfa\xd3\t\xab\xe0\x1a\xc5sL\x9a\x98x\xd86\xb2\xdci\xed\xed0E?\xe0m\xa8\x02r3V\xa4\x07\xdb\xf2\xff(\xd2\xfd\x13\x0b\n\x9a\x02\xc3\xb6\x03\xea.\\\xfa\xd2\xb2\x99\x9fU\xf7\x04\xaf|O\x02\x06\x91\x7fwf\xda3\x8f\x9b\xd6\xbc\x06\x1a2\xae\xc7o\xe4X\xc7\xba\xe1\x85\xf40o\xde\t\x0bf\x9fa\x0fj\xf9k\xd8o\xb9\xec\xc5 vq\xe4\xad09\x85\xeb2\xba\xdd\x1e\xc7h\x84\x80\xab\xe6\xf2h\xaa\xe7\x82\xd9\xae\x11Vc\x17\x96\xda\xd9\xbd\xe8\t\x8bP\x93A9\x99;\x97\x102\xec\xc4\xf2\x9a.G\xeex,\x98;\\M\xc8I\xb6\xcf\xe1\x88\xcc\xee\xe33\xe7\xd4\xdf\xff\\+\x9c\xd9\xfe\x99\x80?\xe2\xacB*\xf6\x19\xbd\xf73\xe8|\xc4ja\xfbOrF\xce\xd5\xb6\x999\xac\xb9OLl|\xb6CS:\x02\x0c_Y\x88\xe2\xa8|&\x03\x0chV\xd2\xad\x926\xde\x0e1\x8e\xe3Ug\x9d\xa2:^@`K\x93X\xcb\x0eNs\x9cV\xd7\xcf\x84!\xb4\x9c\x95J~\xd5 \xa2u\xa01\xdd\xf5\xfc\xa4\x0f\xd1C\x1b\x1db\x93<\x06\xc2\xf4\x00\x199<\xa4l\xf4@lB\x06D\xddj^\x9ej:\xa4N\xa7\xf5\x86YqI2*(K\x89\x8f\x13\xfa\xef2#siG\xeaa\xb5\xf4\xf3\x83"\xda\xe2\xd4w\xc5\xd6+{\x08\x94\x03\x0b\xfe\xca6\\-\x94M\xf4\xfb 7^\x07\x85(\x06\xde\xad\xb2\xab\xd1&\x8d\xdeA\x13\xa6(m}7\x1c\x1c\xdbW\xda\xd4\xab\xe7RJ\xa7\xbc>\x19\n\xf6\xa9\xb7\x84\xb3\x87_\x94\xe9k\r\xbd\xc3\x97\xdf\xda\x00J@~u\xed\xdf\x007\x85\x0f\xd3\xe5\xf8\x04\x84\x8b\xb3\xc3\x14\x1e\x93W5\xc0c\xe0b[\xf7\xfec>@A\xd1\xa7K\xb5\xb3\x97\xa8\xe2\xb9;\x92=\xf1\xdc\x9e\xdc\x86G\xe6 \xb7\xfe\xebJXA\xbf\xc7:\xe9e\xb1!c"\x7f\xb1\xb0\x17\xb9\xc7\xb4\x0b\x8b\xb5\x9c\\n\x8a\xf7\xd5\x01\xf6nop}\xc3\xa3\xdb\x08?>mN\xe4I\xd1\xf1\x1a\x05\xbd\t\x7f\xbe\xe2\x80\xf1\xb0\xc8I\xbc&\xbfJ\x91i\xb6s\x9a6y\xac\xbc$\x1asT\x84}.\xb3\xd0\xa7P\xf04\xfaEv`\x19\xa2\xfb\x89L\x9d\xd6\x97.N\x92"\xb9\xf1\xfe\xff\xfd\xf9:\xb9(\xb4E\x1d\x849\x8dI\xfa\x87\x14T/(Q%\xc0f\xb2\x99\x8c\xcd\xf8\x1a\xabw\xf4\xeaZ\x96\x13t\x9a\xca\xb1\x1f\x04\xaa\xe8\xc9*\x0eJ\x15\xbe\x04\xe5tZ)u\xd8("-3X\x06\x06\xb1\x0cz\x0b\xc3\x14G\x9e\xcd\xe0\xbd+Y\xef\x86\x90\xb5\xf7\xc1\xe7P\xaesm\xa2\xec0\x99\x94a#|0a\x89\xd8\x18\xad\xee\xc7\xfa\x04(\xa5\xc1\x9d\xc6\xed\x15\xf4\xf1"\xc1\xe5!\xc0Kb\xcd\xa8<\x97\xb99\xce\x8b\x18\x97g[\xab?\xfb\xa0\xcc\xad\x93\xadQY!d\xaay\xfe\xb4\x8bO*KV0e\x06\xb4Q\xf2\xfb\xf3\x13\xd8\xc6\xe7\xf3y\x9f\xa2\xdc\xee\xec\xcfyh\x15\xf1\xb1\x16e;|\xe3\xaar\xc3YS)3\r\xf6\x0e\xbe\xc6d\xbc\xac =\xde\x17\x1b\xea\x84\x9cS\xd9(\xf3\x11\n\xdf\xbc\xc7\xbdyg\xde\xd92\x88\xbb\x10\x9c\x1e\xdc}\xab\xdd\xed\xdc#j\xe8r\xa35\x87.\xd4T\xce|N@\xb6Wcy\xca<-\x93mq\xd3\xbd\xadj\xaa\x868\\\xfb[\xd5I\x16e\x9a\x172\x13\xa6\xb6\xfa\x0cw\xa3\xe6\x85\xc0\x97\x9e\xa6>\x08-\x7f\t\xd3\x8b\x83\xfe6\xffe\xc0\xd6\x01*\x89\x1d\xd5 \x07\xbc+\x15\xeb2\x14saO^/\xb7?\x97r5\xecf\xb3\xd9\xf3\tg\xb2\xda\x0c\xb5\x8e\xce\x0e\x1a^\xc9X\x1e\xe0*\xd13\xbb\x83\xc2\x8d\xa33\xd9\x81W\x88\xc8\x84{F\xed\x84z[ \xdbf\xd0\x00\x06\xa1\xa5\x13\x1f\xe9Oo\xb8\xc0\x0f\xfa6\x9abC\x0c\xdb\x7f^\x8e\xa4\x1b\xabY5$\x8a\xd8\xe4s\xc2\xde\x9f\xbb7z\xa8\xc4\xeb\x90\xe1\x87\xceX}\x9e \xbch\xdc\x0ei\xa6\x03h\xd6\x08\x051v\xdf\x97\x94\x18\x8c\x02\xc5X\xbc\xcal\xdf\x86\x91{\x02"\xcc\xb0\xee|0`\x1a\x7f\x9f/%\xc2\xc6\x95\xf0\xd2r\xbd\xeb1\xa4\x90\xd9%\x89\x0c\xa8[tp\x1f+\xf8M\xd4\x7f\xa2\xdao\xcc\x02\xf5g<\xde\x1e\x82\x9b\xa9\xad\xa3\x87\xc1\x8bi\xc5\xae\x19\x86\xe1\xd9\xee\xdb\x12\xe3ZX\x7f\xa7\x1eL\xa9\x16g\xeb\x92\xad,T\xd1\xcf\xfff\xdf\xdc\x06\xaa\x86u\xf8\xac\x92\xc3f\xdc6#@CU\xe5Z\xeb8\xb7\x19r\x87\xec\x89\x00\x1eD\xb4\xd9\xc3\xc8"\x89\x83D\xe1G\x00vJ\xa0o\xbb\x97q\x96Kp\x88P\xaa6e\x92`\x8c\x7f\x8c7\xbf#\xa0\xf8\x85\x0boj\x8dFu\xcetw\xf7b\x85\x8bH\xa3\xb3~\x98A\xb0\x01\xa7"s\xbf|9\\h\x9c\xbe*\xe0ep3\xf9\x15\xb7H\xcc\xa2$\xdf\xe8\x96V`\rA1f\xfe2\xa4\xf9\xa5\xa2\x01\xdcw\x057j\xf3\x19\xa3\x14\x98\xc5\x91\xa8\xf6\x8fw\x8d\x9cxC\x8ae\x9a\x14C\xab\x0e\xd6\xec\x83\xe5DW\x95"J\x84a\xcd\xe3sb\xda\xb2\x88\xa0\x8d\x98@Ag\xee\xcbWO1\xc0\xe5\x97\xc4\x92\xc2\x17\xcf\x8b\x18J\xe5\xa4\'\x81\xe9\x9b\n\x85?\xf9\x98\xa9\x89\x8e`\xa9VfZ\xdc\xf7X\x85e\xfc\xe8O\xb2f\xee(\xa0~r\x13\xe8\xeb\xf8\x98\xb3\xd0\xc5:\xc8_\x9b\xd3\x9d\xd7Q\x0c&\xcc\x9a\xb7\xbaE*$\xc8\x03\xabuU\xbd\xbdi\xde\x9f\ni\xa8,\xe3J\xae\xc42\xb8 \x0b\x84\xba\x072u\xbc\x08\nA\x8a`\xee\xc3\x1f\xa0\xaa\x83\xb2\xe9:\xf9\x17\'\xc5\x19 \xdc\x1e\xdc\xe05\xce\x11\x97\xe6\xd4\x9f\xfb\xa7a\xa9\x1c\xb0N\x0f\xc5x\x0c\xa4\x0e\xfa\x07\xb2Hs\x9a\xf4\xca\xcc7LX\x8f\xf1\\\x11I\xe4\xb2o\x1c\x12\xfcKS\x92\x0ct\nn\xb9\xcd\x93\xdb\x19B8\tM``\xe8+\x98\xb3P\xa7_\xae\x0e>\xe3\xa3\xdd\x05\xabF\x7f\x15\xdc\x18\xba.\x19\x83b\xfdw%\x08KI-\x1f?-\xcfB\xbb\xe6z\xd9\xf1y_\xbc\xcc\xbf\xfa\xcc\x982_\x06\x13/\xe2\x0c\xd0\xcc\xd3\xb2\xb3\xfb\xb5\xab\x99\xa3\xe6F\r\x95\x98\xe6\x16\x1c\x87\xc7M\x03\xf0\xac\xdf\x03\x94\x9e\x80I_\x91\xfb1\xedtCC\x93*\x92\x8f\x08\xd4\xcb\x97\xb9\xbc\xa0\x8c\xf9P \x7f\xf8~e\xf1\x8b#\xfc\xb5\xa7\xa6q\xac\xac\xfe\xf1q\x99+\x06\xe2N\x8fq\x84D}\xb7mI\xdeX\xa3\xc8\xecC\xb3w\xc2#\x8a\x06zO.T*\x1d\x17\xad\x85\xe8\xfe\x84\x91\x82\x82\xdd]\x8c\x9c\xcd\xeak\xfbVky[\x08\xdd\xfb\xa7\x92\xd1\xcb\xfc\xe0hv\xe8\xcf"\x0b\xaa%#\xcbue\xd3\x16\x15\x147}\xf4N5\x9f\xf0\xd7\x90=\x95\x13/a}\x19f|lz\xcc\xfcW\x9f\xcf\x1a\x92)\x86\xf2\xb5q\xf6\x0f\xcc\xd1~\x81\x81)\xab\x9aS\xc8Kg\xdd2\xdc\x87\xbb6Z\x07\xb2\x99B\x02\xff|B+\x8b\xea\xeeTz\xbd\xc7\x1c\xb1\xeb\x1e\x9f\xc0\x08\x1b\xe1\xbcu\x93\x1d\x89g6\x1e\xc1\x0f@U\xee_\xbf\x92\x04|\xceW\xe5&\xce\t\xaf\x92i\xed\xff\xe4M\xc6p\x00C\xdc\xb9m\xf6\xcdor\xf7\x95\xe9t\x00\x06q\xbb\x17\x91j\xb0\xcc\xd3\xe3\xbd\xbe\x9a(8rm\x18\xc0i\x04\xd775\x86p\x90\xc9\x17\x93*\xc9\'\x0c\x1b\x8b\x0c\x0bnY\xde\xfa\x02\xd4\xf9\xfe]7\x10\xb8c\x13\x1c.\xb3\x8d\xf6-U\x99\xa1\xe6\xc4TZV\xd0\x87\xa8%\x1df\x94\x00\xf4\xbeG~\xcb\x95\xba6\xdd,D\xbdT?h\x12\x9e\x14\xfa\xcc\x1c\xf1\xf9&\xac\xa556N;(!|#\xed6\xff\xd5\xad\xfc\xd1\xe5\x1c\xa2v\x92g\x81t\x11\t2\x149\x04d\x13z!\xd3\xb3@\xcb\x15\xc4\x19\xb1f\xdfE\xc2\x07(\x0f\xf3tP\xde\x9b\xd1\x85N\xe3\x89\x9c\xd8\xf0\xe7.\x1d\xff\x14=\xf0\xc0L\x95\xc6\x13\xa9/\t\x0ck\xa0\x9d\xf2Y\xb1\x90\x8bk\x18B+6\x90\xe3\xec\x06\xf8\x04\x13[n\xd0\x83\x8e\xe8:\x98"\xad\xadr7$4x\xbf\xedlM(NU\n\xa3+K\x83p\xe8\x1b\xa0V6\xaa\xf7^\xc2\xb3\r\xfc\x1bh\xa7^\x9a\x18\xe1\xc9\xcc$em\xdc\x18\x94@\x95\xb5,\x1a\nS\xc2ND\xe7\xec\x01\xe0\x8c\xb9\x04 \xb4\xc4\xc4\xd5B:\xdcKC\x82\x9d\xbb \x12Z#\xc2*\x81\t\xad\xcbR\xd6.\x1b\xd0\x0f\xce|t\xbb\xff1\x14\x84\x0e\xc4\xd88\xfe\xfb\xe7k9\x1d\xe6\xc6\xb2\x0e\xe2\xb6N\xd9R/\xc6\xf7\x195CN\x1bK`_\x84\xc6f\xf9\xa1f\x0e\xaf\x05\xdc\xaa\xbc\x9e\x84\x88N\xa2 $*\x9b\\\x8f\x9b\xf2wm\xfe\xae\xc3\xadu\x83\xea\xd8B\xcd8\xc9\xc1\x04\x03p\xaf6\x11Ejg\x07\xb98\xbdh=\xe7\x9f\xd1\x93Up\xc4T"\x9c\x96#\xb3\x89\x8a\xc4P\xd67\x81\x1dj\xea\x18!\x94\x93\xef\x8bn]\xfe4vvq\xc6\xcf\xf2\xf7\x1f\x17&\x14\x115-\n\x85\x91\xc6Y\xdd\xd2\x1e\x18\x17\xfa\xff@\x06c\xe2k]\xda\xc4\xe7\xa9i\x9a\x05zC<\xc4\x1e>c7\xa6\xd2\x07\x1fG\xe0\xca\xe4k%\x8c\x97\xf7sl<j]\x9cDyfY\x94\xa1q\x89\xb2g^ZCg\x892h`\xc0\xb2\xf8\x13/\xfc\x1e\x86\xed&\x1c\x04Cxtv\x08\xfc\x1ek\xc6\x98\x10\x14\x13\xbe|?\xe5\r8{\xe64T5k\x1e\x0f\xfa2l\x93\x04]{\xf5\x01\xa7\tPJ\x85\xe6\xf60\xb3\xc4)\xdapi\x92\xb9\x95w\xd9\x1a\xcb\x812\xc5\xcd\xcatAd\xc6t\xac\xa6\xfb\xe6\xf0\x1b\x7f|\xea\xd9n\xef\xbfl\'\xdc\x84pf\x16\xc3\xab\x1e\r}\x9f\xaf\x81;fB+Q\xcd\xe7\xd3\xc01hnL\xed\x8a\xcd\xce\x12\x0e\xc34g\x83YQ\xa2\xc6W^\x0e\xb6\xea\x1c\xdd[B\x07\xe9l)v\x9dX_\xa3u\xee\x1e\xaa\x83\xfe\x87\x9c\x96\xeb\xa0-l\x82\xcc\xa6\x08I\xf1\xf5\xa9\xb4x\xf8a\xa7\xd0\xe9\xb9+\x9a\x0f\xb3\xf81\xaa\xb3\xd8\x00W\xbc\x00\x075\x80\xaa\xc7\x02s\x13\x9e0N\x7f\xe7y\xb6\x00`\xf0\xdaU\xbd\x12\x05]\xbf\n\x15}\xff\x92\xa2\x85\x1e\xd1g\xd4\r\xb9\x0eL\xe2*=\xdc\x85*\xa3Gy\x8dl\x08\xff\xccn\x0f\xd6}nP7\\\x88uNv\x8b\xdb=\xa3q\x8b\x8dN&P\xae\x03\x01\x8e\x1a*\x98\x9e\x8d\x80\xa7\x88\xe0\x93P\\\xf8&\xa0\xed\x97\xa4"\xfaM\xa6L\xc1\x8a\xbd\xcc:\x05\xd9\x81\x08-\xf2\xb1{%&9@\nM\xe8JI\xef\xbdC\xc0\x04\xf8\xfa\xba\\\xe1T$\x91\xe9qUo\x85\xb8\xda\x9bK\xde\x88\xe4ejY\xf9\xfb\xc8\xd1h\x10$\x03e$MoF\x99\xc1\xd7\x0e\xb1te\xc3\x84\xbe\x97V\xd4\xb0\x10\x1f\xee\xb6\xdf\x0c\xe3\xf1\xe6\xda\xd9\xf6R\x02\xccF\x1c\x19\x8b\xc9\xaa\xe4\x17\xf6P\xdf\xddh2\xea\xf5\x8c\xd3e\x1d\x84^\x9b`\x18\xe5qD\xfb\x11\x89\xbd\xd4\x12\x8c~\xfaB\xa12\x9ec7\xf0\x02!\x1dU\r\xd3N_\x06@K:\xb6\xda\xfb\xdf\x03\xb7\xbc\x08\xd6\xff\xe1\x9fW\xf9\xddF+\xaa\xbe\xd9\xd5|\xc4#\x88\xed\xa4\xe2\xf2\xbf\xf2t8t\xa7\x815\xae\xd2Jd\xf5\xcb~\xb4\xe2\xf13\xf9\xd2\xd0\xa0E\xf3\xd7\x99\xa9[\xe9V\xa3\xc0\x1e\xfd\xed\xeb\xb2L\xad\xb3G\xcfk\x9e6W\xc6\x89\xd4\x03\xa1\xed\x8d\x91D\xad\xecS\xe3aB\xeaO\x1d\x08\xcb\xad\xae\xfa\xb8A\x19\x03\xcfk\x8f\xf6\xe4ONP\x82\xb4\xff\xa5\xf5\xd1\xd4Q3\x11\x9f\x18\xa2[\xe2\xdd`\x83\x1b\xaf8\xb3Q\x81\xf5\xc0\xcd\x01\xb8*\xff\x95\xe9\xedbf\xdf\x97{\xe94\x1f\x94\x8a\xf5\xd0p*\x008\xf8\xd3\xcd\xd4\xc9\xa3\x13\\8\xc18g^\x0eV\x7f!\xe3\x84\x11\x1f\x1c\xa3\x0f^\xad\xbc%\xf1\xc4\x14H\xdc\xb3\\N\x87\xf5\xdc\x8aU,sal,\x96\x8c\xcd:C\xcc\xa4E\xbc\x03\x81M5\xeaj\xb1\x95\xea\xfb\x08\x90V5F\xf3&4k\xc8W/\xcc\xab\x1d}\x97\x8eK\xc8s\xb7\x0b\x9e"`T?r\x8b}B\n#\xeaE\xee\xedEA#"\xa6\x8f\xdcFt\x0f;\xbb\xbbT\x18\x8a\xc1H\xb1\xdc\x8d\x8d[\xc6\xaaJ\xd2B>\\\x83\xc1\xe9\xfa\xca\xbb\xa5~q\xb2\x0b\xf95 =\x92\xf0B\x95\xde[\xae\x01\xb6\xb1\xed\xb67$\xeb\x19<\xb6\x1d\xd7\xafg\x1e<\x16\x12\x83\xd1ty\xbc\xa9\x8f\x01\xac\x16\xe0k\x8e\x10\xff^&\xe0\xc52\xb2\xcc?v\x05\xb2\x9e\xa2CL\x8d\xf5\xc1\xd2C\xe6\xf2\x8daQ?#\x90]r\xbd\x18\x85W\xf4\x81#\xdf\xa1\xdd\xe1\x15\xa0\xac\x1av/=F\x85\xc2\xefa\xe0\x8e\xd3\xc0\x1d\x00\xbe\x00M"\xb0~?9\xfb,U\xf2\xbet\x93\x91\x93}\xd2\x1c\xad\xb8\x0e\x98\xfe\xe5:\xa8\x00S\x08L\x1c\x8f\x9bN\x10h\x13\xff\x1e\xe3\xe8(\xf0\x0fJ\x16/\xc3S;\xd3\xd1\xfd\xc5m\xc3:\xca\x8a\xc0\xc9]4\x9eV\xf4\x89\xc6\x10/W?\x1d\xea\x9c\x07\x9d\xb5\xe9\tpw_\xe8\x17t\xfc\xa3\x86\xc62-\x93\x7f}\xf5\xadM\xc1\xbb\x7f\xa7v\xec-\xfd\xfb\xd9\\\xab$\x17\xe5\xee*\xfd\xff+\xf9\xcd\x98\xb1\xbc\xa9\xe9 ,\x11\xc1\xd10\xbf\xa7N\x1b\xcfh\x8bcs\x02t\x8a\x07\x9b\xa7\xaf8WR\x8f\xbd\r?3\x9f\xa6}\xd9\xfbpk"\xd9\x96\xaf\xb7\x9a&\x90\x00`!e\x02\x0f\x97\x81?\xa6\x13g\xebU\x9f\xc6\xa4\x1a \xd0y\x99\xf5d\xfe\x01\xe4\xf4\xa7:\xe7\x03]4\xcc\xc7L/^\xe9\xf7\xa1H\xc0\xc8\xc9\xae\xae|\x8f\xc3\xae\xe7\x19R\x02%\x9d\xbb\xed\x02!\xf9\xe6\x95\x05\xf2\xceb9=\x15\x90\xaa\x17\x80\xb4\x0cj\x14\x8aW\x13s\xce\x7f?Q\x04g\xe7\xfd\xc8b\xabn\xbe1\x15\xeb\xdf\x8b\xb32$k\xccA.mf:\xff^N\x8d\xab\x16 X}g\xa4\xdf]\x08\xdb\xf3\t[\x85\xd1\xd5X\xcc\x94\x10\xa2`\x914\xd4\x1d\r\xcb\x02\xa9Q~\x18\x0b\xc4\x8cb n\xd6_\xcd\x84d\xe9rs\xc3"\x1e\x0b\xa8+\x0f\xda\xf4\x8a\x01\xd3\x13\x9cW\x96C\x06G\x83\x8a~\x85KvyR\xf9\x1dJ\x8d\x83\x9f\xd80\x18\xbcW\xc2#\\\x8dv\xdc\xf7\x9e\xcf\x85\x16\x9c41\xc6\xe1\x7f\x99G+\xd57\xeb?\xfc\x1f\x08H\xb1\x01\x8d\xc2(\xad\xb0j\x9c\x90zxV\xa1\xbd\x95\xc9{Q\\;\xb8\xcc\x12\x17\x07-\x01\x88\xd88\x84Ph\xfb\xa81\xae\x8f\x95^\x7f\xe2\x7f\xa5 \xde\x90\x04J\xbffh\x85\xc7"P\xdbi\x19\x13\x00\x8ae-\x1a+\x1e*\xd5\xddE\xa3OT\x0cr,\x95h\xd7\xc1u;\xde85\xfe\x15\x93Q\xf4/\x0b9\xed\x8em\xb5h\xe7\xcb\xfej\xcd\xc7VclBNy\xd9\xdf<Mv\x81[\xf4\xb6\xbd\xaa\xd6\x8c|\xd4\x02<[uzRm\r\x987\xb1a\x19\x89"\xd3Rm\xef\xd9\x06!\xe3\xdb\x05\xfd\xb2\xbb\x8dM\xd2\x87\xc2\x05a7D#K=\xd7P\x04L\xc3\x1393\x97\x1b\xef\xc6L<\x95\x86S7\x89\x9c\xb2 \xc0w\x00Y\x97\x04{n\x906wy\xc0F\xb3PDFi$\xd3\x84\xb8\n\xc8p\xc5}\x94\x84\xf0\xbcgp\xf3\xb8\xdb:\xdd\xb9\xdc\x06\x16\x94\x9f:\xd0un\x0eQ\xf9\xee\xd5\xf9\x19\xe4\xbf4I\r\xce\xd3!\x94\x8c\x02\xc9\x8d\xd2 \xa17\x96\x86\xdb\xec\x01\xfa\xd8?b\x7fq \x9c\t\xe4\xfcLa\x96\xfa7pu\x8fM\x02\xb8\x12\x96\x88?\x01\x1b\'?\xe9\xd3\x10n\x1c\xc4$&\xa6N\xec*w\xe6\xc7\xacM\x94\xd4o\xc0\xdf\xe6k\x9a\tAa\xbf\x1f,\xc7\xad\xe2>\x01\xa6W\x03\xc7DZi\xb9Y\xb3S\x1c3<\x9b\x04@\xb9\xd4"(Z\xb1\xf0\xfcv\x065\x91\x08\x0e\x00\xc7\xf3\xd6C=T\xc7\x90[Y\xb8\x88\xf7\xaa]\x99N\xb9\x06.5,\xa0U\xc8(\xc5[\xfe4\xb3\xbd\xc6\xac\x9f\xe5h\xc5kL\x0c\x03&Q1\x06\x0e\x0b\xd7\xf9\x10_&\xab&\xf4\x95o4\xfc\xdb\xb8\x7f\xba\xdcC\x1a\xf0@\xb0\x8a\xb2<b\xc8\xe60\xce\xfd\xefh@,a]\x84\xb86K:\xf3\xcd\x92\x98:\xf1}X\xf3T\x83*\x82r\xe2\xd1\xe5\x97\x9dB\x00\x8c\x9bxu\xc0&\xda\xf8\xf0\x80\xe6\xabD\xd1=\xdb\xbe\x18k#\x17W\xde\xc3\xc3\xea\x8e\xd4\xa6\xcb-\x1d-\xcd;\x12I\xa1\xf4\xeb\x1f\x1d\xb6H~\n\xba>\x8f\xd4\xc3\x8cM\xc2Uc\x8eI\x81\xf8e\x83\x1e\xda\xf8/T\x06\xe5\x92\xf2D\x82m\xb9Z!\x19T\xd0\xd5\xfe\xabL0C\x92\x122\x10n9\xb6Wv\xfb\xc8\xf8\x05\xef{\xd9\xf0;\x84j\xa9\x8e\n\xd6\xb5;Oa\xd5\xc0\x92\x15:\xc8HY\xf6\x0f\xc6-\xec\x9eD\x16\xa5\xe0\xaa\xae\xf6\xa7\x80\xfabB\xff)C\xbc\xa3\xef\xb0B\xeb\x02\xfd\x9f\xefY_\xa8\xbe\xf9\xcf\xe5H\x97:\xca\xf7\xdc\x98\xb3^V\x8b]\x81\xaa\x80\x86\xc0\x8b\x90WF\xf0\x14z\x9c\xb3BLVu\x87u\x14\xce6\x82\x7f\x8b\x07S\xf0\xb8\x05<]\xf3\xe1\'\xae\xad\xd8\xf4X\xb3a\x14\xe8\xba\x14\xb8`\x0b\x0b\xe4\xd9\xc3\xa0\xb5\xc4#\t\x8e\xf4\x9aI\x02)!-\xe5g5\xd5&\x19\xa2\xe3\xc2@ \xd2\xfa\x12C6\xb7\xf5\xc5\xb0\xa0\x87\xba\xfe\xb5gi\xf7\xdf\xc7\xeaZ\x12\xb3A\x82#\x1b\x86\x90*Ci?\x07@\x17\x80#\xe8\x10\xb9[\x89"\xa1CGO<\xb5\xeaU\xeeg\xd7\x9dKG\x1d\x92\xecq\x07\x14\x8d\xe8\'\x03\xba\xc1\xc3\xd7\xb5\xfc\xae\xeb\xb2in9\xe7\x0b\xd5G\xb2\xb0\xf8\xc8\x93\x11\xd9\xa4\x11?\xa5\x88L\xd6\r\xfci\xab\xc0}V\xae\xdarZ*\xc1}YI\xa6\x88\xa82\r\x17I\xd3J\n\x9c@)\x9dmu\xa3$o\xdd\xb8\xf2\x19\xd2\x9c\xb8\x1d\xfcB\x9c\x08\xd5d\xc6\xad+\xf3\xf3\xba!>\xae\x88\x91\x04\xf8\xb0}\\\x17V\n\xf6Wa\xad\xf7\x90\xaf\xb4\x1cI\x01\xaf\xda\x89\xf8\xe4&\xb1\x0b\xdfHz[\x9c\xf0\xfc\\\x8aHP\x14\xdc\x17\x9c\x89@pI))HI\xcd\x955>\xe9w\x1e>\x15T4<\x80\x00\xd1\xd5\xb9-3\x9e\x16l\x96S\x13\x1c\xc7H7\xcc\xbdf\xac\x9aU\xc5\xcbmE\xbcE-\x7f\\\xaf\xd8o\x04z\xa7\xccq\xe0\xf9mI\xc3\xa5\xa3\x93<u\x0f{N\x91/L\x94\xe5\xde\xea\x1e\xa136\xab\xd0\xbf\x8b\xd2\x8f\xf9%IX;\xc6\x11\xbdu\'\xce\x98\x84\xf8\xcc\xe5N5\x96\xee0_\x9f\x93D\xb0\x89%\xba\xbe3\x1b\t\xe5\xd2\xc9\xc27&\xa41\xb0\xd4i\xc5\xc7\xf7\xdc\xe2\xb9V\xce\xc8\xd5\xa0\xc9\xaf\x1f\x9d\xf5\xd7=F\x7f(*\xc44\xf2\xda\xd0ow\xd34\x1cP-0\x8d~\xaa\x89\xdc\x11\x82{\xec\xc5+\xec\xf5.,\xbe\xd5\x84u\xbe\x19\x1f\xf4\xa6\xad k\x98]\xbe\xbd\x14!\xd5\x99\xf3\x96\xd3\x9d\xa9\xdac\xd3:\xd4\xf8\xee=\x01\xfb>\xa5\x9a0\xc9\x9eK\xdc\xf7\xc1\xf8Y\xb8\x8f\xf6\x88M\x9b\xf7,\xf2a\x9e\x00\xcd*g\x02\x06\xe9\xc7h\xd5\x92vJ\x7f\xf4\x9a\xc5mO\x1b\xb0\xfb\xcbLNR\x8e%+2e\xae\xc2E\xa1|Z\x82P\x86\xe3\xf7 \x1e\xce\xe1\x1d\xb8\xcc\x97\xdf\xfaJB@ \xb6\x01\xe2-\xe5\xe3v\x93\x81\x0b"\xfa\xe9O\xdd5\xc7j\xd2b\xf6=\x93;\xc8t\xcf\xfcn{{\x94\xd8\x9aB\xe4\xf9\xc5!\xa8\xe6\xa0]k\xee\xc9\xc5!-y\xe8\x01\x1c\x0b\x7f\xc3\xe1\x93\xe0\x8f\xae\xce$N?E\xb3$O\x0fB\x1e/\x08\xa4\xfb.\x95lk\x86\xcb\xabZ\xf8\x04\x86kr\xf3_\xf2l\xf4H\x8b\x90\xb9\xc9p/\xc8:[\xe5\x86\xdf@a\x9d\xbf\x97\xfa<K\x98r\x9fAMr(\xa4\xe4\x80\xe9+\xbf=\xffQ\xd9\'\xd1\xb4\x17\x18k\x08\x8b\xf9\x85W\x97\x8c2\xf4[b\xb1\xb6:\xda\xe78\xb9\xc0\xd0(n\xa9\x99u\xcf\xfd\x1f\xf1WJq\xc5H\xed\xca\x81\xe6%\xcc\x19r\xfe*t\xa6p\xa1\x8a\xe2\x9a\x18\x0frX\r\x8e.\xca\x87\\]\xeb\xa4I\xe7t\xe0\n\xb1PA/\x06\x8c\r\xda09\x8dg\x15\'q\n\xab\t31S\x86=\x15\x8c\xaf\x9b\x16\xedG\xaa::\xe0\xc1\xe5\xdb\x9b\x10\xbd%\x987\x0f\xff\x1a\xd0\xbe\xa7(\x82\x1eu\xe4\xe0q\x0f\x01)\x00\xd7*D\xa7>\x97\x06?X\'X3\xb1D\xcd\xce_]A\xc1\t\x01.\x86\x90\x16\xb4\xfb\xd1D\xf0\xaa\xa9\xe1\xaf\xbd"V\xd5\x9d\xae\x07\xea\x98\xea\xc1M\x07\xfa\x8c\x1b\xf6c\xc6\xbc\x9a\x82\xe5\xa8\x8b\x1cO\xb2I7\xb0\xd40j\x06Z\x97 }\x813\xc2\x16p\x93\x01\x8a:\xa75\x8a\xee/\x01\x8eT\x9d\xa0\x0fHm\nvg\x11\xec\xaf\xc8Ryl\xb0\x85%\xd2\xa5r\x0c\xeb\xe4\t\x10\x7f\xa1\x85^-A\xb1\xa8M\xcaF\xbf\x8c.\xf5\x8d\xc4"\xa1\xe8\xab\x96\xe3\xf5\x01\xc0\xe5\xbcj[\x192\x13\x82\xd2\xb8)n\x90 ;\xafs\x0f\x1c\xfe\xb2\x10Z\xbf\x98\xd1I\xf0\x19\xfd8\xc6\xd0k8\xc4I#Y\xa6\x9c7\xbf\x888\xb1\x0e\x16{\x96\xfe\xbb,\xf2n 8\xb0zs\x05\xaf\xc3|\xe6\t\xac\xf5\xc2\x8c\xef$-\xc9l\xff\x97\xad\x86\xfft\xba\xf0\x87m\x01;\xcf\xd4\xc3y\x91mf\xc8z\xf6*\xd8\x19\x02\xc8\x19B\xa4\rme\x8c\x90\xb0\xdc\xfe\xed\x9dU\x9e\x19fW\x1d\x93r\x1c\xa0\xaaAJ\x8d5\xda!\x85?\xd1\xfd..\xebG\xb7\xba\xc9\xb6\xa0>\xf6\xe4\xfd\xa1\x18\xee\x9fCV\x18\xec\x01\xf1Rs\xb0\x98k\xf0\x9c\xc5\xaef*\xfa\x7f\xb1\x93~\x1c\xd8\xc0[\xe5\x8f ~\x10\xa5\xf2\x00\xf04\xc1\xed\xbf\x1c\xcb\xfa\xb3\xcd\xa0\xfd=\x87P\xc1\xa5s\xbd\xf6a5uu\xf8\x0f\xac\xa5\xeez>~\x0e(t\xad?I_\xbe\x9b\xd7\xa1\xbf@\xf0\xbd\x13l\x18\xdbi\x0e\x97\xb37A\xe2\xf4v>\x1b\x11sE\x1f\x8chU/\xeb\xa0\xb4a\x7f\x9c.\xac\xc0\xc9\xed\xbd\\\x17\xa6^<\xe7~>\xc8\xa1\xef?\xb8"9V3)(\x84I\xb9\x90\xef\xb4\r\xa4\x12P\xc6W\xf9\x7fU\xb9M|\xf4\x8d\xd5\x9d_\xcdQ\xa1\xdd`\x06L\x99\xe9\xacU\xc2\xfd\x15[\xe9,\xb2\xa4\x9e:\xac\xb6\x13\xa5/\n2\x1f\x91|2G\xbb\xe3\x8dt\xf9=\xd2.G\x85\x0b\xaf\x1d\x98\x05\xde\xa0\xe8@\xb4\xc8\x03\x80\xf9\xbb\xc9\xf5\x0bB\x94\x83\xd8:\x1ea#\xad\x18\xff\x19\xd1\x10\x10\xb1\x8d\xcc\x1c\x08\'\x1c\xef\xd9\x17\xd0\x16\x02\xc5\'\xa8\xf7\xbd\x02V\x0e\x15\x87i)\x95\xb5\xbf>N\x8e#\x01c`\xdb\xf0OP\xca\x11?\x96Tn\xdame\xf0:\\\xe7.\xb44\xc7)}\xb9.\xa2M\xe3\xa5\x82\xe1\xce\x9b\xea\xd0\x04\xe6\xb3\r\x18\xe1\x86\xea\xec\x8d~m\xad\x95\x17>\xe6\x9a\xc9\xa9\xae\xbf*#\xc8Oo\xd3\xf7\x01\xdfkx\x8b\xd8l\x80\x14W\x8d\x1c\x87\x9e`H\x94\x00\x92\x03\xe5\xbe\xafr\x9a`\x06,\x0c}@\xf4\x94^\x01\x131P\x04\xb5F\x8e\x0c\x98\xef\xdb\xf0o\x13\xffE\x15*\xbb\x92\xadwL]=7\xc6{\xb9A\xed\xa7z>\xdc\xaa\xa1~\xd2\xed\x02[0<\xad\xf8\xd4\x98\xb4\x99\xee\x8b\x8d\xaf[\xd7\x98o\t\xbf\xf6\x0e\x14\x19\xbfaV=\xf3\xaf\x00\x82\xc9D\xf0m8G\xd87OJ\xe9\x19>\xea\x1f\xc7\xbb\xbbddK\x19\xe5\x8f\x94\x00?\xf1@\xdd\xe15\xf0\x02\x16\xb4-\xe5\x06\xc8\xb2hA\x03\xd4\x1c\x85\xe6,q\xa3:\xb7OS\x1c\xd0\x01\xaa\xbd\x0f#\x98\xfbA\x9f\x05\x88*\xd5\xd5\x0c\xa2\xd83\xabEz\x17/\xbd\xfb\x19b\xe0"\xe2\x10%o=D\xd6\x1acl\xe6t\xc0:^\x889\xf2\x12\x17_5\xb5\xf9Oq\xe1E\xfaF+^\x14\xfa\xbb\x98\x9a\x86h\x95\x19}>u\x81\x12\xaf\x96\x18\x9e\x81\x94\xff\xe3\xbbe\xd0\xd4\x14\x16\xb3\xe7\x06t\xf7h\xe3Z\x93 \x11\xa7\x87(\x86C-\x18\x06.\xa0I\xd4\xee\xca\t-[\xc3_\xe6\xc7\xc2\x1cl\xbf\x13\x94@\xd7\xc0LY\xd1\xec\x1d\xd6\xfc\xe0\x83MT\x04\xd5\xd0m\x11\xf1\x86\xe5\x00\xe3N\xf9\x1f\xbc\xba\x94\t\x07\x84|f\xb1w\xe16d\x12KF\x8b\x1cf\x16_\xefXg\x12\xfc\xbe\x0c\x8ae\x1f[\xcft\xc9\x1d:+\xa1o_a\xc7\xb5\t\xde<\xcc_\x15_75(]\xa3\xa2hl\xdb\x17i\x98|M\x11\xdf\xf4\xd5C\x8b:\xdfq\xe4\x9c\xc9\x91\x7f\\\x0b4\x1dA\xfb9\xb2\x9fc\xc1\x01V\x98[\xa9\xc7\x81\xa8\xe0\xc47\xe7\xd1\xf1\xd0\x19\xb6|\x84G\xb4pf\x91\xaf\xc68q\xd3\\\xfd\x15\xf5qT\xf3\xb4\xb1\xbc\x86`E\xe8\xd5ZEB{\x06-\xbd\xcd\x06\x9c\xec\x1b\xa5\xdf\xfd\xe2\x1f\x0e\xe7Rjl,\xb2\xc3a1\xecn\x0b w}\xb7\xdd\x19\x83t!\xd9\xb48\x99\x04\x0fL\xe7^\xa8\xdeT\xa2f\xe1\x97.\xe0LE\xd3K\xfb\x14\n\xbfakz\xf9t\xd9?\x8a\xe2\x92[\x8f\xac\x7f\xd1\x04U\x02[\xd5N\xd6\x04J\xffm+\xdb\xa7\x94\xf4\xf4\x94Z]\xd9\xf9\x91\xa8g\xa2\xb5o\x1a\x99i\xb7\x1e)p\x0e\xc4\xd2,\x82\xc3\xb0\x9aj\x05\xdd\x11Q-2D\xd9\xc7\xe2\xefC}/\xa0\xe8\xd2\x0c\xfekwX\x05\xc2\xc2\xb4}7\xa3\x03\xc8\xb7\x1e\xc2:b\xed\x98\xaeEKF s]\x87\xd6\xbe\x90\xaeH\xb1\xa6\x8c-\x10\x860\x9cD1t\xfe\xa9oJU\xcci\x96\x19\xd9\xab,\x12R\xe8\xb9\xce\xa5B\'\'\xb9g\x8bw\xe7U\xac\x81\xc7\x83\xcf+\xc2>\x1d\xa2Q\xba\x1e7\xf1\x9a\xcf\x97x\x04\x1c\xe9%\xd4\xd1\x1dG\x1d`&c\xb0r\xc0\xb1\xa5K\xb7\'\xeeh\xe4\xd62\x0f\x833#\xe3\x03\x89Ri\xac\xf8\xf92Vgh\xcc\xb3\xf2\x9ex\x8c\xc1$\x1e\xde\xf2[Q\xbc?\x9aK\x16pW%I\\y\n\xcc\xb7\xd8\x8e\x0b\xc7\xd5\x176\xd6\xf6;\x94\x80\xc0k"\xc2\xb5\xe0\xc4\xd8\x8b\xa7\n\xe6g\x88\xa2{\x9c\xe2\xe4}\xfc\x9f\x99\x03jXE\xcf\x9d\xfc\x14\xb7\tc\x06,t\x1fye>\x95"\x84\xc3\xb9\x04\xa2\x05\n\t\xbd\x1d\x95\xb8v\xa3\xb2\x8e|\xf7\xb8\x9a\xe1\x14\x13 \xd200\xedu\xdf\xe6l{f{$\x8f\xa4\xf6\x1f\'z\xfc%\xa0=\\\t\xc8\xa4\x02\x11\xc6\xa3\x97\x03\x05\xb4\xf2m\xbc\xa8\xdf\x06\x82\xac.o\x10^Y91\xb4\xc3\xdf\')*S\x13\x8d\x98w\xde\xfaY\xb0b\x00\xd2t\xe2.\xa0q0\xf9S\xf3\x1es\xe7Dt\xb8\xc0\x1d\x86nun\xdc\x16,D\xd4\x8d\x87\x8b\xf3\x81\xbd\xa5;I\xe45\x1ei\x10\xc5\xf6\x08\xfa=\xf29\xca?G\x15\xe8\xa3\xda\xc6\x06B\xbf\xa6\xc7\xc5\x8dZ\xb8l_p>\x13^Syd\xce_\x1a\x06\xadT#]qKq\x99\x87\xe6\xd8\x943\x19\x95Fy)\xbdv0\xc1\xc5\x8b\x90\xe9\x860mR\x9a~\x04\x04#e-\xed\xea\x1a\xf5\xf0D\xfe\x9dK\xfbo\xf0tTa\xb2\xe0\x04\xc7q\x04\xad\xa1\xc0 \xd5/\x15\x12\xd7n\x8b\xc9\xb6\x84\x89\x1e7N\x7f!\xa5G\x1f2\x0eO\xa1\xd1\x95\x18\'\x7f#\xe7`^\xc9Y\x84o\xe8\x9b\x7fbO\x9e\xb2\xd0:\x16\xca3\x0c\x8b`\x14\xc0\xd0s\x02:\xe8\xd8\xe2\xdaB"\\=W\xcc[\x10\xed\x85\x84i+[\xab%\x08\x08\x83\x19\x1f\xeagK%\x82m\xf5\x01\xeb\xb2:\xce\x8b\xba\x1cb9\x97\xf5\x19K\xfd@d\xe4\xd9\xffU\xa2\x15\\>\xcbe\x96\x08\xccH\x02%\xbb\x88j]T9R\xe9\x02\x05\xfa\x1dB\xdeH\x13D\x98\xb3\xef\x96\\\xaf\xe7\xe6\xd59\xa0h\xe4\xaf\x7f\xcd\x96\xf4\x7f\x19kQaN\xd7c\'\xb2\xd9R\xda719\x13_$c\xbes\x8d9\xc5\xf8\x17nFs\x96\xd1\x19;\xce}\xa5\xb5\xcb\x7fJ{\x95?\xa9\xf8\xc5`f\xb3n4\xf8Ln\xc2\xc7\x9cR\xc8\xfc\xd4%\xf7\xb1\xb4\xf6J\xba\xd3\x8c\xad\xa6\x17\x96\xad\x94\xe5\xb4Py\xe8\xf1+\x01\x86[;\x99\x0c\x10\\\t\x15\xd9gq\xe9\xa6\n\xc5\x90~\xb6z:A\x91D\xaep\xfaq9\xbd\xf0Ijw6v\xc3\x90`\x88\xa5\xf2;?-\x91\xcf=+\x1cMn\xe7\xa1\xea\xd7\x82\xe5r\x121\x0b~\xcb\x12Hm\xeaF+z\xc4!\x82ea[\xf8@[\x0e_\x12\xf9UllO>\xaa\x1fu\xc8\x89\xe7%\xfc\xd5:\xa1\xc3\xc1@\xfc,\xaf\x92,G\x87E\x80Ht9$\x06x\xb8\x15\x8aF^i\x1a\xe2\xc1\xc7Ag\xc5\x9d\x0b\xda\xec\x83\x14\x05H$_\x8f\x8d:\x8c*;\xb1\xc9\x93&k\x1b\xa7\x0eH:6\xd4\xcb\xa2\xf7\xc8\xf7\xeb\xfc\x01O?\x0e&\x864\xa2\x89:\x07L=\xb0x\xb1\xf2\xcf\xe0Z\x86{v\xe6W\x9b\xf6\\\xa3\xb1X`\xaa\x07\x824u\x07\xb5\xe2t\xf7\xa2\xc8\x8b\xff\xf3P\x9bbv\x0b\x01}\x81\x1a\xb6f\x0f$d\x97\xd76\xaf\xd4\x85r:\x9f2\xaf\x84\xfc\xc7\xa2\t#\xe0\x8aU_\xa7\x016v5}k\x1eh\xa2>J\xb2\xcba\xc2W+\x13%\xa3]\xdc\x00\xf7\xd0\x9a\x83\xe9\xc9\x90i\x10\xbb{\xf5\r\xcf\xe5\x9a&\x01\xb8\x89r\xc6\x8c\xebV\xf4x\x9d\x07Rc\x15:\xc9\xd1\x19\xf1\xc7\xa6\xce#2T\x05#\xab\xd3K\x9b\x14\x10\xfc\x03y`\xc4\xeb\x81\xa9\x81\xe4\xe0\xefG\xee2\'$\x9c68\xbf\xa0b\x97\x1c\x180\x1a\x05\r\xf9=Y\x03\x02\xa7\xe1\xcf\x05\xf5\n\xf2\xaew:\xeb]\xb1es\x0c\x0c\xed\xa2/\xb1\xd5\x0cK\x8f(\xee\xc6\xa00\xb9n\xed\x16f\x8a\xec\x91T\x02\xe9\x04N\xe4\xd8\xda\xa7\xb8\xccc\xd6o5\x96|\xf85\xe7\x06\x82\xf0t\xf1\x90n\t\x1bJ\xccR\x8c.cMJ\x10Z!\x9aR\xc0jP\x17\x7f\xc2\xcdU\x95\xfe\x8dA\x0f\x99\xd2\x98\x8d|\x0f\x06My\x04)`\xadn\xa2>i\x87|\xd6>\xc4\x1b\xc3\xa9\xd4A\xa0\x8c\xab\x18\xecq\xfa\xf1p\x9dc\xb5\x9a6\x10\xa4AWG\xff\x10\xbf\xce@c\x9a:\xd9M\x08z\xa26\x16\xbbk2bp\xd3\x1f\xa7\xc4\xd7\xfb\xdc\xbe\xac\'\xc1y\x13\xa4\xfe\xdcd\x11C\xae\xe4r&\xe5%gb\x1f\xb9\x1b\x81\xd7f\xb4\xd5\xfa\x052\xde\xfb\xe0q\xbb\xe8\x12M\xc8\xb6~\x16\xab\x81T\xe6/\xc5\t([HV\xd9\t\x1a_\xd8xp\xb0\x86\x17\xb5\xf0\x80\xc4FD\x1cqv\xcf\x8d\x84\xac\x98\xba\x7f\x84o\xc3\xd1VJ\x08\xa9\x9a\x7f0\x0b\xa8M\x98\x1fE\xd6*\x7f\xe4\x06\xad8\x97\x90\x13\x15QkL|\x1c\xa3>AZ\x84\x17?tm\r:/\xad\x1d\x9d\'\x87H\xb6\x02\xcd\xb7\t\xce\xd4V\x04Y\xbe\xb2_\xa3\xde\xfd;\xb6q\xc5*\x040\xaf\xe0\xffn\xbf<@\tax\xda\r\x14t\x91n\x1c\x90\x97\x14\x9f\x06F\xda\xf4\xd6,\xc1\xfa!\x84\x97g\xe5x.\x0e\x06\xc7h\xe7:\xc7u\x16\x9c\xf8\x16\xc5\xdc\x06\xb1\xc4\xa7\xd1;\x86\x86\x13\x14%\x08\xae\xa6\x14\xa5\xcbm\xb9\xe9\xc60)>r<\xb2\xc2w\t\xd1\xdb\xc7\x8c\xa0\x0c5\x04\xdem\xd7\xe2b\x90\xb7\x9e\x91Q\xe7pn/\x96\xff\xa9\x02\xe0\xc5\x00\xa3\xd1~\xefr\xc5t*~t\x7f6\xcb\xfc\x1fx=\x8e\xd0&\xca\x93\xb4\x93\xf6\xce\xd7E{v\xfb\x02\x03\xbfp\xce]\xbc\x87\x89D2\xdbUF\xd4\xe2\xe5T}c\x99\x18\xc6\xd1\xe4h&\x14\'f>\x06\xad\x81\xbf\xdb\x10\xc8\xff/5\xaab\xa0x\x93\x86\x10\x9d\x82\xf3\x89V\xeb\xa0\xf2\x1e\xf0L*(\xc1%\xba"\xac\x17\xb7\xf3S\xfe\xe0\xc4\x8d\x93\\\xc8\xa4\x80\x03\x94^\xba%\x7f\x16jZf_\x86?\x92\x86\r\x0c\xe0\x9f:\xa8+\xa1RQ\xe4\xf5\xa6)e\xd0\xe9\x11\xed\xff\x92\xef\xa6VF\x92\x1a"?\x97\xa0k\xcbc\x14\xf2\xcf\xcbC\x84^\x1f_e\xe5\xc52\xdf\xf2\x80\xa80C\xe3\x15\xa3\xec\xe0%g\x94&-\xbb\xe2\xcc\xb0!\xbc\xa6\xfan\xf3\xf4`\xe9\xba0fM\x15\xd3:\xadI7\xa4\rUa\xc9\x1a\xc5\xd9it>\xde\x1bCsw\xcev\xb3P\x89iIB\xd1_\x99\x85\xf1lw\xcb\x15\xa7\xdf\\N\x88u\xceM\x19\xa1\r\xe2\xca\xff\xa4\xb3\xcc\x93\xda\xca\xde\xc3\x920\x14)]\x89\x08\xebFl\x1c}\x80\xc5\xbc\xc0\xa6l\xc7\xc6E\x08X\x17\xef_#\x1d\x1f)\x82\x01G\x1bP\x94x\x1a\x7f\xb8\xfcn\xd2\xe8\x8f>?Vj\x9eh\x10\xb5_\xa0\xaf\xdaa\x99\xf3\x17\xd9\x88%\xbc\xe4\xa3\xf4\xc9}\x1e\xea*`\x15\x12\x81%\xaa\x11\xf0e\x95\x06\x85\xd8x\x07\xc0`\xeb\xeb\xfcP\x9dK\xb7\xce1)\xb4`\x91\xfc$\xc2\xf3i\t]9\xb6\x86rg\x19\xc8\xbf\xaf(\x91\xee\x8a\xd09\x9c\x11^\x11\xac\x85\x86\x85W\x8f23\x9fsz\x1brE\xb8\x99\xb0~4\xa2g\x19\xd9\xf2\xb9[\xdb8\xf21\x8e\x98\xea\x96\x04\xc4\xe6\xe6\x00\xb2E\x95\xe6\x1a^\xea\xf7)\xa4\x93M\t\x08KO\xacB:3\xac[\xfc\xf3\x13!\xd9\xbf\x00\x17\xf1\x19\x8a\x1e\xe9\x91/\x9c\x05S\xc5\xa1h?\xa0 \xa6\xb2\x17%n\x1d\r\x85\xecr\xff\x83f\xe85z{\xef\x14#:\x94Z\x1aS_\x9f]\xab\xe1\x94\xadS\xd7\x91J\x15\xe9(V#;sJ\xea\x99\x16y\xa6\x00\xa1+\x9b_\x86A\x84a-\xed\xa2<\x075mm\x17;\x8a\x11\x10wy==\xcd\x12\xb7\xce\xe0q\x14\xa7\xc7\xd7wB\xe2C\xcd\x17 \xb8Z\xddM\x9f!\xf61,\xb8\xd8\xdb\xc0\xc3\x19\xd1Ex\x83\x81\xdak\xd6\x939\xc7`\xf1_ Mg\xd6\xa2\x93o \xc9@QI\xee\x8b\xed\xb5\x01\x01\x98~%\xd3\tk`\xfaLn\x8a\x03*\x8cx\x0eA!\x1b\xcb\xcdc\xfeJ+h.\x13\x04\xf3 \x14\x96\xbb\xd28*\x02\x08\xcbO\xd7\xe0\xf5$\xee\x989w\x17\x1a\x1b\x06\xd6K\x9c\x87\xdf\xbc\x03\x9dZ\x86,r\xb5\xcf\xda.oU\x18\xf0\xeb\xc3r\x8b5\x15\xd0\x98\x82?_\xbbwz9\xbd/R\x8f\x89\xb4\xe4\x1eo\xa0\xc6\xe9\xe6\xf0\x10\xf7\x04km\xbe\x05q\xf90\xb6\x843\xa05tE\xa4&\xf2\xc5\x9c\x1d\xb1\'\x16\xb1\xea8&|1\xb3\xf6\x84\xe92p\x87\x1e]3\x17\xfcQ\xa3\xab\xb6\xf4\x19\x83$\x9a\xef\x8f}\xa9\xa1\xbaw\x05<\\M)\x13\xf2YUN\x02\xf7+M \xf5*\x1d\xf2\xe2\x97u\x9b8\xcb\xb7\x87%[\x18Q\xca\x075W\xee\xc2\xfa\xfe\xbc\xa6\x93c\x8f\xc0\xd6\xcd\xf1\xcd\x9b\xfe\xa2\x1f\x07\xfd\'\x91]\xf2\xac:\xc9W\x0c\xbb\x89@\x84\xa2\xa1\xde?\x13\x9e\xa8\x96y\xfa\x7f\xeb\t\xb5\xab\x07$M\xeb\xec\xea\xd0\x0f\xd4\x9d\x8d\xacf\xf8\xee\xc6\xcd\xd3\xec\x19Kx\xd4\r\xfc;\xb6?\xfc=\xfdOJ%X.\x9e\x93\x88\xe64:7a\xe7\xc2\x15\xb8P"Q`\xfc\xb0\x94 9\xab\xb67\x82\n\xd5\xa2\x89\xf5D\xb8w\r@j\xab\xd8$\x16\x0f:\xfe\x98\xed}ng\xae\x0f\n5:T\x02\xd6\x0e\x15\xa0I)+2A7\x8bNn\xae<Xd\xc2\x18\xc3=O\xa2Y\xe7\x00_z\xea\xb1vv!u\xee\xec\xba\x01\x9a;\xf8x\xe9$)\xcfS\x0b\xd3,\xd5&\xe0\xc3\xb2$X\x0fR\xcb\x80$\xefo\xce\xe5\xf7\xeaxe\x01N\xc3\xad\x9b\x16]\x08!\x08\x05\xde1W\xadr\x8d\xae|\xdab\xc3\x08\x8cA}kvdL6\x13\x98c\x80\x95n\xae\xebZ9\xac\xa0!qKP\xaf\xd2\xfd\x1b\x95\xa1\xce\xce\r\xd0(\tI\x88\x0c\xf1R\x9d\x08it\xd8,\xfa#\xd4\xe7\x1f\xa7hG\xd3\x12\xad\x8c\xe0\x1e\x85\x805Ia\x154\xf8e\x8a(\xf7\xba\xc4\xc6\xcd\x17v\xbb\xcd9\xda\x7f\x0e\xcfXm\xa4\xa9#\xc2\xac\x7f\x8f\xe6\x1d\xd2\xfa?*\xe9\xe7\xb8\xce\xed{\x8e\xa8dw\x03:\xec\x87K\xe1\xc1!\xc2\xd3\xba+\xa2\xcb\x0e\xc2\xe6>\xf2\x1aV\x11\x19\x89\xfd\x90\xb4\xa1>\x02\x8f\\\xa2H\xe2t\xcc\xa40Q>\xe5\x9d\x0b\xa1\xd5$O1\x88\\\xa0%p\x98\xcfH\xd7\xc0tS\x83\xbbA\'5KT\rP\xc3G\xd6\x889\x8d\xa6\xec\x8d\xf0\x8b\'\xc6\xa5\x98\x92\xe1\x9f\x80L_\xe5\xad\xfd\x12\x06\xea1A\xaeX\xf2\xd7\x8f\x9f\xd6\xad>\xefr\xbfy\xf1u\xab\xabO\xe7\xa3g\xf1~!B\xb9\xf6\xf1\x17\xcd\xb2\x10]nl,jUV\xcf\x0c\x16e\xff;\x88\xcdUYf\x8d\xef\xa3C_\x947\xac\xa0\xab\x80Fr\x8e/S\x89\xd3[\xbc\x9fZM\xc0\xd4\x91\x8ap5\xf5\x9d\xd2\xa8\x0e\xf6\xd5\x87c\xda-y\xa8\x02\x19&oC9\x04\xa8\x11\xe2e\xcf{\xaa\xd7\xa2KT\xb2\xe8\xb0\xb4\x0fo\xc0`\xf0M\xe3\x91\x7ffI\xc1q\xe3)r\x17D\xfeL\xba\xda\xa7KY\x85\xac\xe8\\\x1c\xabf\xef\xdf:(\x9a\x15\xf0,\\b\\\xb9\xd5h\x8e\xed\xba\x91@\x16m\xf8_\x00\xfe\xb9\xdd\x03dj\x0e3\xe2\xc0j\xe8\xcd\xcb\x00\xf7\x97\x9b\x91\xf1\x1c\xf6\x0b\xe3,\x04b\xc8\xf8\x97\xcc\xb8M\xe5y\xf6\xca\xe2\xde\xd7\xf8\x1d\xafC\xde\xd7\xc1\xa8l(\xf4\xf1\xba\xf8n\xdf\xcb\x11T,\xe9\x1bk\xf5O\xfd-\xdd\xa4PX\x0b"\xfa\xc9\xcf\x8b\\sp\x81\x95o\xfeWD\xe8H\xfc/\x0e\xc05i+Q\xef\xe0@\xf2\xaa\x94\x15\x186{`4\xb1\xa4\x99\xea\xca\x1b\x9c\xbc\x00^1z\x19w\x14S\xe4\x8fPS\xaf(dIP\xc0L\xbc\xc3(\xa3\x8d\xe2\xfeQ\xa7\xb32z\xea\x81\xd9\xce\x82|>AOU:\xdcj\xf1C\x15EI\x9b\x13x<U\xd3\xf9\x8b\xdb]\xd8\xe1\xeb{Q\xf3\xb5,v\x08\r\x9a\xb7\x12\x17tU\xdc\x87k\xa5\x92\xd5J\x9f!\xfe\x880\xf0\x8d <\xaa#\xcb3\xe5\x0f\x08\x02=J@\x12F\xe3Qp\xec\xc66\r\x97\x8f\\!\xd1\x93\xad\x8c\xf0Aa\xc2\r\xd3\x1e\x7f\xa4E4\xa8\x98\x11\x9f\xec\xd4\x1c\xfc\x9d\xa1\xb0Qo\x99\x88\x89\xf5\x92_\xd2\x11\xe8[\x01rTT\x99\x05\xa9\x8f\x9bK\x9d\xfa\x84\x94O\xea\x81?&\xe6\xee\x82\xbb\xcfp\x9b\x87\xd4\x9dX;\xa3`\xae\x16\x9f\xben\x8b\x1fu \xff\x913\xf8U\t7\xba\x12\x11\xeb\x8a\xbe|R\xc8+5GX1=\x15\x1f\xa7y\x06).\xc3\xd28\x88/F\x0c\x84\x1a~emw\xb8Cp\x90.\xb3\x1c:\xb2l\xf1\xe3\xa4\xa1\x93\xd9\xb8c,x\xecL\xef0\x8b\x93\x89/\x8b\xa9\x81m<r?\x1b\x0b\r\xbd\xdc\x92*\xd9\xe3\xc1\xeds_\xcd{\xaf\x93*\x9e\xce-\xd9\xbb\xd5\xbb\x19\xda}"w:\xa4\xacf\xf6\xf7\xed\x83\xa0c\x11\xf01Z\x97\x80\xe9\x00\x8b\x1a5\x99\xaf\xf1P\x06\xffKK\x8fw\xd1\x9a\xd1\xb3X\x98hN\xa8g\x80\x14\xfc\xc3\xffD\xd2\xf0\x9eOy\x90\x1c\xa7\x85\xf8Vqa\xa1\x8b\xc4\xd54\x82U\xd9\x0bw\x10O\x80\x99Ar\xd9\xe1\xaa!of\xf2\xd8\xfc\x9ff\xc92\x9d\xb0\x8cKN\xc7\x19\xd1A\x9d-\xb1\x96\xeb\xc2\x0e\xc7\xac\xbe/\x80\x7f\x9fQ\xacZ\xae\x1f\xb8\xd6\xec=\xf9.)\x1c\xa0-2\x142\x0b\x1c\xfeP\x8f5\x92I\x00\xf6\x91\xd3:\x96\xdc\xfb\xee\x8d\x7f\xd5\x13\xaa\x87b\xab\xa4\xca4\x98\x85\xf0\x08\xbf\xa6\xcf\xae\xd3y\xf3\x97\x12\xeeR\x1b\xa7a\x9a\xe9\x7fd\x98^\xe9\xe9\x8fv)\xdf\xe6\xf1\x90\x8d\x9a\xc1\xacN\xc1UZ<\xd9WA\xed\xc0\xe9\xb5pI\xf7\xacn\xc7\xe56\xbf3\xd2\xf0\x07\xc9\xa7<C\x1a\xa7\xdaZ\x07\x8e\xbdx\x15\xe8\xd7\x10_\xda\xc5\x99\x99\x9eWgh\xe0V\xff\x162}\xef\x8e-\xe0oB\xdd\xa0\xcb\x93\n\xce\x83\xdb?\x8a\x04\x8a\x19C\xba\xf9\xc0\xac\xf6w5\xb4E\xd1\xcf\x82C\xb5U\x00\xf8\x1f%6\x0bd|\x03.\xa4\x12\\j\xac\xb8\x05\xff\x01M\xd1\xce\xf3\xd2\xf5@\xf6\xec\x95\x18\x1d\xa9\xb9]\xd9\x1b\\\xfc\xb3\x8b\x1f\xfe\xe9\x1b-r<\xd7\r\x11\x1d\xd8\xf0\x16\xd3Z\xa6\x1aP\x05\xa9I#\xfak\xb9\xfd9\x18\xd3<A\x13\xaa\xfc\x19\xa9y\xbc\x13+EQ=&\xe2\xd2\xcdV\xd0\xce\x95\x89\xf9\x94\xff\x15\xfe&\x8fp+\x1cn\xc6\x15\xa8\x1dH\xdb\xb9g-\xff\x10\x07\xafhkd\xbdm\xaf3\x01\xe3\x15fK\xaa\x8fG\xcc\x82("U\xde+F@\xf5\x03\xd8\xa4\xb8W\x98J\xd3\xbfK\xc1\xdeg\xe3\x8bA\x10\xa1\xf3\xa7\xae\xfc\x8e~\x0e\x0e\xcdq\x13+\xcc\x1b5V\xf4,\xb6%\x12d\xb4\xdc\xeaT\x7fFD\xbe\x055\x97\x85yN%R<\xaa;\xf3\xdc\xd1\x8c\x07\\\xd7[\xaa(>[\x8f\xaaZ\x97\xf39\xe0\x80\xd2\xd9\x93\xf90\xec\x7fYY\x9d\xc0\xda\xf8\xff.\x00\xb53^\x8f\xa3\xd2\xad\xec\xc7\x1d\xcb\xc1\xbe\xd0w\x06@\xf1&!\xe0\x9c\xcd\x1f~\xfe\xa8j\x88+g\x11$\xe9{\xce\tI\x00I\xa9\x18y\xcc}\xe0\x1f\xd6\x8e\xe7\x0f?*\xd8\x9eP\x1b\xcc\x88\x8c\xf8r\xdeu\x9f\x93:v]m\xda\xca\x89\x0f\xd2\xf6A\x80\xde\xfd0\x93/\x89H\x87\xa8v\xdf\xd5\x0f[c3\xb4\xba\xdf}(L?\xd7r\xcd\xff\xab8\x00\xfa!\xb1\r\x0c\'\x945 z\x94\x1e\x98\x1b\xd8!\xe0\x8b\xfb\xcc\xb0\xad[T\xe8c\x89`\x82\xc2\xbc_\x91\x90)m^&@\xb4\xb8\xda\xceZW\x1e\x7f\\\x04\xf6Y\x11 \xe1+?\x83!5\xf5Q\xc0\xcf\x01\x87\x90\x00f\xe1\x1b<_\xb8d\x1c\xb4\xa5\xbd\xa4i\x840\xcf\xdc0\'M\xd7@\xdc\x8a>\xbbT\xb3{\xa2\xdc\x1b\xe8\x9c\r\x9f{\x07\x99 \x95\x02\xb4\xd2\x7f\xc1.`8y4\xb7\x932\xfc\t\xc7|\x17u\xb1\xb0\xb7{\xfd\x18\x811+\xf02\x1f\x13\xa0fI\x89\x0e\x9f\xbc\x10R\x84cF\xd7\x1b\xd0u[\x11k\x8f(s\xbb\x19\xfb\xc1\xd6\xc9\xb2\x941k\x8a\xa0\x0b\x88`\xa9\x1b\x1e\x7f}\xc5E2\x8e\x9e\xeb\xbd\xb1H0K~\xab\x8a\x02\xe2B\x81\x0c\xe8\xa2\t\xed\xc4c\xde1Lka\xdf"{\x8b\xd4\xc5=\x96\xbc\x1fc\xf0=\x0fk$x\xe1\xb0\xd8\x96\x81\x7f\xd8p\x8f\xd4H%6\xac\xe4\xa3\x12\xa7\xc5\xe7#\xcbE\xee\xa1\xaa\x86\xae\xa9\xa4\'\xb9\n\xf7%\xb6\x1c\xaf\xef+<\xc2\xc7\x04\x07x\xc6\xbb\x02\xc6vxrB-\xfa6\xb1\x11\x93\xc0%\xb1\x0c:\xac\x7f\xe2r@\xd3K\n\x06\xae,Rf\xa9zn\xfaK\xe4\x08\xfc\xb8\xd3&w\x1f5\xe6\x07K\xa0\x805\xec\x08\xa5{x\xbc\x06\xa2\xca\x94\xffz\xe0\x89t\x9f\x15=Wg\x1b\xeb\xd3\x81\xe8\xca{\x92\xf3Qz\xd1\xc31)\xb6I%\x1c\xe6\x98`\x97\x0e\x03\x1a\x93\xce\xfd^BiYK\x9a\xb0i\x03\r\xdb\xd0uj\xd9&\x19\xe4\x9698\x17\x83\xe8u\x8d\xcb!<\x86\xf2\x8cI\xe3b?\xc61\x8b\x8e$\x81\xde\x18\xc9\xadV\\BX\xebh\xcc\x84\x07\xe6k\xfe\x03\xda>\x0bd\xe4\x11\xc9\t\xd2\xb5\\\x8f\x05\xc8\xbdD\xeb=\x9a(Bv\xeb\xb8S-\x13g\x95\xc6q;\x1f\xc7\xe3\xe3\xc7\xfc\xd7J2\xd0\xeb&o\xa0@\x07\x9eP\xab\xccR\xba\xe0&\xc68\xb9\x15(3d\xed\x90\xd4\xc3\xb6\xc3>X\xbc\xc1\x93\xd3\xc3\xb6`T\x18\xec\xfd\xd3\x84p%\xbe{\x18\x97\xa5m\x04\xa5#\x101\xa1RB\xc2LW*\xb9 \x91\x1f\x1fm\x88\x8dJ\x02\xe3\xdb\xcb\x98\xec<\r\x0f\x9e\xa7\x11\xc9\x02\xa5\xa0i\xe9}\x18\x0f6\x81\xbb\x00\x99\xa9#\x80ko\x11O\x91R\xe9\xc1\xe8\r\x85\x84\xf4\n\xa9&\x02QwL\xe1\xd7\x82\t1\x16\x82\xd9$`R\xdf \xc9w\x95`\xb6W\xbd\x8bs\x86JJ\x80\xde\xb1@?v\xeb\xb0\xdb\xd4\xdc\xea\x8c\xa2\x88\x02\x90\xfc\xf5\xa3C\xb7(\x93\xf4i)k\xbd\xde9U\xea\xbc\xfa2\x13\xe0\xb7\xb2\xd6l{\xcez\x81NBI\x88-\xb5\x84<\x00a\xaa\xceu\xd9\xa1\x94-\xf69|\xdb`\x0b{ZD\xe7\x89\xef\xab\n\x9c\xa4\xbdR\x86\xc3\x99XO\x1a\xe4\xaeI\xa1\xef\xc7V\xcd\xab\xe6\xf3\xd3rByk\xf6\xfaU@\x04\x83Tc\x94\xc6b\x0eT\x03ko\x8f\x06n\t\x1dn\xb5\xb7{\xb5&\x92M\xd9w\xbeWi{F\x04\x9d\xef\xc2G\xb7\xed\x8e\xaa\x11N\xc0\x1c,`\x83\xf2\xfei\xe3h\xdb\x1a\x90s\xca\xe64d\xe1\x83\xe6\xd0*\x8e\x06A\xa9\xaf\xc3%\x82\x01\x8f9\xcbCK\x9c\xce{\x8b\xbf\xb4\xd6\x04\xf0\xb7\xef\x0c\x1b\xd3Z\x88\xbd\xdb4\xcel9\xc8\x19\xf2!\xcc`\xcfJ\xbf\xb2L=T\x08$\x81\xd4Q\x9f)F\xa5\xbe\xe2\x96\xb0\xf6\xcb\xd7\xfe\xdcF;\xc6+\xa1\x7f\xb9q\xf35\xe0\xf2\xf9"f\tGw\xc6\xf84\xcd@#\xfe\x9f\x9e\xbb\x13\xd4A\xdcI\xbc\xaa\xde\xd2fc\xa8n\xcb\t7|=\xb0\xfd!\xea\xfaI\x1a\xcd\xda\x13*2f\xc2I\x98\x15\xcf\x8d\x89\xad\xd6\x87O5\x8d\xbat,\xe6\x9b\xd3 \xc8\x0f\xa6\x8e\x89\xa0au\xe0\xb9\r$\xc3\xa4\x81\xb3\xb7\xcf0\x870\xef\xec\x80x\\+\x91r\x9c\xaa\x16; \xe3\xa2L7\xabOhv\xban\xd7\xa7\xd4F\xc7\xfc"\xbb\xe4\x8c\xa3\xe1\xa7a\x01\xe0\xf1\xb0\xe13d\x1e\x07\xf9\x97p\xb7>\x9e\xb1\x91\x1e\x7f\xf2]+\xc5\x85\xdfh\xbc:\xd2\x95\xabx\xba\xf7\t\xca\xc1\xee\xd0]\x9aK\xf5\x04\xfd\xf6\xc0\x81#7\xd6j0\x0e\xbe\x8d\xb2\xa9\xe4\x90w\xdc\xcb\xde\x9e#\xe4\xc6\xff\xf4\xc5\x02\xa5\xda1DE^_\xa3Px\x7f?\xbfiI\xe3\x9a\xf2\xef\x99p\xaa`\x85\x08a=\xef\xc5\xd9\x1cJK\x13\xcb;\xd7m\x0f\x1f\xcb\xf0\xe3\xf7%\x9a\x977\xf5K)\x0bB\xef$\xaa\xfe\x1e<\xf1\x8d\nIr\xac\xac\x9a\r\xb2\xe5\r\xfe\xb3N\xde\xef\xd9Yo\x7f\x12\x05(\xc3~\x8d\xdd\x91@c.\xfe\xc7^\x7f[/\xb6\xbcR\x00\xc8\xcbf\xa5p\xa5qEg\x8b7>E\xdb\xc7\x19\r\x97\'\xb5\xdc\xbbD\xab\xde\xa8\xc4\xd5R\x03\xce\xdb\xb8\xc2\'\x8c\x03\xbe\xe5\x03o?nk\x05.\xb5d-f\xf8\xb7x~\x17[\x03\xab\xcd\x03\xb9O\xbf\xf7\xc8\xba14id`\xa4\xf1R~\xcd\xde\xa6c\xfc/\xfd\x03\xa5\xa1\xd8\x1b!\x0cL\x86*\xd03\xb3\xf3p\tw\'\x91\xed\x9f+u\x97\xfd\xb3}\xfe^!\x90\x99\xeb\xa6\x80\xc7a\x9d\xdeSU\x06\x0b\xfe\xf9\xe2\xe2\xd5\xcc\x80\xa4N\x82\x07\x04\xcf\xd8\rls\x02::\xdb\n\xfa\xc4\x9d%\xa6\x02\xeeg\r\x0ezC-\xf2\n\xbb8\xf0\xe1M%\xc5\nCh\xd1L\xac\xb2q\xe0\x11\xdc\x9b\xf1\x9f\xde\xf4\xf4\xc8@\xb3`ep\x9a\xf8\x14(\xe4\xb7\x10\xc8\x07bvvv\xa1\x9d@\x98>B\x9at\x8b\xb5\x87p\x0c\xc6\xa43Q\xc3j\x174\xea\xc9\x0e\xb4\xcd\x0c\xe0\xdf&\x95s\xff\x84:b\xb6\x9dN\x00\xd7\x8fY\xf5\xd8\x95\x99|sBK\t!\xa9\xbe*\x17\x02\x9a\xab\xa9\x918\x85\x86\x8e\x80\xf4\x8d\xe9\x93\xac\x98^l\xd8M\x10\xb3\x00\xfd\x93\xff\xfa\x02\xa4F\x92x\xb1#hM\xf1\xc5<#|\x0f\xe3t\xa1"\xb1\xaa\x80h\x9d\xc6t=}\xf1\x8e\xe8\xf96-\xe7P\xd1\xa1\xbe\x8dd\xe7\xb8\xc0\'\xfeE\x8f\x0e0yaC=\xd4.\xad\x04^U#\x80\xe4\xe5\x00\xb3\xf3V[\x7f\xba\x7f\x89\xb38b\xfb\x9a\x85`\x19\x19\x9d\x06{\xb26\x07\xac\xe2v^)\xe3\xb9|\xcfF?}\xac}\xec\xb2\x06\x96\xc7t\xf0\xa2\xd2\xce,\xb0\x8b\xcb\xb9\x13\xb4\x96\xd2\x0c\xb2\xa9\xbc\x91g\x104\xecL6\xfe[\xf0\x87\x8a\xfd\xdd>\xf3j4\xdf{Z\xef\xc0\xc63~\xa8J\x00/\x05\x85\xb5\xb9\x89\'w\xc3\xea\xf6\nq\xd2jD{\xf61\xd2R1\x06vy\x96x_\xd8\xce\rJ\x80\xb2^"]$R\xbb)S\xe34\x17\x08+\x8bP\xbe\xb2`\xef\xd4\x8dJ\xe3\xa1)\xc2\x1e\xbc\xd1\xb1\x98\x05\xe2a\x85\x02\xa2\xff\x97C,\xc0\x0b\x8d\x99\t\xf5\x8a\x00"W^\x92\xf7/\x18\xf0[\xaf\xe7\xd1$\x04\xc8\xae\xbb\xbc}\xab`\xf7\x96\xc7!\xd1\xc6\xc1\xd0\xcdC\x7f\x12\x90\xbd5\xfavR\x8c\xb2^\xe4\xee\xcaL\xa8\xd0\x93\x19\x93cZ\xc7\xe9Q=\xa5\x8f\xb7\xe3`\xc4\x00\xa9QS(\xbe\x82\x9c\xa5\xf5[\x14\x94\xe9P\xc7\xac\xeb9<e\x84\x15\xe7<h\xecq\x1b\xcd\xbb\xa9\xd5s O\xda3\x0c\x15\xba\xbd\xec7\tC\x86\xc5\x03]\xca{\x91D\xf00F8\xc4\xees\xba8\xc7\xd9\xa8EI\x1a\x05\x0e\x9e\xc7\xf8\x92k:\xb6\xc91\x13%]\x87\xda\xb1-\x19wY\xef\x7fv\x9a\x01\x101\xa84\n\x0f2t\xb7&\x17\xdb:i\xa7xP\xa0\xe41%%+\xae&[z\x81.\xd0\xbfZK\xe2Ipn\x87\xc2`D\x07\xea\x8bW7(T\xd7.\xf8t\x13Z\xf7\x94\xa0%\x9a\x083?\xde\xd2\xcf\n\xbdbz\xe2\xa5\xb3w\xaa\xbf\x83\xa8\xae\x91\x02\xb0\x1b\xbb\xdb\x1dE\x1c|3\xf3\xfb\x07\xcb\x0f\xb1\xb1c\x99\xe5\xc3;\x84\x85\x95\x124\x11a\xdc\xa7{\xb2\xcc\xd8\xe0\xc5C7\x0c\xd0\xaa\xb4\x88\x8fp-O\xc7\x8bt\xd3\x9aV6\xfep-6\xb7\x96J\x87\xab\x00[\xf7\xfe\x03=\xb3et\xde\\D\xcb8\xbcN\x11{\xb0\x1a\xbfE4A\xd5\x93\xd9v\xab\x9b$\xa4\xb0\xf8\xe7\xd2\xcb\xe7)\x98\x96l\xe3\xa4\xe0O\x95\x9a\xd5s\xc1\x85\x90\x89\xc4\xb8\x8a\x1f\x0f\xea\xa6M\xb8]V\x19\xc39\x1cBx<\xff\x07"\xb9\xec\x97\x1dN\xd2YyZ?\x06\r\xa3{\x0e\x16\xd0\x7f\xbf2\x7f\x9fT\x83b\xfd\xd7\xcc\xfb\x94N\x18Y\xa1yR\x02\x89\n\xe5*!\x87\xff\xc1\xbc\n\x10\xea[T\x88\x0fH\xaf\x90\xab\r"\xa0\t\xd6O#\x03\xb8\xea\xb6Ja\xc4F\xa1S\xa8\xe3\xa7N\xfc\x9dZ\xe1)\x80x\xa0\xc0L\xc1|\xa2d\xa6\xf3\xddw>J0\xed|\xf214\xd1\xd2\xaaS\xa3\xe2\xdb\xb7\xc3r\x06C?[\xbf\xbd^\xed\'S;\x0b\x98\x04\xd9\r\x83\x80\xddn\xd5P \x1e\xa8\xc8VP}q?Q\xfes\xc4\x9b\x06M.\x1d8g\xc2V`,\xeb\xff\xf2>PJ\x01z\x7fAm\xe4$\x1f(\x80\xdaBf=\x840_\xed\xc3G\x99\xec)\xf3hx\xc4G\x82\xac\xd6\xfb\xb2\x0ch\x91\xf3m\x8b\xcb\x8d`\xd5]\xe8eH\xbb3*\xc51\xcf\xff\x8d\xaf\xef;\x9a\xfa+Y\x8cR\x1f\x96A\xb0\x02\xa5\xc2W\xf6iP\x0f\x87\x90\r\x18f\x08+\xc6.\x9b\x9c\x15\x95\xf1a\xe0t\xb0\xc1J)\x97\x16|\x0c\xd5\xb8\xae\x16:\x9eE\xf7\xcaU\xa1V\xa1zs\x1a<<\x1a\xa0\xf4\xab\xd5\xcc2\x95/z\xbd\xa2V]4\xbekX\xba\xae\xeanJ\xc3T\xd1/\xe8kj\xb7\xdb~WJA\xfd\xaf\xa82\xd8b\x9e\xaa1\x1avA4\xe7avO{m\xb5j\xf27t\xed\xf4\x0b\xbe\xbc\xa3\x15\xb5$\x8c\xe9L\xf8\x10\xff\xa5\xdf\xe0\xfd0w\xc2\x93\x93\xb2aF\x01\x128\rO\xac\xd1\xbb\xc7\xff\xfbg.\xc9\xe4J ?Kvv\xf4\xcek\xec/:\xe7\x12\xe0\x96\xb33\xdb<\xb7\x08o\xd7\x9e\xa5\xe0M\xdb\xf9\xad\xbb\xce\x9cL\xb4\x9ead#\x8d\xf4QW\xdd\xfd\x92FB6\x0e_\x18S\xfap\xe7Kh\n\x90u\xdc\x88\xf0\xc2k\x08\xf9\x96\xe1\xef\xe3>oe\x89\t\x81\xa0\xa8\xab\xb0\xb5k-1^\xc6V\xe5\x10K\x12\xd8\xce\xb0\xbd2\x1d}\xe2-P<0!D\x03\x14\x83+\x0f\x8c\xa7\t\xdf*\xb5L\x93A\x032l\xcc@\xc3<R\xe25\x8e\xddJ\xef\x8bU>\xd5 \xc9g\x98\xf6\xad.\xe8\\e\xfbYbo\x06\x06\xf0\x819J\xffi\xd0\x15a\xa0v\xa7\xe9\xc3\xb5\xec\xfd\xa9O\xfdT\xca`\x06\xe7\xbe\x0b\x93\xd9\x17\x8e\xf9PQ\xb1\x87\xf0\x19W0 \x85\xae\x03G/\xf761\x9b\xb6\xc4\x18\xeb\xb4\xeeS\xd2\x93\xe0ND\xef]\xef\x9f\xc5\xa8\x04oqO9"X\x02O\xdf\xda\x07\xa1 /\xc2\x06}\xb9,X\xe0\xfa\xb0nPW\xa16\x1f\x00\x92\xf7\xaeB!2;\xbb\xd5E\r\xb1\x19\xcd\xe5) \n\xe9H\xfb\xee\xaf\xb0y\xc7k\xfd:\xa8\xf5\x14\x9f\xcdU\x17\xc6\x1f\xb4\xe8\x8a\x1b\xe6\xfc\xd1\xf2)\x1f\xaf\x1d\xd0Bq=#\xf0\xd0\xc6;\xd3\x8d\xbdI)\xa4\xca@\xf5\x94\x90D\xa2\xee\x91\xb1\xdf:\xf2\xd7\x9c2\xc4\xf4\x92\xc5F\x92q\x90x\xf8\xaa\xc4M\xf8Z\xdc\x81\xd1e\xbc\x05\xces\xfd#\xcf\xd7m\xdcV**\xfd\xbd\x8dj\xbd\x9c\xeeP\xf1\x9a\x84\xf7\xde\xd4\xbe\xbb\x11\xd8\xbb\x0b\xd7\t\x80\xc6\xb47\xc0\xc1\xeaQ\r[Hx\xe5\xfd\x05 j\xaaJ\xabZ\xe7W\xcd\xba\xfe\xe0$\x90[T\x80\xa5F\xf4Q\x8c\x03\xba\x9e%\xd5\xf3\xad\xb2 \xee\xc4\x84B\xc2\x0c\xe6\x8e\xf9\xda\xe4\x91\x08\xa0\xbf\xac\xdf\xe9~\xb8v\x95\\\xf8\xe0\xda\x05\'\x13\x91>X,\x97W\x9b\x08q\xe8~+it\xcb>\x0f\x81\xf4\x05\xec\x1d\xec\xb9\x9egY\xdd\xa1zTQ\x1a\xc7[~\xcfU|`\xd2=u\x89\xe5\xf6\x05\x0b\x04\x953Z4VX\x1e\xd9\xe7\x8eC\xc0p\xec\xa6\x03B1\x93I\x8c\xe8\xbd\xf9\x99vP\xc0\x93\x15\xd4\xce\x99\xcfDl\x11\x7f\xbb\x8c\xa11kn\x93\xc2\xf8,\xbeX\xea\xd9z`\x1fOo\xba\x14\xc3k\x1fG\xbc\xafra\x16[\x9d\xe6\xec{\xce\xda\x121\xfa\xe0\xab\xc9b\xa3LR\x0f\xa3\xb7w\xc3ijX4\xf9\xeco\x17\x0f\x92\xb9\xf8\xd7\x1d\x98^\xfcz\x07\xab\x13_\xc2\\\x85rVGy\xbe\x8d?q\xacE\xb8\xae\x9d\xf7\xa1\xe1\x85J\xca\x02\xd0_\x9fQ\xb4\x08\x86\x15\xc80\xe0M\xef,"p\xae\x88@m:i^v\x05\xbdZ]\x18}\x87\xa1Ois\x82\x18\x86W\xef\xb5ylm(@<\x7f\xca\xca\xc5\xcd\xca\xa2<\xa7\xce\x0c\xcf\x87\xb0\xe0U\x87!<K\xe3\x88\xf7\x13t\x13T\xdc\xc2\x12\x97\xbe\xe8Z\x041\xc6\xcf\x89Z\x9c\xb6W\x0fAT\x13KT\x19\t\x0f\xdd\xeco&\xa9\tCX\xee\xec!\x0cG\xb1\xb8y_\x93\x1b9g\xc0Uv`\xad>\x80\xfd\xb0\xa1\x03H\x19\x0e\xdb\xc2<i\x0c\xaf\x99\x8aT\xaa]U\x04\xd1"a`\x90\xf1\xd7\xaf\xec\xdeN(\xf4\xca\x9eS\x8a\xaaQ\xbb,A\xcc\xbe\x17v\xe6v\x87c\x86\x1b\xb9\xcc\x97\xc0r\x8f\x95\x89\x85\xc1\xfc\x14\x07k\xa3\x04\x83\t\x1b\xc3\x0b\xb9\x93\xaa\x8e\xee}-\x1a\xfe\x95$\x98\xf3}f\x98\xc4n\nW7$\x14\xc3\x10\xf9\x1f\xe9\xab\x07\xc2\xd6\x94(\x9a\x1e\xdd\x02\xdcou\xf9p0`\x8d.\x91w\xb5\xcd\xa1F\x93\xbd\xba\x13WE\x80m\x04n\x16\xd9\x1a\x8b\xdd\xdbl\xf8BuK!\xd0f6\xb8\x04b\xf6\x93\x81$@\xb5f\xe4bTP\xddx\xd7\xab\x9f\xc1\xf3BdE\x14)\xb7\x06\xfd\xd7\x89\xc9\xd5w\xa7\xbd/@\x1f\xd1\xaf\x90\xfd_\x10\xd9\xc8O*\x1bENf8\x85`\xcaqQx9&6\x07F\xc9\x1d\x8e\xdaDv~0s\x06N\x9bR\x011\xa1/\xee\xab\xc7\x9d\xd1|#8}\x9bxed\xaa\x10\x85 M9\xd6\xcb]\x93\xa5\xe6\x1a\x83o\x08!\r\x9d\xda\xc7\x8c\xec\x88\x16\x03\xf3\x9e=\x08\xb3\xa1\xcd[\xfdA\xeb\xaa\xc2\x93u\xcc\xcb\x81l\xd5B%\xe7\x87\xdfj6\x9b\x00T\xb4U\xba\xb3Eq[/\xc4\xa6<2\x10\xc9\x96W\xc4\x0e\x9a\xa7\xeb\xe0\xfd\xb7\x9d\xa0\x91q\x075^\xc7c\xa1\xe7\xf7z\xc5\xd4\xd4\xdf\xb1$\xc0\xb53\x1f\xe8\x84=N\x18ve\x1bp\x1d\x08G^\x10)X\x88&\x8c\xbd\xce/\xc0>\xc2\x9f(\x8f\x9e\xb2H\r\x177"4\xa8\xa1o\xf0\x18?\x98\xe0X\xad\xce\xbe \x87\xdbR4$\x1a\xa5\xbc\xbes\xce\xd5.1=\x8f\x99G\r\x88\xc2/\x97\t\xab\xf0\xbdt\xc3-\xd8\xaf\xb6\x19\xb7\xf86\xb9\x82z\xe6\xc8\xa7O\xe5z\x90\x17\x91@\xca\xd5\xc2(/\xeaR~\x1c\xe9\xc3\xff1\xb0\x9f=\xa6\xc7D\x17^Sz\xbaDcX\xfeQ\x10\x9d\x877\x04Gj\xe6\xff5\x80\x15\xe2\xee_\xbd\xfclH@\x01\x19\x08\xbcV\x1a\xef;}\r;Y\xfdq\xf4G1\xc3vd\x86e\xd6\x7fx"\xc3h#4\xfb\xb4\x8a)jK>\xf0y\x08\x8d\xd3\'F\xf3\x13\xd9\xe0xS\xd8\xfbT\xa4\xaf\x87b\xc1\x83\x04\xacKBh\\EI\xe6\x89\x10\x80\x04\xff\x8e\x9a\x99\xc4,!\xf7\x95\x8f\x0f\xe7IV\xdfL\x00\x89\xc5\x9d\xef?4\xbd\x0c\r\xa1\xfen\x1d\xf1\x1d\xdcE\xef\x0f7L\x8eZ\\\x1e\x95Ere\xa6\xf7~\x8b\xe6\xa4\xe1\xc3r\x14\x0b\xe7<\x03\x07\x0f\xe8\x8f\xdd\xc4\xc6\x19\x87\x8e\xd1n\xdf\xefK\x16\x9a]:\xf8\xe0!\xd1c\x1c\xf7\xc1Am/\xca\x83\xf8\n\xec\xfd\x9b\x9bDE\x8a0\xc7\xb9\xb1e\x01\xe4G\xf7\x8dP\xcd\x04\xa2\xf4\xcd\xbd\x149q\xc6\xaeJ\xf6m\xd0\xeb\xe8\x80\xfb\x80a\x82-G\x06\x1dzF\x19:$\x81\x14~\xa0\xab\x89\xc4\x89\x00\x80\xed\xce\\\x9b\xd8\xc1\xfb\xf2\x0f8\x95\xb0\x91)\xad\xef\xbf\xe9\xb4\x02\xe7\xfd\x1ez\x1f\x93\xc3(\xbfE4\xfb\xb8\xfa\xa1\x1b\xabXY\xa8\xa8_\xbc\xb4\r\x8c\x8ev\x95F\x08\xee8-\\\x18\x8aQ\xb1S\xf8$=\r\xdbb\x90\x91\x9f\xd9\xc1a\x8d\x0f$\x9c\x92\xf3*\x19\xadW\x0c\x9cza,\xbe#\xe2\xc5\xe9\xc8Ot\x0e\xc3\x03\xe3F\xd3P\xcc$\xd9\x80Cy\x99\x86\xb7\xfe;\x12\xa7\xcf\xa3,\xcf\x9a\x96\x9ah\xae\x93\xc6\xc8\xf8\x04{\xebcO}zr\xff:\xe0]\xb9}\x12\xfdH\x02_\x9b\xf3\'\xe2\xeb\x9a\xadNHJ\xff\xfd\xcev\xe5A\xd6\xc4\xc3\xe41\x82K\xf4\x12\xcf\x84\x85\x7f\xde\x8ee4\x0c\xa9E\xe6\xbd\x03\xb0\xf8^\xaf\xb2+\xb2\x1b\x02\xe0wE\xff\xb0\xb1\xf7\x07?Y?\xfcp\xf7\xa9\xc1\x9e\xaa\x9d\x00\x91\xd2G\x9f\x9e\x87%\xb3F\xf1\x83\xb9\xe7\xb8\x134\tE\xdf\x8e\x97\xf9\x00\xdf\xdf\xb1\x97m\xd2\xc0\x1e\x86\xa3a\xd0\x14:\x16\x95\x1dU\x94\xdbB\xd2\xfb4\xa9\x98\xa4\x15\x98#\x0f:UN\xc5K\xe1\xc7\xd3\x96b\xeb\xd9\x99\x18*2\x82\xdc\x1eb9\x11>\xb5L\xa9R\x13`\x87\xdd\xaa\x07\x10\xc9\xd0\x96\x17\x12\xf3\xe9\xe1\xa0\xf6R4\no\xc0!M\xe0\x9bb\xfc&\\\xce7\x93S\'o\xff_\xa4\xc4\x02 \xe1r\xe4\x94x\xea\xf8\xf5\x83\xda\xcau\xa7\xcfTn\xdd\xb7\xbd_\xc7\x11\x97BzH8\t\x93p\xfbCT\xd1\xbeV\xae\x14\x18\x95\xf0\xeb\xd13\xdc\x11\x12\xc5\t\x7f\x10\x0e\xc7\xca\xc9\x83\xd2\xa2\x16i\xd7\xd9\x82\xe7s\xf8|\x82\xae\x99\xd1n\xa5v\xf4\x87\x8e\'\xc7\xdek\xa4>\xeeFdY\xa2\xf5\xae\x0e9EI\x99\xf9\xb02\x9c\xdc\xc6\x0fV5\xc6\x10|C\x82\xe3@\xf82M\x0fsTW\xb8\x9b0\'\xa9^\x9c\x0e\xd6"\xf3a\xd1U\xe8\x0f\xe3Mo\xd8\x11\x9f\xd8\xe4\x1f\x08\xf0\x1fH\xa6iS\x92-M\xf9\x91\x80?\xcaw\xca\xcf=S\x16Nc\x1e\xcb\x1a)V&zR\xba\xf8Yz\x85\xb6V\xfbN\xf8\xc9)\xd8\x80\xdd\xe2\xab\xf9\xe3f\xbb\xc7\x8f@`\xfd\x0c\\\xf0\xe9\x1a\xfa=\xcb\x10\xe9_\x96^\xab\xb5\xe2\xcfS\xe6\x8e\xea\xda\xcbuH yC\xdc\xa0R \xc5\xd6\xaf\x1bL\xc7\x11s\xdc0B\xd7\x06\xd6\x08@\x00\xb2!\xc4\xa9\x88\xb5\x81(J\x15N3\xa84\xf8\xdf\x7f\xeb\xf8\xba\xc2I"\xeb6t\xfdGJ\x9c\x9a\x9a\x92]$\xe9\xfa\x85.\xbd\x03\xc6\xeb>\x177\xf0\x01\x9a\xe0\x87\xc4B*i;7i\xec@9.\xb6\x90\xd0\xa2\x027E7:\x10\t\xfa\xbf\xdebs\xe9dE \x03\xd4%\x8e\x98\xe6\xbe5.\x15\x8a\xa1\x087\xb8\xcc\x07-\xefD\xa8=\xf0\xe2U\xb1K\x06\xe7\xc6\xd1\xd6\x87\xd8\x04\xe2gA)\x0e\'\x01\xf0\xf2g\xeb)\x88\x85\xf0\x15;\xaef<\x95Cs\xe0]\x083\xb8R!l\xec\xe3r\t2\x00\xf31\x16\x9a\t\xae\xdav;`\x95_\xd9S\xfc2\xe5R\xec.u\xac\xe4"\xe7LI\xadch\xa6\xd27-\xf9f\x94y\xd3\xdf\xc4e\xca\x90\xd6\xd9\xc5\x8e\xf6\xd2<=|\x8a\x15\xc9\x04\x98b\xc92\xc4\xb5g\x84V\xc2\xe8R\x17\xb394\xc3\x92\xc6\x8c\xd3J}\x83\xee4\x8fi :I\x17\x19\xaa\xf9{h\x95\xec/\xff\xab)\xe1\xb3}\x06#!\x00g\xc6\xa8\x9d\x9b\xda?\x9d\x9d$\x9a\xfa\x91\x0b:\x1a\xb9\x89|k\xed\xef\xd9\x01\x87&\x01D\x03*\x16\xb7X!3\x94#\x87\xfdq\xe3\xbb\xdf\x1bpa\x1e`{-\xda\x85\xa4\xc7\xacR\x08\xd7\x10a\xa62\xc8\x8d\x87\xec\xb00\x85\xa6\xe8\xed\x9c\x85K\xd2\xb6\x10k>G\xc7\xeb\x15\xc6\x12D\xe5\x8a\xe1\x19Am\xf8G\xf3\xc3)\x90[\x0c6P\x9ek\x90\x8d\xf3\xcd\x89\xf3:\xfa2J\x8cU\x96\x18`Y\xe6\xe8\x14&\xe4\xd7\xd6\xb2\x11\xa5=\xea5\xea)\xd8\x90`l%\x82\xb3L\xbf\xcb\xa0\x8a\xb5 \x00\xb0\xc1\x9e\xe0\xb7\xc4>\x9b\x81\xb4\xce\xfag\x0b\x87!\xb1\x1dZ\\\x15s F\x9c\xe4\x90\x96<\x8c\x8f\x05=\xafY\xfa\xf9q\xce\x18\x80\x95?sW\x14z\r\xea\xed\xb14\xa5\xc3H\xe2\xf7\x1b\xf2/\t%\xd9\x15\xc5\xa5\x91]\x9f\xe6\xc0\x88bX\xfb\x17\x17\x19C\xec\x12\xa7\xec\xa8\x10\xc63.\x94\xea\x9c\xc9\x9d_\xd1\x17Q}W\\)\xc5+,\xcd\xaa7D\xe7\xeel\r`\x9d\xc8\xb3\xb9\xb6\xcd\x1aPE\xd2\x06qb\xd7#\x9c\xb0\xde\xc9K\x199\x1d\x89+\xbe\xcb\n\x9a\x7f\x7f\x8b\xc4\xbd\xd4\x0b\xb1)\xa8\xda\x9b\x1cE\x8b\x1c@\xac\xcd\x0e%\xde5\x89\x06\xbcwa\x16\x8b[}\xcc\x8d\xa6$\xb2\xb5\xe6\x94g<@\njG\xe5\xd1\xb6\xfc\xb1\x1a\xb4\xaf\x85\xa7\\\x95\x90\xa0;\xc4\xa2[q\x89e;^\xae\xa9\xb2,g#8\x9fB\xed\xae\xe7\xc6\xf2N\xac\x8c\xf3\xb3\x88zW\x04>\xc3RI"?\xab\xbd]\x05F\xf2\x82\xb3_\x7f\x08{\xcb[\x14\xf2-\xb3\x9e\x1f/\x98c\xf9Y\xbd\x8c\xac\x855\xf4\xcd\xb0\xfd$\xc6\xa6\xe1sI\r\xdb\x87/\xb3y\xa5W\xda\x9c\xc6\xd6\xc7\xa9\xf9\x82S\xd8o)\x07\xc4\xe3\xd3\xe4xp\x00Op\x17L\x17\\q\xe9\x9a\x00\xf8\x8e"\xac\x97\xdbG\x8d\x98s\xc7;\xc1\xb1\xc1\xf3\x9e\x8f\xaa%2E\x92yF:.,\xd2*I\x0e\xfbT\x9f8H\xafj\x87\xc2\xf2N\xa2XW,\xbb_\x9b\x00\xb0P\xe4C\xb5\xa0\xf4\xf3-\x10\x1b\xc9\x8dB\xf9\xcf\xad\xf5Dke\x13\x11\x87x\xbet\t?)\xd4\x0c&\x0e\x80fR\xa4s\xba\xe2WGT\xc6\xaey\x15\xde\x9bw\xfd~\xbd\'\xaa\x9egG\xb6\xd3\xc4\xf5\xfbL\xa0E\xd7#f#\xa6\n\xc2\x80bZ\xaa\xc7\xf1 .\xa6s\xa6d7:\xeb\x81o\x0fLa\xbe\x88\xdc\xbf)^\x9cT]AK\x08\xc7\x02\xd4s\xbcJ\xa1\x0f\xe6\x1a9x\t\xae\x9es\xde\x0f7\x0bCoe; x\x12\xfa\t\x93K\xc5\x89iV|\xc8dG\xdak\xaa\x14\xeeX\xd5\xfaQ\x0ev\x1d\xa2\x03N\xf4\x81\xf3\xf3U2<\x03\x03\x8b\x9aI\xa8W\xa0\x0f\xe7/F1\xb5\x06W\xbd\xc4\x98R\xf4I\x83\xf3\xca]x\xa2fB\xc5\x98d\x8c\x89c\xba\xf5\xb0:\xc4\x0f\xd6h\xd9\x8f\x8f\xf7U\x98\xa4\x18\xfc\xe1h\xd6\x99\xa8E\xcd1\x08\xf4\x98RCc3Ywq5W\x053\xab\x94-H\x9f\x08 l\xb9\x9a\xb2\xfd#\x92j>\xe9\x15\xae\xe1\x10zdG\xbf\xec\xc7\xc6\xcb{GVg\xb1\x0c$\x99\xc0w\x8f^\xcd\x0f\x11\xaayL\x00\x85\xad\xdc\xfcnX\xfb2\xcf\xd3\xfc\xfbe@\x1cV7\xdb\x91\xf8\x13B\xa4Q\xe7\n\x8a#\xcc< \t\x8e_\x91\xe0\x8b\x9f\xbc\xcb\xa5gIQ\xe6\x84?w\x04\x9d\x1f\x95\xe5\xe5\xc9\xc4\xb5\x16.\xf7h\xa8xuW\xa1\xf6\x19\xf0\xe6v\xe1\x1a\x9c\x0e\xba\xb9\xe4\xf0\xad\x912\xa1\x90<\xcd\xcf\x02X\xf7\xa3\xechJ$\xf4\x10\xe0\xbc)\x96\xd2\x8e|\x0f)\xbdS\x1b3\xc2\xaet\xa6\x84\x9e\x06O\xf1pxM\\\x0f$\x16\xab\xe9\xe7a\xa1A1\xa8\xc4\x9fl\xadI\x1e\xca\xf08t\x8e\xc4p\xaf\xaa\xe3\x13z>\xf9\x82\x80cbs\x98\x0b-\xe8\x0e\xc0\xab\x18\x0f\x1fX<t`\x81\x98\x86gI\xc3\x1b\xf8q\x9d\x8e\xa3\xdd\xb9\x81\x88z%\x06\x8fv\xe2>\x0b\x10\xf4{\xeb\x8d.\xf8\xa0\xbd\x07azr\xcd\xcfrZd:\nIq\x1c\x08\xd3f\x1a\xe1\x17\x97\xfa\xa3n2\xfb`\xd6\xcfhS\x94\xdb\xd3?\x9bh\xd7\n\xa1\x07\x9b>\xb9\xd0\t\xbcn\xe1\x7fJ\xe4\xc51\xd3\x1bTEx\xbd(O\x9d%x\x94\xf2\xaaG\xf6j\x10\xe7\xee\xb7fu\xfd\xc4\x04\x86\xc2\x8b\x1a\t\xf6LV?\xb9\x1f1\xe8\xce\x07\x87Q\xffL\xe7p-+X\x87\xfbBmk\x96\xe6\x86C{\x9e\xee\xfa\x14;\x15\x1c\xaas\xd2\xa0\n]\x05PP\x12\x87\xd9_\xe8%\xe1G\x01\x00R\xb5\x19\tqA\xab-\xc3`\xdf\x12\xf1=Nq\xc3\xcf\t\x83\xfe)\xedrg\xc3\x15\xff{?\xdc\xb2\xfd\xee\xb6|\x0bw[\x195D\xa8\xda\'|^@\xac\x15M\xd3\xdb\x99W\xe2\x95\xea\xee\x0fQ/\x1c\xaa%\x07\x15\xde7\xe1\x82\x97Vt\xecS\xc4\xb3\xc1g\xeb\xfc\t\xe5\xce\xfa\x1c\xd7"D\'HI\xee"\xb1\xa6\xe2vX%\xfd\xd3>D\xbc\xd40\xf5\x9a\x8d\x190\x89\x84r\xe8wN\xa15\x7f\x1d\n>\x92&\x9f\x16Ts\x90\xa9<~\xeb\x18\x82\xc0\xc2\xb82sX\x9eZ[2!\xb1ld\xb5\xb1\xefz\x8c>n\xbah\x91\x82\xba\xf5\xe4\xe5\xc5\xbf\xb12\xe7d\xa5=~\xc0+{l\xb8\xc0\x15\xa9\xa1w\xd0\x1c\xa4\xa0\xda8\x81+#N\xa9\xca\xf3\xf0\x0c~5\x02@\x89nw\t\x91\xf5-Lx\x1e\x19\x0ew\xffIew\xfd?\x8e\xc8s9\x13\x0cVDy\xf1\xb1g\xf2]s\xa7\xf3R\xc0\xa5\x04/\xd3s\x01\xadW\x19\xdd!+fH\xea\xcek\xaeO\xa1\xe1\x03\x8aE@ \xa1\\6\\\xccf \xa2\xee\xf2lv\xfb&\xf2a\xc5^\r\\\xe0\x9b\x14\x10\x07\x99\xc5s\xc4YA\xf2\x81U\x07~\xc8\x93i\x84\xcd:aC\x92\'A\x8a\x8aH}\xb4\xde9D\xf3\x12\x82\x0c\x0c\x81\xc4\x1b\xd8s/+uxK\x0c\\\xb7\xb6[\xb8d]\x0f\xa5\x7f\xdc\x04\x18\xf2\x8c\x9b\x95\x08\x8b`\x8b\xec*F\x04\x82\xc5\x84Hs\x0fA\x93dz\xd5{\x96Mn\xda_y4\x8bU\xf4E\xafp+\x8ao\xb0"\x01~l\x0bZ\xcbZ\x81:\r\xf1\xfe\x99\xfe\x95)\xb2\x03E\xfa\xfe\x08I(iB.\x90\x1e\xc1\x94\xa1\x9f\x8e\x06\x91\x11#kt\xb7A\x9f\xf5\x08\x9ej\xcb\r"\xa59\xcb\x8f(\xac=["5\n\xf3\xed\xe5a\'~\x0e\x8d\xad\x82\xae(G\xc5\x98\x80a\xbaA\x08V\xed\xb9J\xe78\xc0Y\x82\xa2\x17q\xa2H\xf4A<\xc8)\xaa\x1e\xc3wJ\xfc\xccA\xba\xb2\xc0\xdd\xf5\xda#-\x08:x=mp\x0c\xe2\xbc\x89?\xdf\xa0`=]->\xc5\xed\x07\xb3"\xcf\xff\xdf\x88\xfcP\xc0\xbc\xbd`7C6\x15\xcfbA?{q\xf8\xaa\xdaHI2Yt?\xff\x02\xac\x9e\xbc\xcdg-\xc5\x05\xc8C\x87}\x1d=\xd5k{$\x0e\xa0\xaa\xb8\xcc\xba\x7fw>\xd0\r\xb3\x04\x1cb\xf5\x9f\xf1WXJ\xc3\xb9\xd3\x02"\xe8\x06Z_O\xd8\x81\xffQ\xa7f\xbe\x1d\xd7l\xcf\xe5\xfc\rf\xa0\x91\xc3j\x00\xc4z\xbe\xe0~\x0c\x03\x00$P\xba\xee\xe4 \x87\xb7\xd6\x1a\xdb\x0e\xec\x15?\xc1\xfc\xb2\xa1\'\x0e\x8d\xcb\r\xdf\xc9j\xb7I\xd2m\x1f\xea\x14\x90\xcb\x1c\xea\xaf\x05\xc3\x08A\x10Q\x01\xfe"\x81\xae&\xb1\x07H\x0fj\xcd8\x1d\xdb{\x8b\x9e\xfa\xffW<\x9a\x0e\x85C\xb9\xdf\x05\xe8i(f\xa3x1\xbdv8,\xec\xeb\x0c\x8b\x1d6\r\xf8S\xa0\x7f\xd6\x0ez\xaba\x1egI\xc6\xc7\xfa\xc7\xbfj\xc2\xf1\xf3\xd6\xe9Y\xee\xe8\xc9\r?Z\xb5\xcf\xdd\x97rGE\xc0/\xa5.Fdg\xf3\xb5\xee\r\xd5gi\x15\x9b\xa5(A\xd6\x1d\xcd\xf2rJ\tw2\x07\xa8\\!\x93\xb5O\x89\x88\x135\x99=\xab\xc8\xe6(\xb7\xf8\xea|\x8b#Ri\xfd\x00\x8e\x868c\xb1\xe0\xd5\x15\xda-ZL\xf2J\x80\xf3E(\xa4]\xe0\xae\xf7\xf2\xdey\x1bO\x8d\xe8\xe7pX\x92\x91\xec\xf6\x146g\xcd\xa9,"j7\xcf3\xa0\xfc\xb0\xd9\x1e\xdcs_\xf3\xe5\x8f\xa0\xc4oU/\x97D6\xe8\x15\x92\x00\xfb\x98\xa6\xaeX\x1b\x0f\x8a+E\xe0jD\xdf\xaf\x16\x0b~\xcf\x06\x03\xe8A\x10\xcc\x02\x13\'\xe9\x8e\xce}\x12J \xeffN&\xc8\xd0?\x1b}\x83\xb1\x8d\xa63\x94\xc3\x1caC\x0c\xba\xd6T\xf7\x0629^\xdb<\xb08\xed\xb6\x9d\x01\xef\xd4\xad\xd3RV\xe3\x10i\xbf\xab\x05\xb9oE\x04\xf5p\xf3b;\x99N\xb1\xd4\x83Y\xe2iP"Y\xf6\xb2"FYj.\xa1\xc8\x99\x9e\xe3\xbd\r\x95\\7\xe1\xee\x1a\x96\x957#\xbdk\xd9\\\xab\xc8\xb3l\x8e\x92\x98f\xb2`\x1a\xf8bS\xe6,\xa6\x86\t\xbe\xb7\xcb=8\xa0V\xc8|Z\xd9m\xc9\x97\x92#\x07\xa1\xf6}\x88\x9f\x85\xeb.>L\xaae\x18\xf4\xfc\xcb\xb2\xba\xd6}w\x95\xfd-\xabT\x94\xd9b$(\x9e\xf9\xba\x9eU\x01\x03\xcbj\xa0\x9f\xb5\x97\xe9+\x8f5\xb9t4?\xcb\x98C\xf4k$\xae\x95\x81\xae\x98d\r\x90U\xf1v\x1fF\x9bl\xc2\xc3\xd1B`k\n\xbcl[\\k\x12FT\x9fMZ]Q\x93\xb9\xceY\xaf\xb72\xe2\xd3\x06\xd2\xa2\x88*\xef\x07\xcb\xd6\xb8`\x86\xd7\xb9f\xf6\xab\xab\xb9N/1\xc7\x85\xb5ukZ\xcc\xba\xb4\x7f\xa7\xc4\x85D\xef\xc6\x1f\x8a!\xdb\xad^\x0c\x85\xdd\x9c\xdc\xe0\xbau\x00\x11>i\xb0Qf\xf6]\xfc1\xec\x8c1\x111\x8d\xd4\xdb\x92\xa0\xac5H\x98\x0e\x94\xba\xb3\xdch"\x16\xeb\xc5\xf1U\xc6\xd1Kv\xd1X0;\xdb\x0fd\xd4\xb6>\xadt\x1d\x96\'\xe0\xa7\x99\xb3\xc7\xa6{*sd\xabs\x98\xb2\xd8\x8c\x88\xc0\x1d<\xcf\xce\xad\x9d\xc4\x06\x0b\x86\n\xc0u\x11m\xd8Z6|\x12\xda>|\x1c)\xa7\x948-\x92\x1c\xd4\x8fw\xe7\x909\xf1\xf5M\x88|\xc2\xf4\x9c\x9b\xdeZ\x01\x80\x9aPY\xbf\xfd\x94\xd7e\xd4\xe8X\x1e\xd3\xd2\xdc\x8a\xfa\xfbC\xa1/5\xdf<\x17\xc8y\x0b5k\xdb\x0be\xff\x1eNI&Q\x02%\xa3\xf3*zW\xf7m\x15\x81\x94\xee\xd5\x10\xc9o \x13\xb8T\xcc#\xb3Z4\xa1\x9bc\xe2T\xa2\xc6\xc9\x7f\xf1\xce\xbagEY$\x00\x95+)\x9d9;\xc2\xef\x9bc\x05\xc1\x03\x1a\xf1\xdd\xb8\xa7\x8cS\xe8Mh\xea\xbd\xbfc\xfc\x8cju\xbc\x93 \'R\xa1\xaf\x9f\x87\xd8\x8blz\x8e\x99\xc0\xa2g\xfb\x12\xc2{c\xdcsx\xc3\xac\x81\xfa\xdbY\x96\x85\xe9_-\x0cG\xe6\xfe\xb1#\xfaMl\xe0\x14Y-\x8a\xdf^p\xd5\xb2lGd\x81u\xafD\xc7\x94f,"\t\xded\xb8\xca\x89\xb9"\x91\xa8r\xa9\x7f\xad\xba^\xca-<\xb9\xe9\x19C\x7f1\x8e\x8b\x83>N\x10\xae\xbe\xd2\xbb,)u\x02[z\xe6\x9dm\xcd\x17.J\x1d\x9d-\xd8u\xa3\x1dL\x19k-\xc1\x0b\x8b\x07fT\xcc\xa7\xb2\r\x14k\x04\xccVV\xa1\x7fra\x9e\xac\x8e\x84|.A\x97\xf6hF\xc1\xdb\xbe\x1f\xf2\x93GX\xde=\xe1\x12\xd6\xcc\x84F\x01\xe7V@E\t\xef\xf0"l\x0fC\xe2d\xf5K\x01\xdfN\xf8\xa6\xbc\xa8|f)\x05M*o\x1b\xaa\xc8\xb9\x19\xfe\xe8\x034\xfd\x82\xe8\x0cv<\xbdo\x8c;}\x06\t_\xfbW\xa8\x1eO\xaa\x0eA"\\9\x1et\x96\x94q\x1b\xf5\xbb\x9c\\w\xb49\x811\\\xb7X\x9d\x86\xc6wpOhB\xd6\xa7W\xf6I\x8a\x0e\xd5\xb3\xca\xc4>*\xf0\x90\x16,\xabff~\x93\x02\xfdsU\xf3E\xe3\xa5\xde\xc8\x03\xc9\xd2 F\x8c\xe7\xaaxk\x8f\x8c\x8e\x84\xc1R\xe9\xbf\xb6\x8c\x13\xe5V\xa0pU\x13\xc5\xe5W\xd9GX\x84\xdb\xa1<\xc7^\xa5\xea[.\xd0\xe4=\xe7\x0c\xed\xb4\xed\x87OWn\xda\x03\xc1\xd9\x07\x9b)\xb8u\xc6\x17lu\xd77\x1e\xb3\x19s2|\xfc\xc3;G$\x08\x8f\xb5\x00\xb7\x95\xcd\x0eB\xcck\xc6k\xac|\xa9\x0be\x15\xdf\xad5W\xf8\x08\xfc\x94\xb2(\x82J\'\xae\x89\x81\xec1%(g\xb1\x98FuQ\xa0\xea\xfc\xebC\x85\x19}R\xdaB\x93\xbd\xdbp>?z\xca\x10%2\xd0\t<\nj\xd0\xd1\x9d"\xd6\x16\x04\xd3\xfa\xc2\xc5%\x87\xa7\xee\xb1\xd1\x9af\xd7OS\xb9/\x12\xff\xc1\xa9\x06\xad\x9b\xe4F\x18\x91F\x9e\xe0"_\xf7^\xfc\xcc@[E[\xf6\xb1\x94\x93\xb5\xdb\xf2 _:\xe8Y$$\x8b)Pj-\x1c\xac\x91\t\xac\xa5\xdb\xb6!\xad\xceI\x83\xc1\xa5%\xaf\x0clv\xd0o\xe3e9:publisher9:toloka.to13:publisher-url26:https://toloka.to/p1882520e'
 magnet_link = "magnet:?xt=urn:btih:647aa53c56d7277eeb00c0c6d26e663181158cac"
@@ -37,10 +39,20 @@ magnet_link = "magnet:?xt=urn:btih:647aa53c56d7277eeb00c0c6d26e663181158cac"
         """,
     ],
 )
-def test_get_magnet(html):
+def test_get_magnet(html, tmp_path):
     with (
-        patch("pickpockett.magnet.get_torrent", return_value=torrent),
-        patch("pickpockett.page._get_page", return_value=(html, "", "")),
+        patch(
+            "pickpockett.magnet.torrents",
+            TorrentCache(tmp_path / "torrents.json"),
+        ),
+        patch(
+            "pickpockett.magnet.get_torrent",
+            return_value=(torrent, Validators()),
+        ),
+        patch(
+            "pickpockett.page._get_page",
+            return_value=(Page(html), {}, "", Validators()),
+        ),
     ):
         magnet, _ = get_magnet("", "", "")
         assert magnet.url == magnet_link
@@ -50,3 +62,30 @@ def test_magnet_display_name():
     hsh = "0123456789abcdef0123456789abcdef01234567"
     magnet = Magnet.from_hash(hsh, dn="Hello World")
     assert magnet.url == f"magnet:?xt=urn:btih:{hsh}&dn=Hello+World"
+
+
+def test_get_magnet_not_modified():
+    html = f'<a href="{magnet_link}">magnet</a>'
+    with patch(
+        "pickpockett.page._get_page",
+        return_value=(Page(html), {}, "", Validators()),
+    ):
+        magnet, _ = get_magnet("", "", "", Validators(digest="0" * 40))
+        assert magnet.url == magnet_link
+
+        magnet, err = get_magnet("", "", "", magnet.validators)
+        assert not magnet.modified
+        assert magnet.url is None
+        assert err is None
+
+
+def test_get_magnet_not_modified_keeps_session():
+    with patch(
+        "pickpockett.page._get_page",
+        side_effect=NotModified({"session": "rotated"}, "agent"),
+    ):
+        magnet, err = get_magnet("", {"session": "old"}, "", Validators())
+    assert not magnet.modified
+    assert magnet.cookies == {"session": "rotated"}
+    assert magnet.user_agent == "agent"
+    assert err is None
@@ -0,0 +1,169 @@
+import re
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+from flask import g
+
+from pickpockett import app
+from pickpockett.configuration import Config, GeneralConfig
+from pickpockett.flaresolverr import ClearanceCache
+from pickpockett.page import Page, _get_page, _read_page, _with_clearance
+from pickpockett.ratelimit import HostRateLimiter, RateLimited
+from tests.test_flaresolverr import _solution
+
+MAGNET = "magnet:?xt=urn:btih:647aa53c56d7277eeb00c0c6d26e663181158cac"
+
+
+def _soup_links(html):
+    soup = BeautifulSoup(html, "html.parser")
+    magnet = soup.find("a", href=re.compile("^magnet:"))
+    download = soup.find("a", href=re.compile(r"^(?!#).*(download|dl\.php)"))
+    return (
+        magnet["href"] if magnet else None,
+        download["href"] if download else None,
+    )
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        f'<html><body><a href="{MAGNET}">magnet</a></body></html>',
+        f'<A HREF="{MAGNET}&amp;dn=S01E01">magnet</A>',
+        f'<a href="download.php?id=1">torrent</a><a href="{MAGNET}">m</a>',
+        f'<a href="dl.php?t=1">torrent</a><p><a href="{MAGNET}"/></p>',
+        '<a href="#download">top</a><a href="/forum/dl.php?t=2">dl</a>',
+        '<a name="download">no href</a><a href>empty</a>',
+        f"<script>var a = '<a href=\"{MAGNET}\">';</script><p>no links</p>",
+        f'<a href="download.php" href="{MAGNET}">duplicate attributes</a>',
+        f'<div><a title="magnet" class="x"\nhref="{MAGNET}">x</a></div>',
+        f"<!-- <a href='{MAGNET}'> --><a href='download?id=3'>d</a>",
+        f'<table><tr><td><a href="{MAGNET}">unclosed<td></table>',
+        "<html><head><title>Series S01</title></head><body></body></html>",
+        f'<a href="  {MAGNET}">leading spaces</a>',
+    ],
+)
+def test_page_links_match_soup(html):
+    page = Page(html)
+    magnet, download = _soup_links(html)
+    assert page.magnet == magnet
+    if magnet is None:
+        assert page.download == download
+
+
+def test_page_title():
+    page = Page(f'<title>Series S01</title><a href="{MAGNET}">m</a>')
+    assert page.title == "Series S01"
+    assert Page("<p>no title</p>").title is None
+
+
+class _Response:
+    encoding = "utf-8"
+    url = "http://example.com/"
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+def test_read_page_stops_at_magnet():
+    response = _Response(
+        [b"<p>intro</p>", f'<a href="{MAGNET}">m</a>'.encode()]
+        + [b"<p>comments</p>"] * 10
+    )
+    page = _read_page(response, 1024)
+    assert page.magnet == MAGNET
+    assert response.consumed == 2
+
+
+def test_read_page_max_size():
+    response = _Response([b"<p>" + b"x" * 96 + b"</p>"] * 10)
+    page = _read_page(response, 250)
+    assert response.consumed == 3
+    assert page.text == ("<p>" + "x" * 96 + "</p>") * 3
+    assert page.magnet is None
+
+
+@contextmanager
+def _serve(status, hits):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(status)
+            self.send_header("Retry-After", "3600")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_get_page_slows_down(status):
+    hits = []
+    limiter = HostRateLimiter()
+    with (
+        _serve(status, hits) as url,
+        app.app_context(),
+        patch("pickpockett.page.limiter", limiter),
+    ):
+        g.config = Config(general=GeneralConfig())
+        g.flaresolverr = None
+        with pytest.raises(requests.HTTPError):
+            _get_page(url, {}, "")
+
+    # the pause is left to the limiter instead of retries of the session
+    assert len(hits) == 1
+    with pytest.raises(RateLimited):
+        limiter.acquire(url, 60, 3)
+
+
+def test_get_page_stops_waiting_for_solve():
+    hung = Future()
+    flaresolverr = SimpleNamespace(
+        clearances=ClearanceCache(),
+        solve_timeout=0.1,
+        submit=lambda url, cookies, wait: hung,
+    )
+    with _serve(403, []) as url, app.app_context():
+        g.config = Config(general=GeneralConfig())
+        g.flaresolverr = flaresolverr
+        with pytest.raises(requests.HTTPError):
+            _get_page(url, {}, "")
+
+
+def test_clearance_replaces_stored_cookies():
+    clearances = ClearanceCache()
+    clearances.put("https://tracker.org/1", _solution(time.time() + 60))
+
+    with app.app_context():
+        g.flaresolverr = SimpleNamespace(clearances=clearances)
+        cookies, user_agent, cleared = _with_clearance(
+            "https://tracker.org/2",
+            {"cf_clearance": "old", "login": "user"},
+            "",
+        )
+
+    assert cookies == {"cf_clearance": "ok", "session": "1", "login": "user"}
+    assert user_agent == "Mozilla/5.0"
+    assert cleared
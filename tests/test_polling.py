@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+from pickpockett.configuration import GeneralConfig
+from pickpockett.polling import (
+    CheckQueue,
+    burst_check,
+    check_delay,
+    next_release,
+)
+from pickpockett.sonarr import Episode, EpisodeIndex
+
+
+class _Source:
+    def __init__(self, id, next_check=None, **kwargs):
+        self.id = id
+        self.next_check = next_check
+        self.season = 1
+        self.schedule_correction = 0
+        self.datetime = None
+        vars(self).update(kwargs)
+
+
+def test_check_delay():
+    conf = GeneralConfig(check_interval=15, max_check_interval=240)
+    assert check_delay(conf, 0) == timedelta(minutes=15)
+    assert check_delay(conf, 2) == timedelta(minutes=60)
+    assert check_delay(conf, 10) == timedelta(minutes=240)
+    assert check_delay(conf, 1000) == timedelta(minutes=240)
+    assert check_delay(conf, 0, completed=True) == timedelta(minutes=240)
+
+
+def test_check_queue():
+    now = datetime(2024, 1, 1, 12)
+    queue = CheckQueue()
+    queue.load(
+        [
+            _Source(1, now + timedelta(minutes=10)),
+            _Source(2),
+            _Source(3, now - timedelta(minutes=1)),
+        ]
+    )
+
+    assert queue.due(now) == [2, 3]
+    assert queue.due(now) == []
+
+    queue.update(_Source(1, now + timedelta(minutes=30)))
+    assert queue.due(now + timedelta(minutes=10)) == []
+
+    queue.update(_Source(4))
+    queue.discard(1)
+    assert queue.due(now + timedelta(hours=1)) == [4]
+
+    queue.update(_Source(5, now + timedelta(days=1)))
+    queue.limit(now + timedelta(hours=1))
+    assert queue.due(now + timedelta(hours=1)) == [5]
+
+    # a source rescheduled meanwhile keeps its check
+    queue.update(_Source(6, now + timedelta(hours=3)))
+    queue.retry([5, 6], now + timedelta(hours=2))
+    assert queue.due(now + timedelta(hours=2)) == [5]
+
+
+def _episode(number, aired, has_file=False):
+    return Episode.model_validate(
+        {
+            "seasonNumber": 1,
+            "episodeNumber": number,
+            "airDateUtc": aired,
+            "hasFile": has_file,
+            "monitored": True,
+        }
+    )
+
+
+def test_burst_polling():
+    conf = GeneralConfig(burst_interval=2, burst_window=120)
+    now = datetime(2024, 1, 8, 21, 30)
+    episodes = EpisodeIndex(
+        [
+            _episode(1, datetime(2024, 1, 1, 21), has_file=True),
+            _episode(2, datetime(2024, 1, 8, 21)),
+            _episode(3, datetime(2024, 1, 15, 21)),
+        ]
+    )
+    next_check = now + timedelta(hours=4)
+
+    source = _Source(1, datetime=datetime(2024, 1, 2))
+    release = next_release(conf, source, episodes, now)
+    assert release == datetime(2024, 1, 8, 21)
+    assert burst_check(conf, next_check, release, now) == now + timedelta(
+        minutes=2
+    )
+
+    # the episode was picked up already
+    source = _Source(1, datetime=datetime(2024, 1, 8, 21, 10))
+    release = next_release(conf, source, episodes, now)
+    assert release == datetime(2024, 1, 15, 21)
+    assert burst_check(conf, next_check, release, now) == next_check
+
+    # the source gets episodes a day after they air
+    source = _Source(1, schedule_correction=1, datetime=datetime(2024, 1, 2))
+    release = next_release(conf, source, episodes, now)
+    assert release == datetime(2024, 1, 9, 21)
+    assert burst_check(conf, now + timedelta(days=1), release, now) == release
@@ -0,0 +1,31 @@
+import pytest
+
+from pickpockett.ratelimit import (
+    DEFAULT_PAUSE,
+    HostRateLimiter,
+    RateLimited,
+    retry_after,
+)
+
+
+def test_retry_after():
+    assert retry_after("120") == 120
+    assert retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert retry_after("soon") == DEFAULT_PAUSE
+    assert retry_after(None) == DEFAULT_PAUSE
+
+
+def test_token_bucket():
+    limiter = HostRateLimiter()
+    for _ in range(3):
+        assert limiter._reserve("tracker.org", 60, 3) == 0
+    assert limiter._reserve("tracker.org", 60, 3) == pytest.approx(1, 0.1)
+    assert limiter._reserve("other.org", 60, 3) == 0
+
+
+def test_pause():
+    limiter = HostRateLimiter()
+    limiter.pause("https://tracker.org/1", 3600)
+    with pytest.raises(RateLimited):
+        limiter.acquire("https://tracker.org/2", 60, 3)
+    limiter.acquire("https://other.org/1", 60, 3)
@@ -0,0 +1,46 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+from pickpockett.scheduler import _run_by_host
+
+
+class _Source:
+    def __init__(self, url):
+        self.url = url
+
+
+def test_run_by_host():
+    sources = [_Source(f"https://slow.example/{i}") for i in range(6)]
+    sources.append(_Source("https://fast.example/"))
+
+    lock = Lock()
+    running = Counter()
+    most = Counter()
+    fast_done = Event()
+
+    def check(source):
+        host = source.url.split("/")[2]
+        with lock:
+            running[host] += 1
+            most[host] = max(most[host], running[host])
+        if host == "slow.example":
+            # the other host must not wait behind this one
+            assert fast_done.wait(5)
+        else:
+            fast_done.set()
+        with lock:
+            running[host] -= 1
+        return source.url
+
+    with ThreadPoolExecutor(3) as executor:
+        results = [
+            (source, future.result())
+            for source, future in _run_by_host(
+                sources, 2, lambda source: executor.submit(check, source)
+            )
+        ]
+
+    assert sorted(url for _, url in results) == sorted(s.url for s in sources)
+    assert all(source.url == url for source, url in results)
+    assert most == {"slow.example": 2, "fast.example": 1}
@@ -0,0 +1,286 @@
+import time
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pickpockett.configuration import SonarrConfig
+from pickpockett.models import ALL_SEASONS
+from pickpockett.sonarr import (
+    DownloadHistory,
+    Episode,
+    EpisodeIndex,
+    Sonarr,
+    SonarrCache,
+    WebhookEvent,
+)
+
+
+def test_stale_entry_is_served_while_reloading():
+    cache = SonarrCache(
+        "test", 1, ttl=timedelta(milliseconds=50), stale=timedelta(hours=1)
+    )
+    assert cache.get_cached("key", lambda: 1) == 1
+    time.sleep(0.1)
+
+    reloaded = Event()
+
+    def getter():
+        reloaded.set()
+        return 2
+
+    assert cache.get_cached("key", getter) == 1
+    assert reloaded.wait(5)
+    cache.flight.do("key", lambda: None)
+    assert cache["key"] == 2
+    assert cache.revalidations == 1
+
+
+def _response(status, content=b""):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    return response
+
+
+def test_series_error_is_not_remembered(monkeypatch):
+    series_cache = SonarrCache("series", 1, ttl=timedelta(hours=1))
+    series_cache.put("series", {})
+    monkeypatch.setattr(Sonarr, "series_cache", series_cache)
+    monkeypatch.setattr(
+        Sonarr, "missing_cache", SonarrCache("missing", 1, timedelta(hours=1))
+    )
+    sonarr = Sonarr(SonarrConfig(url="http://sonarr:8989", apikey="key"))
+
+    with patch.object(sonarr.session, "get", return_value=_response(503)):
+        with pytest.raises(requests.RequestException):
+            sonarr.get_series(99)
+    assert not Sonarr.missing_cache.contains(99)
+
+    with patch.object(sonarr.session, "get", return_value=_response(200)):
+        with pytest.raises(KeyError):
+            sonarr.get_series(99)
+    assert Sonarr.missing_cache.contains(99)
+
+
+def test_stale_series_survive_failed_reload(monkeypatch):
+    series_cache = SonarrCache(
+        "series",
+        1,
+        ttl=timedelta(milliseconds=50),
+        stale=timedelta(hours=1),
+    )
+    series_cache.put("series", {10: "series"})
+    monkeypatch.setattr(Sonarr, "series_cache", series_cache)
+    sonarr = Sonarr(SonarrConfig(url="http://sonarr:8989", apikey="key"))
+    time.sleep(0.1)
+
+    with patch.object(sonarr.session, "get", return_value=_response(503)):
+        assert sonarr.get_series(10) == "series"
+        series_cache.flight.do("series", lambda: None)
+
+    assert series_cache.revalidations == 1
+    assert series_cache["series"] == {10: "series"}
+
+
+def test_concurrent_misses_load_once():
+    cache = SonarrCache("test", 1, ttl=timedelta(hours=1))
+    release = Event()
+    calls = []
+
+    def getter():
+        calls.append(1)
+        assert release.wait(5)
+        return len(calls)
+
+    results = []
+    threads = [
+        Thread(target=lambda: results.append(cache.get_cached("key", getter)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [1] * 8
+    assert cache.misses == 8
+
+
+def test_restored_entry_keeps_its_age():
+    cache = SonarrCache(
+        "test", 1, ttl=timedelta(minutes=1), stale=timedelta(hours=1)
+    )
+    assert cache.get_cached("key", lambda: 2, lambda: (1, 10)) == 1
+    assert not cache._stale("key")
+
+    cache.invalidate("key")
+    reloaded = cache.get_cached("key", lambda: 2, lambda: (1, 120))
+    assert reloaded == 1
+    assert cache.revalidations == 1
+    cache.flight.do("key", lambda: None)
+    assert cache["key"] == 2
+
+    cache.invalidate("key")
+    assert cache.get_cached("key", lambda: 3, lambda: (1, 7200)) == 3
+
+
+def test_restored_entry_expires_at_its_age():
+    cache = SonarrCache(
+        "test",
+        1,
+        ttl=timedelta(milliseconds=100),
+        stale=timedelta(milliseconds=100),
+    )
+
+    def unavailable():
+        raise ConnectionError
+
+    assert cache.get_cached("key", unavailable, lambda: (1, 0.15)) == 1
+    cache.flight.do("key", lambda: None)
+    assert "key" in cache
+    time.sleep(0.1)
+    assert "key" not in cache
+
+
+def test_download_event():
+    sonarr = Sonarr(SonarrConfig(url="http://sonarr:8989", apikey="key"))
+    Sonarr.episode_cache.put(7, [])
+    event = WebhookEvent.model_validate(
+        {
+            "eventType": "Download",
+            "series": {"id": 7, "tvdbId": 70, "title": "Series"},
+            "downloadId": "647aa53c56d7277eeb00c0c6d26e663181158cac",
+        }
+    )
+    sonarr.handle_event(event)
+    assert 7 not in Sonarr.episode_cache
+    assert "647AA53C56D7277EEB00C0C6D26E663181158CAC" in Sonarr.history.ids
+
+
+def _episode(season, number, aired, has_file=False, monitored=True):
+    episode = {
+        "seasonNumber": season,
+        "episodeNumber": number,
+        "hasFile": has_file,
+        "monitored": monitored,
+    }
+    if aired:
+        episode["airDateUtc"] = aired
+    return Episode.model_validate(episode)
+
+
+def test_episode_index():
+    episodes = EpisodeIndex(
+        [
+            _episode(2, 2, None),
+            _episode(1, 2, datetime(2020, 1, 8), has_file=True),
+            _episode(0, 1, datetime(2019, 6, 1), has_file=True),
+            _episode(2, 1, datetime(2021, 1, 1), monitored=False),
+            _episode(1, 1, datetime(2020, 1, 1), has_file=True),
+            _episode(1, 3, datetime(2020, 1, 15)),
+        ]
+    )
+
+    aired = episodes.aired(ALL_SEASONS, datetime(2020, 1, 15))
+    assert [(ep.season_number, ep.episode_number) for ep in aired] == [
+        (0, 1),
+        (1, 1),
+        (1, 2),
+    ]
+    assert len(episodes.aired(1, datetime(2022, 1, 1))) == 3
+    assert not episodes.aired(2, datetime(2022, 1, 1))
+
+    assert episodes.n_files(ALL_SEASONS) == 3
+    assert episodes.n_files(1) == 2
+    assert episodes.n_files(3) == 0
+
+    assert episodes.completed(0)
+    assert not episodes.completed(1)
+    assert not episodes.completed(3)
+    assert not episodes.completed(ALL_SEASONS, first_season=1)
+
+
+def test_unknown_series_is_remembered(monkeypatch):
+    series_cache = SonarrCache("series", 1, ttl=timedelta(hours=1))
+    series_cache.put("series", {})
+    monkeypatch.setattr(Sonarr, "series_cache", series_cache)
+    monkeypatch.setattr(
+        Sonarr,
+        "missing_cache",
+        SonarrCache("missing", 1, ttl=timedelta(milliseconds=50)),
+    )
+    sonarr = Sonarr(SonarrConfig(url="http://sonarr:8989", apikey="key"))
+
+    with patch.object(Sonarr, "_single_series", return_value=None) as single:
+        for _ in range(3):
+            with pytest.raises(KeyError):
+                sonarr.get_series(99)
+        assert single.call_count == 1
+
+        time.sleep(0.1)
+        with pytest.raises(KeyError):
+            sonarr.get_series(99)
+        assert single.call_count == 2
+
+
+def _record(id, date, series_id, download_id=None):
+    record = {"id": id, "date": date, "seriesId": series_id}
+    if download_id:
+        record["downloadId"] = download_id
+    return record
+
+
+def test_download_history(monkeypatch):
+    history = DownloadHistory()
+    history.page_size = 2
+    history.refresh_interval = timedelta()
+    monkeypatch.setattr(Sonarr, "history", history)
+    sonarr = Sonarr(SonarrConfig(url="http://sonarr:8989", apikey="key"))
+
+    records = [
+        _record(1, "2024-01-01T10:00:00Z", 1, "aaa"),
+        _record(2, "2024-01-01T12:00:00Z", 2),
+        _record(3, "2024-01-01T12:00:00.5Z", 3, "bbb"),
+    ]
+    since = [
+        records[-1],
+        _record(4, "2024-01-01T12:00:00Z", 4),
+        _record(5, "2024-01-02T12:00:00Z", 5, "ccc"),
+    ]
+    dates = []
+
+    def get(endpoint, default_factory=list, **params):
+        if endpoint == "history":
+            start = (params["page"] - 1) * params["pageSize"]
+            return {
+                "records": records[start : start + params["pageSize"]],
+                "totalRecords": len(records),
+            }
+        assert endpoint == "history/since"
+        dates.append(params["date"])
+        return since
+
+    with (
+        patch.object(sonarr, "_get", side_effect=get) as _get,
+        patch.object(Sonarr, "_invalidate_episode_list") as invalidate,
+    ):
+        assert sonarr.already_downloaded("AAA")
+        assert sonarr.already_downloaded("bbb")
+        assert not sonarr.already_downloaded("ccc")
+        assert _get.call_count == 2
+        invalidate.assert_not_called()
+
+        sonarr.refresh_history()
+        assert sonarr.already_downloaded("ccc")
+        invalidate.assert_called_once_with(5)
+        assert history.since == "2024-01-02T12:00:00Z"
+
+        sonarr.refresh_history()
+        invalidate.assert_called_once_with(5)
+        assert dates == ["2024-01-01T12:00:00.5Z", "2024-01-02T12:00:00Z"]
@@ -0,0 +1,35 @@
+import hashlib
+
+import pyben
+
+from pickpockett.page import Validators
+from pickpockett.torrent import TorrentCache, TorrentMeta, info_hash
+from tests.test_magnet import torrent
+
+
+def test_info_hash():
+    expected = hashlib.sha1(pyben.dumps(pyben.loads(torrent)["info"]))
+    assert info_hash(torrent) == expected.hexdigest()
+
+
+def test_info_hash_keeps_original_encoding():
+    # keys out of order are hashed as they are, not re-encoded sorted
+    info = b"d4:name1:a6:lengthi1e12:piece lengthi1e6:pieces0:e"
+    expected = hashlib.sha1(info).hexdigest()
+    assert info_hash(b"d4:info" + info + b"e") == expected
+
+
+def test_torrent_meta():
+    meta = TorrentMeta.from_torrent(torrent, Validators(etag='"1"'))
+    assert meta.info_hash == info_hash(torrent)
+    assert len(meta.files) == 6
+    assert meta.size == sum(file.length for file in meta.files) == 4057240015
+    assert meta.validators == Validators(etag='"1"')
+
+
+def test_torrent_cache_without_path():
+    cache = TorrentCache()
+    meta = TorrentMeta.from_torrent(torrent, Validators())
+    cache.put("http://example.com/1.torrent", meta)
+    assert cache.get("http://example.com/1.torrent") == meta
+    assert cache.size(meta.info_hash) == meta.size